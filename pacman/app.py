@@ -0,0 +1,203 @@
+import os
+import random
+
+import pygame
+
+from .atlas import SpriteAtlas, loadGameAssets
+from .audio import Audio
+from .constants import DataPath, TextPath, frameRate, spriteRatio, square, tickRate
+from .engine import Game, Ghost, originalGameBoard
+from .ghostai import GhostAI
+from .instrument import Instrumentation, StartupTimer
+from .loop import FixedStepLoop
+from .mazes import findMaze
+from .renderer import Renderer
+from .replay import Recorder
+from .scores import ScoreStore
+
+# Nothing happens on import: main() brings pygame up one subsystem at a time,
+# timing each, so tools can import the package without opening a window
+
+PLAYING_KEYS = {
+    "up":[pygame.K_w, pygame.K_UP],
+    "down":[pygame.K_s, pygame.K_DOWN],
+    "right":[pygame.K_d, pygame.K_RIGHT],
+    "left":[pygame.K_a, pygame.K_LEFT],
+}
+DIRECTIONS = {"up": 0, "right": 1, "down": 2, "left": 3}
+
+def keyDirection(key):
+    for name, keys in PLAYING_KEYS.items():
+        if key in keys:
+            return DIRECTIONS[name]
+    return None
+
+def displayLaunchScreen(screen, atlas) -> None:
+    # Draw Pacman Title
+    pacmanTitle = [16, 0, 448, 12, 0, 13]
+    for i in range(len(pacmanTitle)):
+        letter = atlas.get(TextPath, pacmanTitle[i], square * 4)
+        screen.blit(letter, ((2 + 4 * i) * square, 2 * square, square, square))
+
+    #Draw Characters and their Nickname
+    characters = [
+        # Red Ghost
+        [
+            449, 15, 107, 15, 82, 68, 67,
+        ],
+        # Pink Ghost
+        [
+            450, 15, 171, 15, 144, 136, 141, 138,
+        ],
+        # Blue Ghost
+        [
+            452, 15, 235, 15, 194, 217, 192, 205,
+        ],
+        # Orange Ghost
+        [
+            451, 15, 299, 15, 270, 274, 256, 269, 262, 260,
+        ],
+    ]
+    for i in range(len(characters)):
+        row = characters[i]
+        total_width = 0
+        widths = []
+
+        # 預先計算每個圖像的寬度並計算總寬
+        for j in range(len(row)):
+            if j == 0:
+                w = int(square * spriteRatio)
+            else:
+                w = int(square)
+            widths.append(w)
+            total_width += w
+
+        # 計算置中的起始X座標
+        start_x = (screen.get_width() - total_width) // 2
+
+        x = start_x
+        for j in range(len(row)):
+            letter = atlas.get(TextPath, row[j], widths[j])
+
+            if j == 0:
+                y = (12 + 2 * i) * square - square // 3
+            else:
+                y = (12 + 2 * i) * square
+
+            screen.blit(letter, (x, y, square, square))
+            x += widths[j]
+
+    # Draw Pacman and Ghosts
+    event = [449, 15, 452, 15,  15, 448, 453, 15, 15, 15,  453]
+    for i in range(len(event)):
+        character = atlas.get(TextPath, event[i], square * 2)
+        screen.blit(character, ((4 + i * 2) * square, 24 * square, square, square))
+    # Draw PlatForm from Pacman and Ghosts
+    wall = [454, 454, 454, 454, 454, 454, 454, 454, 454, 454, 454, 454, 454, 454, 454]
+    for i in range(len(wall)):
+        platform = atlas.get(TextPath, wall[i], square * 2)
+        screen.blit(platform, ((i * 2) * square, 26 * square, square, square))
+    # Credit myself
+    credit = [15, 164, 160, 164, 15, 13, 14, 20, 15, 5, 14, 21, 13, 3, 15]
+    for i in range(len(credit)):
+        letter = atlas.get(TextPath, credit[i], square)
+        screen.blit(letter, ((6 + i) * square, 30 * square, square, square))
+    # Press Space to Play
+    instructions = [16, 18, 4, 19, 19, 15, 19, 16, 0, 2, 4, 15, 20, 14, 15, 16, 11, 0, 25]
+    for i in range(len(instructions)):
+        letter = atlas.get(TextPath, instructions[i], square)
+        screen.blit(letter, ((4.5 + i) * square, 35 * square - 10, square, square))
+
+    pygame.display.update()
+
+def main() -> None:
+    # PACMAN_TRACE=trace.json records a Chrome trace of the main loop, F3 shows frame times
+    instrument = Instrumentation(os.environ.get("PACMAN_TRACE"))
+    startup = StartupTimer(instrument)
+
+    with startup.phase("display"):
+        pygame.display.init()
+        (width, height) = (len(originalGameBoard[0]) * square, len(originalGameBoard) * square) # Game screen
+        screen = pygame.display.set_mode((width, height))
+        pygame.display.flip()
+    with startup.phase("assets"):
+        # Every sprite is decoded and scaled once here instead of on every draw, later runs copy them from a cache
+        instrument.wrap(SpriteAtlas, "preload", "image load")
+        instrument.wrap(SpriteAtlas, "loadCache", "image load")
+        atlas = loadGameAssets(keepOpen=True)
+    print(atlas.report())
+    with startup.phase("sound"):
+        try:
+            pygame.mixer.init()
+        except pygame.error as error: # No audio device, Audio falls back to silence
+            print("Sound disabled:", error)
+        audio = Audio(atlas.assets)
+    with startup.phase("game"):
+        # PACMAN_MAZE=name picks a maze from pacman/mazes, or any maze file by its path
+        layout = findMaze(os.environ.get("PACMAN_MAZE"))
+        # PACMAN_GHOSTS=classic plays against the arcade ghost strategies instead of the original ghosts
+        ai = GhostAI() if os.environ.get("PACMAN_GHOSTS") == "classic" else None
+        renderer = Renderer(screen, atlas, layout)
+        scores = ScoreStore(DataPath) # Saves in the background, the loop never waits on the disk
+        seed = random.randrange(1 << 32)
+        game = Game(1, 0, scores.highScore, rng=random.Random(seed), observers=[renderer, audio], layout=layout, ai=ai)
+        # Every key press is recorded so the game can be played back with python -m pacman.replay
+        recorder = Recorder(game, seed)
+    instrument.wrap(renderer, "clearBoard", "clearBoard")
+    instrument.wrap(renderer, "drawFrame", "drawFrame")
+    instrument.wrap(renderer, "updateDisplay", "display.update")
+    instrument.wrap(audio, "playMusic", "mixer")
+    instrument.wrap(audio, "forcePlayMusic", "mixer")
+    instrument.wrap(Ghost, "update", "ghost update")
+    instrument.wrap(Ghost, "setDir", "ghost pathing")
+    if ai is not None:
+        instrument.wrap(ai, "decide", "ghost pathing")
+    with startup.phase("launch screen"):
+        displayLaunchScreen(screen, atlas)
+        atlas.assets.close() # Sounds and every sprite are loaded by now
+    print(startup.report())
+
+    running = True
+    onLaunchScreen = True
+    clock = pygame.time.Clock()
+    # Logic runs at tickRate whatever the frame rate, frames draw actors in between ticks
+    loop = FixedStepLoop(tickRate)
+
+    while running:
+        clock.tick(frameRate)
+        instrument.beginFrame()
+        with instrument.phase("events"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_F3:
+                        instrument.toggleGraph(screen)
+                    elif event.key == pygame.K_m:
+                        audio.toggleMute()
+                    elif not onLaunchScreen:
+                        recorder.press(keyDirection(event.key))
+                    elif event.key == pygame.K_SPACE:
+                        onLaunchScreen = False
+                        renderer.render(game)
+                        audio.forcePlayMusic("pacman_beginning.wav")
+                        loop.reset()
+                    if event.key == pygame.K_q:
+                        running = False
+
+        if not onLaunchScreen:
+            with instrument.phase("game.update"):
+                loop.advance(recorder.update)
+            if not game.running:
+                running = False
+            renderer.drawFrame(game, loop.alpha())
+            stats = loop.report()
+            if stats is not None:
+                pygame.display.set_caption("Pacman | " + stats)
+        instrument.endFrame(screen)
+
+    if not onLaunchScreen:
+        scores.recordGame(game, seed) # Over, or quit part way through
+        recorder.save(DataPath + "LastGame.replay")
+    instrument.save()
+    scores.close()
@@ -0,0 +1,147 @@
+import hashlib
+import os
+import struct
+import time
+
+import pygame
+
+from .bundle import AssetDirectory, openAssets
+from .constants import BoardPath, DataPath, ElementPath, TextPath, spriteSize, square
+
+# The cache holds every preloaded sprite already scaled and converted, as the
+# raw pixels of the display format, so a later start only copies them into
+# surfaces instead of decoding PNGs
+CACHE_HEADER = struct.Struct("<4sBI") # Magic, version, sprites
+CACHE_SPRITE = struct.Struct("<BHHBB4sI") # Folder name length, tile id, size, has alpha, has colorkey, colorkey, pixel bytes; then the folder name and pixels
+CACHE_MAGIC = b"PACS"
+CACHE_VERSION = 1
+# Folders of sprites the game draws, with the sizes it draws them at
+GAME_SPRITES = [(BoardPath, [square]), (ElementPath, [spriteSize]), (TextPath, [square, square//2])]
+
+
+def tileName(tileId) -> str:
+    return "tile" + str(tileId).zfill(3) + ".png"
+
+# Opens the assets like the game and preloads its sprites; needs a display mode set.
+# The assets are closed once the sprites are loaded, unless keepOpen: the game still
+# reads its sounds and launch screen art through atlas.assets, and closes them after
+def loadGameAssets(keepOpen=False):
+    # Assets come from Assets.pack, built from Assets.tar.gz on the first run, or from extracted folders
+    assets = openAssets()
+    assets.extract(DataPath) # High score, caches and replays are written in there
+    atlas = SpriteAtlas(assets)
+    atlas.preloadAll(GAME_SPRITES)
+    if not keepOpen:
+        assets.close()
+    return atlas
+
+
+# Decodes, scales and converts every sprite once so the draw paths only blit
+class SpriteAtlas:
+    def __init__(self, assets=None) -> None:
+        self.assets = AssetDirectory() if assets is None else assets # Where images are read from, see bundle.py
+        # (folder, tile id, size) -> display-ready surface
+        self.sprites = {}
+        self.loadTime = 0.0
+        self.misses = 0
+        self.cached = False # Whether the sprites came from the cache file
+
+    # Loads every tile in path and keeps one converted copy per requested size
+    def preload(self, path, sizes) -> None:
+        start = time.perf_counter()
+        for fileName in self.assets.listdir(path):
+            if not fileName.startswith("tile") or not fileName.endswith(".png"):
+                continue
+            tileId = int(fileName[4:-4])
+            image = self.load(path + fileName)
+            for size in sizes:
+                self.sprites[(path, tileId, size)] = self.prepare(image, size)
+        self.loadTime += time.perf_counter() - start
+
+    # Preloads [(folder, sizes)], from the cache file in cacheDir when the images and the display format did not change since it was written
+    def preloadAll(self, folders, cacheDir=DataPath) -> None:
+        digest = hashlib.sha1(self.assets.fingerprint([path for path, _ in folders]).encode())
+        digest.update(repr(folders).encode())
+        digest.update(repr(pygame.display.get_surface().get_masks()).encode()) # Sprites are stored in the display's pixel format
+        fileName = os.path.join(cacheDir, "atlas-" + digest.hexdigest()[:16] + ".bin")
+        if self.loadCache(fileName):
+            return
+        for path, sizes in folders:
+            self.preload(path, sizes)
+        self.saveCache(fileName)
+
+    def loadCache(self, fileName) -> bool:
+        start = time.perf_counter()
+        try:
+            with open(fileName, "rb") as file:
+                data = file.read()
+        except OSError:
+            return False
+        if len(data) < CACHE_HEADER.size:
+            return False
+        magic, version, count = CACHE_HEADER.unpack_from(data)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            return False
+        sprites = {}
+        view = memoryview(data)
+        position = CACHE_HEADER.size
+        for _ in range(count):
+            length, tileId, size, alpha, keyed, colorkey, pixels = CACHE_SPRITE.unpack_from(data, position)
+            position += CACHE_SPRITE.size
+            path = data[position:position + length].decode()
+            position += length
+            image = pygame.Surface((size, size), pygame.SRCALPHA if alpha else 0)
+            image = image.convert_alpha() if alpha else image.convert()
+            if image.get_pitch() * size != pixels:
+                return False # Written for another display format
+            image.get_buffer().write(view[position:position + pixels].tobytes(), 0)
+            if keyed:
+                image.set_colorkey(tuple(colorkey), pygame.RLEACCEL)
+            sprites[(path, tileId, size)] = image
+            position += pixels
+        self.sprites.update(sprites)
+        self.cached = True
+        self.loadTime += time.perf_counter() - start
+        return True
+
+    def saveCache(self, fileName) -> None:
+        try:
+            with open(fileName, "wb") as file:
+                file.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(self.sprites)))
+                for (path, tileId, size), sprite in self.sprites.items():
+                    alpha = bool(sprite.get_flags() & pygame.SRCALPHA)
+                    colorkey = sprite.get_colorkey()
+                    pixels = sprite.get_buffer().raw
+                    file.write(CACHE_SPRITE.pack(len(path), tileId, size, alpha, colorkey is not None, bytes(colorkey) if colorkey else bytes(4), len(pixels)))
+                    file.write(path.encode())
+                    file.write(pixels)
+        except OSError:
+            pass # Without a writable cache the images are simply decoded again next run
+
+    def load(self, name):
+        with self.assets.open(name) as file:
+            return pygame.image.load(file, name)
+
+    def prepare(self, image, size):
+        image = pygame.transform.scale(image, (size, size))
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+
+    def get(self, path, tileId, size):
+        key = (path, tileId, size)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            # Sizes that were not preloaded (launch screen art) are scaled once on first use
+            start = time.perf_counter()
+            sprite = self.prepare(self.load(path + tileName(tileId)), size)
+            self.sprites[key] = sprite
+            self.misses += 1
+            self.loadTime += time.perf_counter() - start
+        return sprite
+
+    def memoryUsage(self) -> int:
+        return sum(sprite.get_pitch() * sprite.get_height() for sprite in self.sprites.values())
+
+    def report(self) -> str:
+        return "Sprite atlas: {} sprites{}, {:.1f} ms, {:.2f} MiB".format(len(self.sprites), " from cache" if self.cached else "", self.loadTime * 1000, self.memoryUsage() / (1024 * 1024))
@@ -0,0 +1,133 @@
+import io
+
+import pygame
+
+from .bundle import AssetDirectory
+from .constants import MusicPath
+from .engine import Observer
+
+# Effects are decoded once and played on their own mixer channels, a sound only
+# cuts off one of lower or equal priority; pygame.mixer.music is left to
+# background loops such as the siren.
+
+CHANNELS = ["chomp", "effects", "events"]
+# File -> (channel, priority); events silence every other channel, like the start jingle or a death
+SOUNDS = {
+    "munch_1.wav": ("chomp", 0),
+    "power_pellet.wav": ("effects", 1),
+    "eat_fruit.wav": ("effects", 1),
+    "eat_ghost.wav": ("effects", 2),
+    "pacman_extrapac.wav": ("effects", 2),
+    "pacman_beginning.wav": ("events", 3),
+    "intermission.wav": ("events", 3),
+    "pacman_death.wav": ("events", 3),
+    "death_1.wav": ("events", 3),
+}
+# Loops under the effects while a level is being played
+SIREN = "siren_1.wav"
+FRIGHTENED = "retreating.wav" # While the ghosts run from pacman
+
+
+class SoundBank:
+    def __init__(self, assets=None) -> None:
+        self.assets = AssetDirectory() if assets is None else assets
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), len(CHANNELS)))
+        pygame.mixer.set_reserved(len(CHANNELS))
+        self.channels = {name: pygame.mixer.Channel(i) for i, name in enumerate(CHANNELS)}
+        self.playing = {name: -1 for name in CHANNELS} # Priority of the last sound started on each channel
+        self.sounds = {}
+        for music in SOUNDS:
+            with self.assets.open(MusicPath + music) as file:
+                self.sounds[music] = pygame.mixer.Sound(file)
+        self.loops = {} # Background music, read up front so the assets can be closed
+        for music in (SIREN, FRIGHTENED):
+            with self.assets.open(MusicPath + music) as file:
+                self.loops[music] = file.read()
+
+    # Plays a sound unless a more important one is still playing; without interrupt only an idle channel is used
+    def play(self, music, interrupt, loops=0) -> None:
+        name, priority = SOUNDS[music]
+        channel = self.channels[name]
+        if channel.get_busy() and (not interrupt or self.playing[name] > priority):
+            return
+        if name == "events":
+            for other in self.channels.values():
+                other.stop()
+        channel.play(self.sounds[music], loops)
+        self.playing[name] = priority
+
+    def playBackground(self, music) -> None:
+        pygame.mixer.music.load(io.BytesIO(self.loops[music]), music) # The mixer keeps reading the file while it plays
+        pygame.mixer.music.play(-1)
+
+    def stopBackground(self) -> None:
+        pygame.mixer.music.stop()
+
+    def setVolume(self, volume) -> None:
+        for channel in self.channels.values():
+            channel.set_volume(volume)
+        pygame.mixer.music.set_volume(volume)
+
+
+# Used when there is no audio device, or to run the game silently
+class NullSoundBank:
+    def play(self, music, interrupt, loops=0) -> None:
+        pass
+
+    def playBackground(self, music) -> None:
+        pass
+
+    def stopBackground(self) -> None:
+        pass
+
+    def setVolume(self, volume) -> None:
+        pass
+
+
+# Plays the game's sound effects
+class Audio(Observer):
+    def __init__(self, assets=None, bank=None) -> None:
+        if bank is None:
+            bank = SoundBank(assets) if pygame.mixer.get_init() else NullSoundBank()
+        self.bank = bank
+        self.muted = False
+        self.background = None # Loop playing, None when it is silent
+
+    def onRender(self, game) -> None: # After a death or a cleared board, silent until the next key
+        self.setBackground(None)
+
+    def onTickEnd(self, game) -> None:
+        if game.state == "intermission":
+            self.setBackground(None)
+        elif game.state != "dying":
+            self.setBackground(FRIGHTENED if game.ghostsAttacked else SIREN)
+
+    def onDeath(self, game) -> None:
+        self.setBackground(None)
+
+    def onPlayMusic(self, game, music) -> None:
+        self.playMusic(music)
+
+    def onForcePlayMusic(self, game, music) -> None:
+        self.forcePlayMusic(music)
+
+    # Waits for the channel to be free, a chomp is played twice like the two halves of a bite
+    def playMusic(self, music) -> None:
+        self.bank.play(music, False, 1 if music == "munch_1.wav" else 0)
+
+    def forcePlayMusic(self, music) -> None:
+        self.bank.play(music, True)
+
+    # Only touches the mixer when the loop changes
+    def setBackground(self, music) -> None:
+        if music == self.background:
+            return
+        self.background = music
+        if music is None:
+            self.bank.stopBackground()
+        else:
+            self.bank.playBackground(music)
+
+    def toggleMute(self) -> None:
+        self.muted = not self.muted
+        self.bank.setVolume(0.0 if self.muted else 1.0)
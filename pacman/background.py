@@ -0,0 +1,70 @@
+import pygame
+
+
+# Off-screen copy of the board: a static wall layer, a pellet layer and the
+# two composited together so that erasing sprites is a single rect copy
+class MazeBackground:
+    def __init__(self, atlas, boardPath, layout, square, pelletColor) -> None:
+        self.layout = layout
+        self.square = square
+        self.pelletColor = pelletColor
+        self.rows = layout.rows
+        self.cols = layout.cols
+        size = (self.cols * square, self.rows * square)
+        # Only rows 3 to rows - 3 belong to the maze, the rest is score and lives area
+        self.area = pygame.Rect(0, 3 * square, size[0], (self.rows - 5) * square)
+
+        self.maze = pygame.Surface(size).convert()
+        self.maze.fill((0, 0, 0))
+        for cell, sprite in enumerate(layout.wallSprites):
+            if sprite != -1:
+                row, col = divmod(cell, self.cols)
+                self.maze.blit(atlas.get(boardPath, sprite, square), (col * square, row * square))
+
+        self.pellets = pygame.Surface(size).convert()
+        self.pellets.set_colorkey((0, 0, 0))
+        self.surface = self.maze.copy()
+
+    # Redraws every pellet, used when a new board is loaded
+    def rebuild(self, board) -> None:
+        self.pellets.fill((0, 0, 0))
+        for i in range(3, self.rows - 2):
+            for j in range(self.cols):
+                self.drawPellet(i, j, board[i][j])
+        self.surface.blit(self.maze, (0, 0))
+        self.surface.blit(self.pellets, (0, 0))
+
+    def drawPellet(self, row, col, tile) -> None:
+        square = self.square
+        center = (col * square + square//2, row * square + square//2)
+        if tile == 2: # Tic-Tak
+            pygame.draw.circle(self.pellets, self.pelletColor, center, square//4)
+        elif tile == 6: # White Special Tic-Tak, the black one is simply left empty
+            pygame.draw.circle(self.pellets, self.pelletColor, center, square//2)
+
+    def cellRect(self, row, col):
+        return pygame.Rect(col * self.square, row * self.square, self.square, self.square)
+
+    # Re-composites a single cell after its pellet changed
+    def setCell(self, row, col, tile):
+        rect = self.cellRect(row, col)
+        self.pellets.fill((0, 0, 0), rect)
+        self.drawPellet(row, col, tile)
+        self.surface.blit(self.maze, rect, rect)
+        self.surface.blit(self.pellets, rect, rect)
+        return rect
+
+    # Copies the cached board back over a rectangle of the screen
+    def restore(self, screen, rect):
+        rect = pygame.Rect(rect).clip(self.area)
+        if rect.width == 0 or rect.height == 0:
+            return None
+        screen.blit(self.surface, rect, rect)
+        return rect
+
+    def restoreTiles(self, screen, row, col, radius):
+        square = self.square
+        return self.restore(screen, ((col - radius) * square, (row - radius) * square, (2 * radius + 1) * square, (2 * radius + 1) * square))
+
+    def draw(self, screen):
+        return screen.blit(self.surface, self.area, self.area)
@@ -0,0 +1,664 @@
+import argparse
+import itertools
+import random
+import time
+
+import numpy as np
+
+from . import mazes, navigation
+from .engine import Game, boardCols, boardWidth, deathFrameTicks, deathTicks, ghostEatenTicks, intermissionTicks, maxStep, subTiles
+from .mazes import findMaze
+
+# Steps many independent games at once. Positions are whole eighths of a tile
+# as in engine.Game, so every rule is exact integer arithmetic, and what never
+# changes (walls, gates, exits, paths) is looked up by board cell in tables
+# shared by all games. Games that do not play this tick are masked out rather
+# than gathered. What does not depend on the order of the ghosts (their modes,
+# chase targets and the contact tests with pacman) is done for every ghost of
+# every game in one go; each ghost still steers in a pass of its own, because
+# it sees the ghosts that already moved this tick and, in engine.Game, draws
+# its random numbers between theirs. Start positions, gates and the number of
+# levels come from the maze, the same one engine.Game would be given.
+
+COLS = boardCols
+WIDE = COLS + 2 # Rows of the cell tables, with the tunnel's far column copied on either side
+SHIFT = subTiles.bit_length() - 1 # Position >> SHIFT is the tile
+FRACTION = subTiles - 1 # Position & FRACTION is the part of a tile
+LEVELS = [[350, 250], [150, 450], [150, 450], [0, 600]]
+PLAYING, GHOST_EATEN, DYING, INTERMISSION = range(4) # engine.Game.state
+PACMAN_SPEED = 2 # engine.Pacman.speed, in eighths of a tile
+DIR_Y = np.array([-1, 0, 1, 0, 0], dtype=np.int32) # 0: North, 1: East, 2: South, 3: West, and -1 stays put
+DIR_X = np.array([0, 1, 0, -1, 0], dtype=np.int32)
+DIRS = np.arange(4, dtype=np.int32)[:, None] # One row per direction
+ROUND_Y = np.array([0, 0, FRACTION, 0], dtype=np.int32)[:, None] # The cell entered is rounded up going south or east
+ROUND_X = np.array([0, FRACTION, 0, 0], dtype=np.int32)[:, None]
+PERMUTATIONS = np.array(list(itertools.permutations(range(4))))
+RANKS = np.argsort(PERMUTATIONS, axis=1).T.astype(np.int32) # Place of each direction in each permutation
+PASSABLE, GATE = 1, 2 # Flags of BatchGame.cellInfo, below the navigation tile
+NOWHERE = np.int32(1 << 30) # Added to the sort key of a direction a ghost cannot take
+
+
+# Random numbers from one numpy generator, fast but unrelated to engine.Game
+class NumpyRandom:
+    def __init__(self, seed) -> None:
+        self.generator = np.random.default_rng(seed)
+
+    def randrange(self, stop, games):
+        return self.generator.integers(0, stop, size=len(games))
+
+    # One shuffled [0, 1, 2, 3] per game
+    def permutation(self, games):
+        return PERMUTATIONS[self.generator.integers(0, len(PERMUTATIONS), size=len(games))]
+
+    # Place of each direction in a shuffled [0, 1, 2, 3], one column per game of the mask active
+    def ranks(self, active):
+        return RANKS.take(self.generator.integers(0, len(PERMUTATIONS), size=len(active), dtype=np.uint8), axis=1)
+
+
+# One random.Random per game, consumed in exactly the order engine.Game does
+class PythonRandom:
+    def __init__(self, seeds) -> None:
+        self.rngs = [random.Random(seed) for seed in seeds]
+
+    def randrange(self, stop, games):
+        stop = np.broadcast_to(stop, (len(games),))
+        return np.array([self.rngs[game].randrange(int(end)) for game, end in zip(games, stop)], dtype=np.int64)
+
+    def permutation(self, games):
+        orders = np.empty((len(games), 4), dtype=np.int64)
+        for index, game in enumerate(games):
+            order = [0, 1, 2, 3]
+            self.rngs[game].shuffle(order)
+            orders[index] = order
+        return orders
+
+    # Only the games of the mask active shuffle, like engine.Ghost.setDir
+    def ranks(self, active):
+        ranks = np.zeros((4, len(active)), dtype=np.int32)
+        for game in np.flatnonzero(active):
+            order = [0, 1, 2, 3]
+            self.rngs[game].shuffle(order)
+            ranks[order, game] = (0, 1, 2, 3)
+        return ranks
+
+
+# mazes.targetQuadrant of positions in eighths
+def quadrant(y, x):
+    top = y <= mazes.QUADRANT_ROW * subTiles
+    right = x >= mazes.QUADRANT_COL * subTiles
+    return np.where(top, np.where(right, 0, 1), np.where(right, 3, 2))
+
+# collision.sweptContact for arrays of moves, in eighths of a tile. Actors are on the board,
+# so x differs by less than boardWidth between any two of them
+def sweptContact(ay0, ax0, ay1, ax1, by0, bx0, by1, bx1):
+    # A move through the tunnel wraps around, it is measured the short way
+    half = boardWidth // 2
+    aMove = ax1 - ax0
+    aMove += boardWidth * (aMove < -half) - boardWidth * (aMove > half)
+    bMove = bx1 - bx0
+    bMove += boardWidth * (bMove < -half) - boardWidth * (bMove > half)
+    rowOffset = by0 - ay0
+    colOffset = bx0 - ax0
+    colOffset += boardWidth * (colOffset <= half - boardWidth) - boardWidth * (colOffset > half)
+    rowChange = (by1 - by0) - (ay1 - ay0)
+    colChange = bMove - aMove
+    reach = subTiles // 2
+    return inLine(colOffset, colChange, rowOffset, rowChange, reach) | inLine(rowOffset, rowChange, colOffset, colChange, reach)
+
+# collision.inLine for arrays. Turning a move the other way round changes the signs of a
+# and da together, so the test is written for either sign of da
+def inLine(a, da, b, db, reach):
+    spread = np.abs(da)
+    still = (da == 0) & (a == 0) & ((b <= reach) | (b + db <= reach)) & ((b >= -reach) | (b + db >= -reach))
+    crossing = (da != 0) & (a * da <= 0) & (np.abs(a) <= spread) & (np.abs(b * da - db * a) <= reach * spread)
+    return still | crossing
+
+# Cell of the tables of BatchGame holding a position
+def wideCell(y, x):
+    return (y >> SHIFT) * WIDE + (x >> SHIFT) + 1
+
+# engine.Pacman.canGo for arrays of directions, given the exits of the cell pacman is on
+def canGo(direction, exits, betweenRows, betweenCols):
+    free = ((exits >> direction) & 1) != 0
+    northSouth = (direction & 1) == 0
+    return (northSouth & ~betweenCols & (betweenRows | free)) | (~northSouth & ~betweenRows & (betweenCols | free))
+
+
+class BatchGame:
+    def __init__(self, count, seed=0, rng=None, layout=None) -> None:
+        self.count = count
+        self.rng = NumpyRandom(seed) if rng is None else rng
+        self.layout = mazes.loadMaze() if layout is None else layout
+        self.ghostCount = len(self.layout.ghostStarts)
+        self.rows = self.layout.rows
+        self.originalBoard = np.frombuffer(self.layout.cells, dtype=np.uint8).astype(np.int8)
+        self.boardSize = self.originalBoard.size
+        self.board = np.tile(self.originalBoard, count) # The cells of every game, one after the other
+        self.boardBase = np.arange(count) * self.boardSize # Where each game's cells start
+        self.total = len(self.layout.pellets)
+        self.powerCells = np.array(self.layout.pellets.powerPellets, dtype=np.int64)
+        # What never changes is looked up by cell of a board one column wider on either side,
+        # where the tunnel leads, so a ghost about to wrap around looks up the tile it wraps to
+        graph = navigation.graphFor(self.layout.board, self.layout.gates)
+        flags = np.frombuffer(bytes(graph.flags), dtype=np.uint8).reshape(self.rows, COLS).astype(np.int32)
+        flags = np.concatenate([flags[:, -1:], flags, flags[:, :1]], axis=1)
+        self.exits = (flags & 15).reshape(-1)
+        self.houseCells = np.pad(self.originalBoard.reshape(self.rows, COLS) == 4, ((0, 0), (1, 1))).reshape(-1)
+        table = self.layout.navigation
+        tiles = np.array(table.index, dtype=np.int32).reshape(self.rows, COLS)
+        tiles = np.concatenate([tiles[:, -1:], tiles, tiles[:, :1]], axis=1)
+        # The navigation tile, and whether a ghost may enter: open, a gate, or past the edge where it always may
+        info = ((flags & navigation.OPEN) != 0) * PASSABLE + ((flags & navigation.GATE) != 0) * GATE
+        info[:, [0, -1]] = PASSABLE
+        self.cellInfo = ((tiles << 2) | info).reshape(-1)
+        self.tileCount = len(table.tiles)
+        # By tile * tileCount + target tile, and a row of unreachable ones for tile -1, which indexes from the end
+        unreachable = np.full(self.tileCount, 65535, dtype=np.uint16)
+        self.pathDistances = np.concatenate([np.frombuffer(table.distances, dtype=np.uint16), unreachable])
+        # Random targets, laid out like mazes.TargetIndex: the cells of each quadrant, walkable ones first
+        targets = self.layout.targets
+        self.targetCells = np.concatenate([np.array(cells, dtype=np.int64) for cells in targets.quadrants])
+        self.quadrantSize = np.array([len(cells) for cells in targets.quadrants])
+        self.quadrantStart = np.cumsum(self.quadrantSize) - self.quadrantSize
+        self.walkableSize = np.array(targets.walkable)
+        self.berryY, self.berryX = (round(value * subTiles) for value in self.layout.berryLocation)
+
+        self.running = np.ones(count, dtype=bool)
+        self.paused = np.ones(count, dtype=bool)
+        self.started = np.zeros(count, dtype=bool)
+        self.gameOver = np.zeros(count, dtype=bool)
+        self.state = np.zeros(count, dtype=np.int64)
+        self.stateTimer = np.zeros(count, dtype=np.int64)
+        self.dyingFrame = np.zeros(count, dtype=np.int64)
+        self.score = np.zeros(count, dtype=np.int64)
+        self.highScore = np.zeros(count, dtype=np.int64)
+        self.level = np.ones(count, dtype=np.int64)
+        self.lives = np.full(count, 4, dtype=np.int64)
+        self.collected = np.zeros(count, dtype=np.int64)
+        self.levelTimer = np.zeros(count, dtype=np.int64)
+        self.tictakChangeCount = np.zeros(count, dtype=np.int64)
+        self.ghostScore = np.full(count, 200, dtype=np.int64)
+        self.extraLifeGiven = np.zeros(count, dtype=bool)
+        self.lockedIn = np.ones(count, dtype=bool)
+        self.berryEaten = np.zeros(count, dtype=bool)
+        self.berriesCollected = np.zeros(count, dtype=np.int64)
+        self.ghostsEaten = np.zeros(count, dtype=np.int64)
+
+        self.pacY = np.zeros(count, dtype=np.int32) # In eighths of a tile
+        self.pacX = np.zeros(count, dtype=np.int32)
+        self.pacLastY = np.zeros(count, dtype=np.int32) # Where the last update started
+        self.pacLastX = np.zeros(count, dtype=np.int32)
+        self.pacDir = np.zeros(count, dtype=np.int32)
+        self.pacNewDir = np.zeros(count, dtype=np.int32)
+
+        shape = (self.ghostCount, count) # Ghost arrays are indexed [ghost][games]
+        self.ghostY = np.zeros(shape, dtype=np.int32)
+        self.ghostX = np.zeros(shape, dtype=np.int32)
+        self.ghostDir = np.zeros(shape, dtype=np.int32)
+        self.ghostSpeed = np.zeros(shape, dtype=np.int32)
+        self.targetY = np.zeros(shape, dtype=np.int32)
+        self.targetX = np.zeros(shape, dtype=np.int32)
+        self.lastY = np.zeros(shape, dtype=np.int32)
+        self.lastX = np.zeros(shape, dtype=np.int32)
+        self.ghostCell = np.zeros(shape, dtype=np.int32) # engine.Game.occupancy: the cell a ghost stands exactly on, or -1
+        self.attacked = np.zeros(shape, dtype=bool)
+        self.dead = np.zeros(shape, dtype=bool)
+        self.attackedCount = np.zeros(shape, dtype=np.int64)
+        self.deathCount = np.zeros(shape, dtype=np.int64)
+
+        everyGame = np.arange(count)
+        self.createActors(everyGame)
+        self.levels = np.repeat(np.array(LEVELS, dtype=np.int64)[:, :, None], count, axis=2) # [ghost][state][games]
+        self.shuffleLevels(everyGame)
+        self.scatter = np.zeros((4, count), dtype=bool) # engine.Game.ghostStates, state 1 or 0
+        self.stateTicks = np.zeros((4, count), dtype=np.int64) # and the ticks spent in it
+        self.randomizeGhostStates(everyGame)
+
+    # Presses a key in every running game: starts paused games and queues directions (-1: none)
+    def step(self, actions=None) -> None:
+        live = self.running
+        waiting = live & ~self.started
+        self.paused[waiting] = False
+        self.started[waiting] = True
+        if actions is not None:
+            actions = np.asarray(actions)
+            steer = live & (actions >= 0)
+            self.pacNewDir[steer] = actions[steer]
+        self.update(live)
+
+    # Ticks the games of the mask live
+    def update(self, live) -> None:
+        playing = self.state == PLAYING
+        held = np.flatnonzero(live & ~playing)
+        if len(held):
+            self.updateState(held)
+        active = live & playing & ~self.paused & self.started
+        if not active.any():
+            return
+        self.levelTimer += active
+        self.tictakChangeCount += active
+
+        bonus = active & (self.score >= 10000) & ~self.extraLifeGiven
+        self.lives += bonus
+        self.extraLifeGiven |= bonus
+
+        # Check if the ghost should case pacman
+        self.stateTicks += active
+        chaseTicks, scatterTicks = self.levels[:, 0], self.levels[:, 1]
+        switch = active & (self.stateTicks >= chaseTicks + self.scatter * (scatterTicks - chaseTicks))
+        self.stateTicks *= ~switch
+        self.scatter ^= switch
+
+        chase = active & ~self.attacked & ~self.dead & ~self.scatter[:self.ghostCount]
+        self.targetY += chase * (self.pacY - self.targetY)
+        self.targetX += chase * (self.pacX - self.targetX)
+
+        self.lockedIn &= ~(active & (self.levelTimer == 100))
+
+        for ghost in range(self.ghostCount):
+            self.updateGhost(active, ghost)
+
+        flip = np.flatnonzero(active & (self.tictakChangeCount == 10))
+        if len(flip):
+            cells = self.boardBase[flip, None] + self.powerCells
+            tiles = self.board[cells]
+            self.board[cells] = np.where(tiles == 5, 6, np.where(tiles == 6, 5, tiles))
+            self.tictakChangeCount[flip] = 0
+
+        self.updatePacman(active)
+        self.eat(active)
+        self.checkSurroundings(active)
+        np.maximum(self.score, self.highScore, out=self.highScore)
+
+        cleared = np.flatnonzero(active & (self.collected == self.total) & (self.state == PLAYING))
+        self.setState(cleared, INTERMISSION, intermissionTicks)
+
+    def setState(self, games, state, ticks) -> None:
+        self.state[games] = state
+        self.stateTimer[games] = ticks
+
+    def updateState(self, games) -> None:
+        self.stateTimer[games] -= 1
+        games = games[self.stateTimer[games] == 0]
+        animating = (self.state[games] == DYING) & (self.dyingFrame[games] < 12)
+        self.dyingFrame[games[animating]] += 1
+        self.stateTimer[games[animating]] = deathFrameTicks
+
+        games = games[~animating]
+        states = self.state[games]
+        self.state[games] = PLAYING
+        died = games[states == DYING]
+        self.running[died[self.gameOver[died]]] = False
+        lost = died[~self.gameOver[died]]
+        self.started[lost] = False
+        self.reset(lost)
+        cleared = games[states == INTERMISSION]
+        self.level[cleared] += 1
+        self.newLevel(cleared)
+        self.running[cleared[self.level[cleared] > self.layout.lastLevel]] = False
+
+    def createActors(self, games) -> None:
+        for ghost, (row, col, _, _) in enumerate(self.layout.ghostStarts):
+            self.ghostY[ghost, games] = round(row * subTiles)
+            self.ghostX[ghost, games] = round(col * subTiles)
+            self.ghostDir[ghost, games] = self.rng.randrange(4, games)
+        self.ghostSpeed[:, games] = 2
+        self.targetY[:, games] = -subTiles # Aimed at (-1, -1)
+        self.targetX[:, games] = -subTiles
+        self.lastY[:, games] = -subTiles
+        self.lastX[:, games] = -subTiles
+        self.ghostCell[:, games] = -1
+        self.attacked[:, games] = False
+        self.dead[:, games] = False
+        self.attackedCount[:, games] = 0
+        self.deathCount[:, games] = 0
+        row, col = self.layout.pacmanStart
+        self.pacY[games] = self.pacLastY[games] = round(row * subTiles)
+        self.pacX[games] = self.pacLastX[games] = round(col * subTiles)
+        self.pacDir[games] = 0
+        self.pacNewDir[games] = 0
+
+    def shuffleLevels(self, games) -> None:
+        order = self.rng.permutation(games)
+        self.levels[:, :, games] = np.take_along_axis(self.levels[:, :, games], order.T[:, None, :], axis=0)
+
+    def randomizeGhostStates(self, games) -> None:
+        for ghost in range(4):
+            state = self.rng.randrange(2, games)
+            self.scatter[ghost, games] = state == 1
+            self.stateTicks[ghost, games] = self.rng.randrange(self.levels[ghost, state, games] + 1, games)
+
+    # Reset after death
+    def reset(self, games) -> None:
+        self.createActors(games)
+        for ghost in range(self.ghostCount):
+            self.setTarget(games, ghost)
+        self.lives[games] -= 1
+        self.paused[games] = True
+
+    def newLevel(self, games) -> None:
+        if len(games) == 0:
+            return
+        self.reset(games)
+        self.lives[games] += 1
+        self.collected[games] = 0
+        self.started[games] = False
+        self.berryEaten[games] = False
+        self.levelTimer[games] = 0
+        self.lockedIn[games] = True
+        chase = self.levels[:, 0, games]
+        scatter = self.levels[:, 1, games]
+        self.levels[:, 0, games] = np.minimum((chase + scatter) - 100, chase + 50)
+        self.levels[:, 1, games] = np.maximum(100, scatter - 50)
+        self.shuffleLevels(games)
+        self.randomizeGhostStates(games)
+        self.board.reshape(self.count, -1)[games] = self.originalBoard
+
+    # One ghost of every game of the mask active
+    def updateGhost(self, active, ghost) -> None:
+        y = self.ghostY[ghost]
+        x = self.ghostX[ghost]
+        dead = self.dead[ghost]
+        targetY = self.targetY[ghost]
+        targetX = self.targetX[ghost]
+        retarget = ((targetY == -subTiles) & (targetX == -subTiles)) | ((y == targetY) & (x == targetX)) | dead
+        retarget |= self.houseCells[wideCell(y, x)]
+        self.setTarget(np.flatnonzero(active & retarget), ghost)
+        self.setDir(active, ghost)
+        self.move(active, ghost)
+
+        attacked = active & self.attacked[ghost]
+        if attacked.any():
+            self.attackedCount[ghost] += attacked
+            self.ghostSpeed[ghost][attacked & ~dead] = 1
+            expired = np.flatnonzero(attacked & (self.attackedCount[ghost] == 240))
+            if len(expired):
+                alive = expired[~dead[expired]]
+                self.ghostSpeed[ghost, alive] = 2
+                self.snap(alive, ghost)
+                self.attackedCount[ghost, expired] = 0
+                self.attacked[ghost, expired] = False
+                self.setTarget(expired, ghost)
+
+        home = active & dead
+        if home.any():
+            home &= self.houseCells[wideCell(y, x)]
+            self.deathCount[ghost] += home
+            self.attacked[ghost][home] = False
+            revived = home & (self.deathCount[ghost] == 120)
+            self.deathCount[ghost][revived] = 0
+            dead[revived] = False
+            self.ghostSpeed[ghost][revived] = 2
+
+    def setTarget(self, games, ghost) -> None:
+        if len(games) == 0:
+            return
+        y = self.ghostY[ghost, games]
+        x = self.ghostX[ghost, games]
+        dead = self.dead[ghost, games]
+        home = self.houseCells[wideCell(y, x)]
+        gateRow, gateCol = self.layout.gates[0]
+        leaving = games[home & ~dead] # Head for the ghost gate
+        self.targetY[ghost, leaving] = (gateRow - 1) * subTiles
+        self.targetX[ghost, leaving] = (gateCol + 1) * subTiles
+        returning = games[~home & dead] # In front of the gate
+        self.targetY[ghost, returning] = (gateRow - 1) * subTiles
+        self.targetX[ghost, returning] = gateCol * subTiles
+        resting = home & dead
+        self.targetY[ghost, games[resting]] = y[resting]
+        self.targetX[ghost, games[resting]] = x[resting]
+
+        # Finds a target that will keep the ghosts dispersed, one random number per game like mazes.TargetIndex.pick
+        pending = games[home == dead]
+        if len(pending) == 0:
+            return
+        quads = quadrant(self.targetY[:, pending], self.targetX[:, pending])
+        quads = (quads[:, :, None] == np.arange(4)).sum(axis=0)
+        sizes = np.where(quads == 0, self.quadrantSize, self.walkableSize)
+        ends = np.cumsum(sizes, axis=1)
+        index = self.rng.randrange(ends[:, -1], pending)
+        quad = (index[:, None] >= ends).sum(axis=1)
+        cell = self.targetCells[self.quadrantStart[quad] + index - (ends - sizes)[np.arange(len(pending)), quad]]
+        self.targetY[ghost, pending] = cell // COLS * subTiles
+        self.targetX[ghost, pending] = cell % COLS * subTiles
+
+    # engine.Ghost.setDir for one ghost of every game, the four directions side by side.
+    # Every direction gets a sort key of its distance, then its place in the shuffled
+    # order, then itself, so the smallest key is the direction the engine's loop settles on
+    def setDir(self, active, ghost) -> None:
+        y = self.ghostY[ghost]
+        x = self.ghostX[ghost]
+        speed = self.ghostSpeed[ghost]
+        dead = self.dead[ghost]
+        # Arrays this size are worked on in place where they can be, fresh ones cost more than the arithmetic
+        nextY = DIR_Y[:4, None] * speed
+        nextY += y
+        nextX = DIR_X[:4, None] * speed
+        nextX += x
+        # Cell the ghost would enter
+        cell = nextY + ROUND_Y
+        cell >>= SHIFT
+        cell *= WIDE
+        cellCol = nextX + ROUND_X
+        cellCol >>= SHIFT
+        cell += cellCol
+        cell += 1
+        info = self.cellInfo[cell]
+
+        # North and south need the ghost lined up with a column, east and west with a row, and no going back
+        allowed = np.empty(cell.shape, dtype=bool)
+        allowed[0::2] = (x & FRACTION) == 0
+        allowed[1::2] = (y & FRACTION) == 0
+        allowed &= (nextY != self.lastY[ghost]) | (nextX != self.lastX[ghost])
+
+        # engine.Ghost.isValid, which does not depend on the shuffled order
+        blocked = np.zeros(cell.shape, dtype=bool)
+        for other in range(self.ghostCount):
+            if other != ghost:
+                blocked |= cell == self.ghostCell[other]
+        passable = (info & PASSABLE) != 0
+        gate = (info & GATE) != 0
+        if gate.any():
+            gates = np.nonzero(gate)
+            games = gates[1]
+            gateY = cell[gates] // WIDE << SHIFT
+            ghostY = y[games]
+            ghostDead = dead[games]
+            passable[gates] = (ghostDead & (ghostY < gateY)) | ((ghostY > gateY) & ~ghostDead & ~self.attacked[ghost, games] & ~self.lockedIn[games])
+        allowed &= passable & (dead | ~blocked)
+
+        # Same rule as engine.Ghost.setDir: shortest path to walkable targets, straight line otherwise
+        targetY = self.targetY[ghost]
+        targetX = self.targetX[ghost]
+        inside = (targetY >= 0) & (targetY < self.rows << SHIFT)
+        targetTile = np.where(inside, self.cellInfo[wideCell(targetY * inside, targetX)] >> 2, -1)
+        followPath = targetTile >= 0
+        info >>= 2
+        info *= self.tileCount
+        info += targetTile
+        path = self.pathDistances[info] # Unreachable from a wall, unused towards one
+        allowed &= ~followPath | (path < 10000)
+        distance = np.subtract(targetY, nextY, out=nextY)
+        distance *= distance
+        nextX = np.subtract(targetX, nextX, out=nextX)
+        nextX *= nextX
+        distance += nextX # Squared eighths sort like the engine's distance in tiles
+        np.copyto(distance, path, where=followPath)
+
+        distance <<= 4
+        ranks = self.rng.ranks(active)
+        ranks <<= 2
+        distance += ranks
+        distance += DIRS
+        distance += ~allowed * NOWHERE
+        best = distance.min(axis=0)
+        direction = best & 3
+        direction[best >= NOWHERE] = -1
+        np.copyto(self.ghostDir[ghost], direction, where=active)
+
+    def move(self, active, ghost) -> None:
+        y = self.ghostY[ghost]
+        x = self.ghostX[ghost]
+        np.copyto(self.lastY[ghost], y, where=active)
+        np.copyto(self.lastX[ghost], x, where=active)
+        direction = self.ghostDir[ghost]
+        step = self.ghostSpeed[ghost] * active
+        y += DIR_Y[direction] * step
+        x += DIR_X[direction] * step
+        # Incase they go through the middle tunnel
+        x += boardWidth * (x < 0) - boardWidth * (x >= boardWidth)
+        onTile = ((y | x) & FRACTION) == 0
+        np.copyto(self.ghostCell[ghost], onTile * (wideCell(y, x) + 1) - 1, where=active)
+
+    # Puts ghosts of the games back on the whole tile they are on
+    def snap(self, games, ghost) -> None:
+        y = self.ghostY[ghost, games] & ~FRACTION
+        x = self.ghostX[ghost, games] & ~FRACTION
+        self.ghostY[ghost, games] = y
+        self.ghostX[ghost, games] = x
+        self.ghostCell[ghost, games] = wideCell(y, x)
+
+    def updatePacman(self, active) -> None:
+        y = self.pacY
+        x = self.pacX
+        np.copyto(self.pacLastY, y, where=active)
+        np.copyto(self.pacLastX, x, where=active)
+        exits = self.exits[wideCell(y, x)]
+        betweenRows = (y & FRACTION) != 0
+        betweenCols = (x & FRACTION) != 0
+        turned = canGo(self.pacNewDir, exits, betweenRows, betweenCols)
+        moving = active & (turned | canGo(self.pacDir, exits, betweenRows, betweenCols))
+        direction = np.where(turned, self.pacNewDir, self.pacDir)
+        np.copyto(self.pacDir, direction, where=active)
+        step = PACMAN_SPEED * moving
+        y += DIR_Y[direction] * step
+        x += DIR_X[direction] * step
+        x += boardWidth * (x < 0) - boardWidth * (x >= boardWidth)
+
+    def eat(self, active) -> None:
+        games = np.flatnonzero(active & (((self.pacY | self.pacX) & FRACTION) == 0))
+        cells = self.boardBase[games] + (self.pacY[games] >> SHIFT) * COLS + (self.pacX[games] >> SHIFT)
+        tiles = self.board[cells]
+        power = (tiles == 5) | (tiles == 6)
+        eaten = (tiles == 2) | power
+        self.board[cells[eaten]] = 1
+        self.collected[games[eaten]] += 1
+        self.score[games[tiles == 2]] += 10
+        power = games[power]
+        if len(power) == 0:
+            return
+        self.score[power] += 50
+        self.ghostScore[power] = 200
+        for ghost in range(self.ghostCount):
+            self.attackedCount[ghost, power] = 0
+            self.attacked[ghost, power] = True
+            self.setTarget(power, ghost)
+
+    # Which of the things that moved from (lastY, lastX) to (y, x) this tick touched pacman, for
+    # arrays of any shape ending in games. Only the few within reach, as engine.Game.checkSurroundings
+    # finds them, get the whole test
+    def touchingPacman(self, lastY, lastX, y, x):
+        reach = subTiles // 2 + PACMAN_SPEED + maxStep
+        colDistance = np.abs(x - self.pacX)
+        near = (np.abs(y - self.pacY) <= reach) & (np.minimum(colDistance, boardWidth - colDistance) <= reach)
+        touching = np.zeros(near.shape, dtype=bool)
+        found = np.nonzero(near)
+        if len(found[0]):
+            games = found[-1]
+            lastY, lastX, y, x = (np.broadcast_to(value, near.shape)[found] for value in (lastY, lastX, y, x))
+            moved = lastY >= 0 # Not moved since a reset otherwise
+            touching[found] = sweptContact(self.pacLastY[games], self.pacLastX[games], self.pacY[games], self.pacX[games],
+                                           np.where(moved, lastY, y), np.where(moved, lastX, x), y, x)
+        return touching
+
+    def checkSurroundings(self, active) -> None:
+        # Every ghost against pacman at once, the few touches are then settled in ghost order
+        touch = active & self.touchingPacman(self.lastY, self.lastX, self.ghostY, self.ghostX)
+        checking = active.copy()
+        for ghost in np.flatnonzero(touch.any(axis=1)):
+            touching = touch[ghost] & checking
+            killed = touching & ~self.attacked[ghost]
+            caught = np.flatnonzero(killed)
+            self.gameOver[caught] = self.lives[caught] == 1
+            self.setState(caught, DYING, deathTicks)
+            self.dyingFrame[caught] = 0
+            checking &= ~killed
+
+            eaten = np.flatnonzero(touching & ~killed & ~self.dead[ghost])
+            self.dead[ghost, eaten] = True
+            self.setTarget(eaten, ghost)
+            self.ghostSpeed[ghost, eaten] = subTiles
+            self.snap(eaten, ghost)
+            self.score[eaten] += self.ghostScore[eaten]
+            self.ghostScore[eaten] *= 2
+            self.ghostsEaten[eaten] += 1
+            self.setState(eaten, GHOST_EATEN, ghostEatenTicks)
+
+        berry = checking & ~self.berryEaten & (self.levelTimer >= 200) & (self.levelTimer < 400)
+        if berry.any():
+            berry &= self.touchingPacman(self.berryY, self.berryX, self.berryY, self.berryX)
+            self.berryEaten |= berry
+            self.score += 100 * berry
+            self.berriesCollected += berry
+
+
+# Plays the same scripted inputs through engine.Game and BatchGame and
+# returns a description of the first difference, or None
+def checkParity(seeds, ticks=3000, period=15, layout=None):
+    seeds = list(seeds)
+    games = [Game(1, 0, rng=random.Random(seed), layout=layout) for seed in seeds]
+    batch = BatchGame(len(seeds), rng=PythonRandom(seeds), layout=games[0].layout)
+    inputs = np.random.default_rng(len(seeds))
+    for tick in range(ticks):
+        actions = np.full(len(seeds), -1)
+        if tick % period == 0:
+            actions = inputs.integers(0, 4, size=len(seeds))
+        for index, game in enumerate(games):
+            if not game.running:
+                continue
+            if not game.started:
+                game.start()
+            if actions[index] >= 0:
+                game.pacman.newDir = int(actions[index])
+            game.update()
+        batch.step(actions)
+
+        for index, game in enumerate(games):
+            expected = [game.running, game.score, game.lives, game.level, game.collected, game.pacman.y, game.pacman.x]
+            actual = [batch.running[index], batch.score[index], batch.lives[index], batch.level[index], batch.collected[index], batch.pacY[index], batch.pacX[index]]
+            for ghost in range(batch.ghostCount):
+                expected += [game.ghosts[ghost].y, game.ghosts[ghost].x, game.ghosts[ghost].dir]
+                actual += [batch.ghostY[ghost, index], batch.ghostX[ghost, index], batch.ghostDir[ghost, index]]
+            if expected != actual:
+                return "seed {} differs at tick {}: expected {} got {}".format(seeds[index], tick, expected, actual)
+        if not batch.running.any():
+            break
+    return None
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Step many headless Pacman games with numpy")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--maze", help="name of a maze in pacman/mazes or path of a maze file")
+    parser.add_argument("--parity", action="store_true", help="compare against engine.Game instead of benchmarking")
+    args = parser.parse_args()
+    layout = findMaze(args.maze)
+
+    if args.parity:
+        mismatch = checkParity(range(args.seed, args.seed + args.games), args.ticks, layout=layout)
+        print(mismatch or "{} games match engine.Game for {} ticks".format(args.games, args.ticks))
+        return
+
+    batch = BatchGame(args.games, args.seed, layout=layout)
+    inputs = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+    for tick in range(args.ticks):
+        actions = inputs.integers(0, 4, size=args.games) if tick % 15 == 0 else None
+        batch.step(actions)
+    elapsed = time.perf_counter() - start
+    print("{} games x {} ticks in {:.2f} s ({:.0f} game-ticks/ms), {} still running".format(
+        args.games, args.ticks, elapsed, args.games * args.ticks / elapsed / 1000, int(batch.running.sum())))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+
+import pygame
+
+from . import engine, renderer
+from .atlas import loadGameAssets
+from .constants import square
+from .simulate import randomController
+
+# Times the update and draw hot paths over scripted scenarios with no window:
+#   python -m pacman.benchmark --output before.json
+#   python -m pacman.benchmark --output after.json --compare before.json
+# Run it from the folder holding the assets, like the game.
+
+HOT_PATHS = [
+    (engine.Game, "update"),
+    (engine.Game, "flipColor"),
+    (engine.Ghost, "setDir"),
+    (engine.Ghost, "setTarget"),
+    (renderer.Renderer, "drawFrame"),
+    (renderer.Renderer, "render"),
+    (renderer.Renderer, "drawTilesAround"),
+]
+
+
+def powerPellet(game) -> None:
+    for ghost in game.ghosts:
+        ghost.attackedCount = 0
+        ghost.setAttacked(True)
+        ghost.setTarget()
+
+# Keeps the ghosts frightened for the whole round
+def holdPowerPellet(game) -> None:
+    for ghost in game.ghosts:
+        ghost.attackedCount = 0
+
+def ghostsDead(game) -> None:
+    for ghost in game.ghosts:
+        ghost.setDead(True)
+        ghost.setTarget()
+        ghost.ghostSpeed = 1
+        game.moveGhost(ghost, ghost.y - ghost.y % engine.subTiles, ghost.x - ghost.x % engine.subTiles)
+
+# Name -> (set up once per round, applied before every tick)
+SCENARIOS = {
+    "levelStart": (None, None),
+    "powerPellet": (powerPellet, holdPowerPellet),
+    "ghostsDead": (ghostsDead, None),
+}
+
+
+# Replaces methods with wrappers that record each call
+class Probe:
+    def __init__(self, measure) -> None:
+        self.measure = measure # "time" or "memory"
+        self.samples = {} # "Class.method" -> [ns or bytes per call]
+        self.originals = []
+        self.stack = [] # [traced bytes on entry, highest traced bytes seen] of each running call
+
+    def install(self, owner, name) -> None:
+        original = getattr(owner, name)
+        label = owner.__name__ + "." + name
+        samples = self.samples.setdefault(label, [])
+        if self.measure == "time":
+            def probe(*args, **kwargs):
+                start = time.perf_counter_ns()
+                result = original(*args, **kwargs)
+                samples.append(time.perf_counter_ns() - start)
+                return result
+        else:
+            def probe(*args, **kwargs):
+                self.enter()
+                result = original(*args, **kwargs)
+                samples.append(self.leave())
+                return result
+        setattr(owner, name, probe)
+        self.originals.append((owner, name, original))
+
+    def remove(self) -> None:
+        for owner, name, original in self.originals:
+            setattr(owner, name, original)
+        self.originals.clear()
+
+    # Nested calls reset tracemalloc's peak, so the callers' peaks are carried on the stack
+    def enter(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if self.stack:
+            self.stack[-1][1] = max(self.stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self.stack.append([current, current])
+
+    def leave(self):
+        peak = tracemalloc.get_traced_memory()[1]
+        entry = self.stack.pop()
+        entry[1] = max(entry[1], peak)
+        if self.stack:
+            self.stack[-1][1] = max(self.stack[-1][1], entry[1])
+        tracemalloc.reset_peak()
+        return entry[1] - entry[0]
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+# Plays rounds of the scenario, one drawn frame per tick; a round ends early when pacman dies
+def runScenario(screen, atlas, scenario, rounds, ticks, seed):
+    setUp, hold = SCENARIOS[scenario]
+    view = renderer.Renderer(screen, atlas)
+    frames = 0
+    elapsed = 0.0
+    for index in range(rounds):
+        game = engine.Game(1, 0, rng=random.Random(seed + index), observers=[view])
+        controller = randomController(random.Random("input-" + str(seed + index)))
+        view.render(game)
+        game.start()
+        if setUp is not None:
+            setUp(game)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if hold is not None:
+                hold(game)
+            newDir = controller(game)
+            if newDir is not None:
+                game.pacman.newDir = newDir
+            game.update()
+            view.drawFrame(game, 1.0)
+            frames += 1
+            if game.state == "dying" or not game.running:
+                break
+        elapsed += time.perf_counter() - start
+    return frames, elapsed
+
+def benchmark(scenarios, rounds, ticks, seed):
+    screen = pygame.display.set_mode((len(engine.originalGameBoard[0]) * square, len(engine.originalGameBoard) * square))
+    atlas = loadGameAssets()
+
+    results = {}
+    for scenario in scenarios:
+        # Timings and allocations come from separate runs, tracemalloc would skew the clock
+        timing = Probe("time")
+        for owner, name in HOT_PATHS:
+            timing.install(owner, name)
+        frames, elapsed = runScenario(screen, atlas, scenario, rounds, ticks, seed)
+        timing.remove()
+
+        memory = Probe("memory")
+        for owner, name in HOT_PATHS:
+            memory.install(owner, name)
+        tracemalloc.start()
+        runScenario(screen, atlas, scenario, rounds, ticks, seed)
+        tracemalloc.stop()
+        memory.remove()
+
+        functions = {}
+        for label, samples in timing.samples.items():
+            if not samples:
+                continue
+            allocations = memory.samples[label]
+            functions[label] = {
+                "calls": len(samples),
+                "p50Us": percentile(samples, 0.5) / 1000,
+                "p99Us": percentile(samples, 0.99) / 1000,
+                "meanUs": sum(samples) / len(samples) / 1000,
+                "allocPeakBytes": sum(allocations) / max(len(allocations), 1),
+            }
+        results[scenario] = {"frames": frames, "fps": frames / elapsed, "functions": functions}
+    return results
+
+def gitCommit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def printResults(results, baseline=None) -> None:
+    for scenario, result in results.items():
+        old = (baseline or {}).get(scenario)
+        line = "{}: {:.0f} fps over {} frames".format(scenario, result["fps"], result["frames"])
+        if old:
+            line += " (was {:.0f})".format(old["fps"])
+        print(line)
+        for label, stats in result["functions"].items():
+            line = "  {:<27} {:>7} calls  p50 {:>8.1f} us  p99 {:>8.1f} us  alloc {:>8.0f} B".format(
+                label, stats["calls"], stats["p50Us"], stats["p99Us"], stats["allocPeakBytes"])
+            if old and label in old["functions"]:
+                line += "  p50 {:+.0%}".format(stats["p50Us"] / old["functions"][label]["p50Us"] - 1)
+            print(line)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the game's update and render hot paths")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="default: all of them")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--compare", help="earlier output to compare against")
+    args = parser.parse_args()
+
+    # SDL reads these when the display starts, not when pygame is imported
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    results = benchmark(args.scenario or list(SCENARIOS), args.rounds, args.ticks, args.seed)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["scenarios"]
+    printResults(results, baseline)
+    with open(args.output, "w") as file:
+        json.dump({
+            "commit": gitCommit(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "rounds": args.rounds,
+            "ticks": args.ticks,
+            "seed": args.seed,
+            "scenarios": results,
+        }, file, indent=2)
+
+if __name__ == "__main__":
+    main()
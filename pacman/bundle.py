@@ -0,0 +1,129 @@
+import hashlib
+import io
+import mmap
+import os
+import struct
+import tarfile
+
+# Assets.tar.gz is repacked once into Assets.pack, an uncompressed archive
+# with an index up front that is memory-mapped, so the game runs without
+# extracting its ~1500 sprite files: opening one copies just its bytes out
+# of the mapping, nothing is decompressed or read ahead. Only the writable
+# Assets/Data folder (high score, caches, replays) is extracted, on demand.
+
+HEADER = struct.Struct("<4sBI20s") # Magic, version, entries, sha1 of the contents
+ENTRY = struct.Struct("<QIH") # Offset, size, name length, followed by the name
+MAGIC = b"PACB"
+VERSION = 1
+
+
+# Reads assets from the extracted folders, the layout the game always had
+class AssetDirectory:
+    def listdir(self, folder):
+        return sorted(os.listdir(folder))
+
+    def open(self, name):
+        return open(name, "rb")
+
+    # Changes whenever a file in one of folders is replaced
+    def fingerprint(self, folders) -> str:
+        digest = hashlib.sha1()
+        for folder in folders:
+            for fileName in self.listdir(folder):
+                info = os.stat(folder + fileName)
+                digest.update("{} {} {}\n".format(folder + fileName, info.st_size, info.st_mtime_ns).encode())
+        return digest.hexdigest()
+
+    def extract(self, folder) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class AssetBundle:
+    def __init__(self, fileName) -> None:
+        self.file = open(fileName, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, self.digest = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(fileName + " is not a version " + str(VERSION) + " asset bundle")
+        self.entries = {} # Name -> (offset, size)
+        position = HEADER.size
+        for _ in range(count):
+            offset, size, length = ENTRY.unpack_from(self.map, position)
+            position += ENTRY.size
+            self.entries[self.map[position:position + length].decode()] = (offset, size)
+            position += length
+
+    def listdir(self, folder):
+        return sorted(name[len(folder):] for name in self.entries if name.startswith(folder) and "/" not in name[len(folder):])
+
+    # File object over a copy of the file's mapped bytes, pygame loaders take it like a path
+    def open(self, name):
+        if name not in self.entries:
+            raise FileNotFoundError(name)
+        offset, size = self.entries[name]
+        return io.BytesIO(self.map[offset:offset + size])
+
+    def fingerprint(self, folders) -> str:
+        return self.digest.hex()
+
+    # Writes the files of folder that are not on disk yet
+    def extract(self, folder) -> None:
+        os.makedirs(folder, exist_ok=True)
+        for fileName in self.listdir(folder):
+            if not os.path.exists(folder + fileName):
+                offset, size = self.entries[folder + fileName]
+                with open(folder + fileName, "wb") as file:
+                    file.write(self.map[offset:offset + size])
+
+    # Unmaps the bundle; files opened earlier are copies and stay readable
+    def close(self) -> None:
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# Repacks a tar archive, leaving out folders and macOS resource forks
+def pack(archive, fileName) -> None:
+    files = []
+    with tarfile.open(archive) as tar:
+        for member in tar:
+            if member.isfile() and not os.path.basename(member.name).startswith("._"):
+                files.append((member.name, tar.extractfile(member).read()))
+    names = [name.encode() for name, _ in files]
+    offset = HEADER.size + sum(ENTRY.size + len(name) for name in names)
+    digest = hashlib.sha1()
+    index = bytearray()
+    for name, (_, data) in zip(names, files):
+        index += ENTRY.pack(offset, len(data), len(name)) + name
+        offset += len(data)
+        digest.update(name)
+        digest.update(data)
+    temporary = fileName + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(files), digest.digest()))
+        file.write(index)
+        for _, data in files:
+            file.write(data)
+    os.replace(temporary, fileName) # A half written bundle is never picked up
+
+# The bundle when there is one (built from the archive if that is newer), else the extracted folders
+def openAssets(archive="Assets.tar.gz", bundle="Assets.pack"):
+    if os.path.exists(archive) and (not os.path.exists(bundle) or os.path.getmtime(bundle) < os.path.getmtime(archive)):
+        pack(archive, bundle)
+    if os.path.exists(bundle):
+        return AssetBundle(bundle)
+    return AssetDirectory()
@@ -0,0 +1,99 @@
+# Contact tests between actors. Actors are filed in a uniform grid of square
+# cells a few tiles wide, so finding what could touch pacman looks at one to
+# four cells. Contacts are tested over the whole move of a tick rather than
+# where the actors stopped, so a fast actor cannot jump through pacman between
+# two ticks. A game has at most four ghosts, one per colour, so the grid saves
+# nothing over testing each of them and keeping it filed costs a few percent
+# of a headless tick.
+
+
+class CollisionGrid:
+    # Positions are in eighths of a tile, or any other fixed-point unit given as subTiles.
+    # Actors keep the cell they are filed in themselves, in gridCell, -1 when they are in none
+    def __init__(self, rows, cols, subTiles, cellTiles=8) -> None:
+        self.size = cellTiles * subTiles # Edge of a cell in position units
+        self.width = cols * subTiles # Columns wrap through the tunnel at this x
+        self.cols = -(-cols // cellTiles)
+        self.rows = -(-rows // cellTiles)
+        self.cells = [[] for _ in range(self.rows * self.cols)]
+
+    # Files an actor under the cell holding (y, x); most moves stay in the same cell and change nothing
+    def move(self, actor, y, x) -> None:
+        cell = y // self.size * self.cols + x // self.size
+        if actor.gridCell != cell:
+            if actor.gridCell != -1:
+                self.cells[actor.gridCell].remove(actor)
+            self.cells[cell].append(actor)
+            actor.gridCell = cell
+
+    def remove(self, actor) -> None:
+        if actor.gridCell != -1:
+            self.cells[actor.gridCell].remove(actor)
+            actor.gridCell = -1
+
+    def clear(self) -> None:
+        for cell in self.cells:
+            for actor in cell:
+                actor.gridCell = -1
+            cell.clear()
+
+    # Actors filed within radius of (y, x) on both axes, and maybe a few more from the same cells.
+    # Columns wrap around like the tunnel, radius has to be less than half the width
+    def near(self, y, x, radius):
+        size = self.size
+        cols = self.cols
+        top = (y - radius) // size
+        bottom = (y + radius) // size
+        left = (x - radius) % self.width // size
+        right = (x + radius) % self.width // size
+        if top == bottom and left == right:
+            return self.cells[top * cols + left][:]
+        top = top if top > 0 else 0
+        bottom = bottom if bottom < self.rows else self.rows - 1
+        # Across the tunnel the span runs from the last cells to the first ones
+        spans = ((left, right),) if left <= right else ((left, cols - 1), (0, right))
+        found = []
+        for row in range(top * cols, bottom * cols + 1, cols):
+            for first, last in spans:
+                for cell in range(row + first, row + last + 1):
+                    found += self.cells[cell]
+        return found
+
+
+# Whether two actors touched at any moment of a tick in which they moved in straight lines
+# from (ay0, ax0) to (ay1, ax1) and from (by0, bx0) to (by1, bx1). Touching is being in line,
+# on the same row or column, and at most reach apart.
+def sweptContact(ay0, ax0, ay1, ax1, by0, bx0, by1, bx1, reach, width):
+    # A move through the tunnel wraps around, it is measured the short way
+    half = width // 2
+    if ax1 - ax0 > half:
+        ax0 += width
+    elif ax0 - ax1 > half:
+        ax0 -= width
+    if bx1 - bx0 > half:
+        bx0 += width
+    elif bx0 - bx1 > half:
+        bx0 -= width
+    # Position of b relative to a at the start of the tick and its change over the tick,
+    # actors on either side of the tunnel are as far apart as through it
+    rowOffset = by0 - ay0
+    colOffset = (bx0 - ax0) % width
+    if colOffset > half:
+        colOffset -= width
+    rowChange = (by1 - by0) - (ay1 - ay0)
+    colChange = (bx1 - bx0) - (ax1 - ax0)
+    return inLine(colOffset, colChange, rowOffset, rowChange, reach) or inLine(rowOffset, rowChange, colOffset, colChange, reach)
+
+# Whether at some t in [0, 1] the offset a + t * da is 0 while b + t * db is within reach of 0
+def inLine(a, da, b, db, reach) -> bool:
+    if da == 0:
+        if a != 0:
+            return False
+        return min(b, b + db) <= reach and max(b, b + db) >= -reach
+    if da < 0:
+        a = -a
+        da = -da
+    if a > 0 or -a > da: # The offset never passes 0 during the tick
+        return False
+    # At t = -a / da, scaled by da to stay in whole numbers
+    return abs(b * da - db * a) <= reach * da
@@ -0,0 +1,14 @@
+BoardPath = "Assets/BoardImages/"
+ElementPath = "Assets/ElementImages/"
+TextPath = "Assets/TextImages/"
+DataPath = "Assets/Data/"
+MusicPath = "Assets/Music/"
+
+spriteRatio = 1.5
+square = 20 # Size of each unit square
+spriteOffset = square * (1 - spriteRatio) * (1/2)
+spriteSize = int(square * spriteRatio)
+pelletColor = (222, 161, 133)
+
+tickRate = 30 # Game logic updates per second
+frameRate = 60 # Frames drawn per second at most, 0 draws as fast as possible
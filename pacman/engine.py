@@ -0,0 +1,687 @@
+import math
+import random
+from operator import attrgetter
+
+from . import mazes, navigation
+from .collision import CollisionGrid, sweptContact
+from .mazes import targetQuadrant
+
+# Game logic only: nothing in here touches pygame, so games can be stepped
+# headless. Drawing and sound are done by observers attached to a Game.
+
+# The arcade maze; a Game can be given any other maze loaded by mazes.loadMaze
+classic = mazes.readMaze(mazes.CLASSIC)
+originalGameBoard = classic.board
+boardCols = classic.cols # Every maze has the arcade maze's size
+originalCells = classic.cells
+ghostColors = mazes.GHOST_COLORS
+
+# Timed states hold the world still for a number of ticks
+ghostEatenTicks = 30 # Freeze after a ghost is eaten
+deathTicks = 30 # Freeze before the death animation
+deathFrameTicks = 4 # Each of the 12 frames of the death animation
+intermissionTicks = 60 # Between a cleared board and the next level
+
+
+# Receives game events, every callback is optional
+class Observer:
+    def onRender(self, game) -> None: # Board was reset, everything has to be redrawn
+        pass
+
+    def onWaiting(self, game) -> None: # Tick while paused or waiting for the first key
+        pass
+
+    def onTickStart(self, game) -> None: # Before any actor moves
+        pass
+
+    def onTickEnd(self, game) -> None: # After all actors moved
+        pass
+
+    def onCellChanged(self, game, row, col) -> None: # A pellet was eaten or flipped
+        pass
+
+    def onPlayMusic(self, game, music) -> None: # Play unless something is playing
+        pass
+
+    def onForcePlayMusic(self, game, music) -> None: # Interrupt whatever is playing
+        pass
+
+    def onGhostEaten(self, game, ghost) -> None:
+        pass
+
+    def onDeath(self, game) -> None: # Pacman was caught, game.gameOver tells if it was his last life
+        pass
+
+    def onDeathFrame(self, game) -> None: # One frame of the death animation
+        pass
+
+    def onFrozen(self, game) -> None: # Tick during which a timed state holds the world still
+        pass
+
+    def onPointsExpired(self, game, point) -> None: # A score popup ran out, point is [row, col, points, age]
+        pass
+
+
+class Game:
+    def __init__(self, level, score, highScore=0, rng=None, observers=None, layout=None, ai=None) -> None:
+        # Every random choice goes through this game's own generator, so a seeded game can be replayed
+        self.rng = random.Random() if rng is None else rng
+        self.layout = mazes.loadMaze() if layout is None else layout
+        self.navigation = self.layout.navigation
+        self.maze = navigation.graphFor(self.layout.board, self.layout.gates)
+        self.occupancy = bytearray(self.maze.rows * self.maze.cols) # One bit per ghost standing exactly on a tile
+        self.actors = CollisionGrid(self.maze.rows, self.maze.cols, subTiles) # Ghosts, by where they are, for contact tests
+        self.observers = [] if observers is None else observers
+        self.cells = bytearray(self.layout.cells)
+        # Row views into cells, gameBoard[row][col] reads and writes the flat board
+        self.gameBoard = [memoryview(self.cells)[row * boardCols:(row + 1) * boardCols] for row in range(self.layout.rows)]
+        self.boardGeneration = 0 # Counts board restores, the board object itself is reused
+        self.pellets = self.layout.pellets.copy()
+        self.running = True
+        self.paused = True
+        self.ghostUpdateDelay = 1
+        self.ghostUpdateCount = 0
+        self.pacmanUpdateDelay = 1
+        self.pacmanUpdateCount = 0
+        self.tictakChangeDelay = 10
+        self.tictakChangeCount = 0
+        self.ghostsAttacked = False
+        self.highScore = highScore
+        self.score = score
+        self.level = level
+        self.lives = 4
+        self.targetQuadrants = [0, 0, 0, 0] # Ghost targets in each quadrant, kept up to date by Ghost.aim
+        self.ghosts = self.createGhosts()
+        self.ai = ai # Steers the ghosts instead of their own random targets, see ghostai
+        if ai is not None:
+            ai.attach(self)
+        self.pacman = Pacman(self, self.layout.pacmanStart[0], self.layout.pacmanStart[1])
+        self.total = self.getCount()
+        self.ghostScore = 200
+        self.levels = [[350, 250], [150, 450], [150, 450], [0, 600]]
+        self.rng.shuffle(self.levels)
+        # Level index and Level Progress
+        self.ghostStates = [[1, 0], [0, 0], [1, 0], [0, 0]]
+        index = 0
+        for state in self.ghostStates:
+            state[0] = self.rng.randrange(2)
+            state[1] = self.rng.randrange(self.levels[index][state[0]] + 1)
+            index += 1
+        self.collected = 0
+        self.started = False
+        self.gameOver = False
+        self.state = "playing" # Or one of the timed states: "ghostEaten", "dying", "intermission"
+        self.stateTimer = 0
+        self.dyingFrame = 0
+        self.points = []
+        self.pointsTimer = 10
+        # Berry Spawn Time, Berry Death Time, Berry Eaten
+        self.berryState = [200, 400, False]
+        self.berryLocation = list(self.layout.berryLocation)
+        self.berries = [80, 81, 82, 83, 84, 85, 86, 87]
+        self.berriesCollected = []
+        self.levelTimer = 0
+        self.berryScore = 100
+        self.lockedInTimer = 100
+        self.lockedIn = True
+        self.extraLifeGiven = False
+
+    def notify(self, event, *args) -> None:
+        for observer in self.observers:
+            getattr(observer, event)(self, *args)
+
+    # Same as a key press in the window: leaves the paused state
+    def start(self) -> None:
+        self.paused = False
+        self.started = True
+
+    # Driver method: The games primary update method
+    def update(self) -> None:
+        if self.state != "playing":
+            self.updateState()
+            return
+        if self.paused or not self.started:
+            self.notify("onWaiting")
+            return
+
+        self.levelTimer += 1
+        self.ghostUpdateCount += 1
+        self.pacmanUpdateCount += 1
+        self.tictakChangeCount += 1
+        self.ghostsAttacked = False
+
+        if self.score >= 10000 and not self.extraLifeGiven:
+            self.lives += 1
+            self.extraLifeGiven = True
+            self.notify("onForcePlayMusic", "pacman_extrapac.wav")
+
+        # Draw tiles around ghosts and pacman
+        self.notify("onTickStart")
+        for ghost in self.ghosts:
+            if ghost.attacked:
+                self.ghostsAttacked = True
+
+        # Check if the ghost should case pacman
+        index = 0
+        for state in self.ghostStates:
+            state[1] += 1
+            if state[1] >= self.levels[index][state[0]]:
+                state[1] = 0
+                state[0] += 1
+                state[0] %= 2
+            index += 1
+
+        index = 0
+        quadrant = -1
+        for ghost in self.ghosts:
+            if not ghost.attacked and not ghost.dead and self.ghostStates[index][0] == 0:
+                if quadrant == -1:
+                    row = self.pacman.y / subTiles
+                    col = self.pacman.x / subTiles
+                    quadrant = targetQuadrant(row, col)
+                if ghost.quadrant == quadrant: # Same count, only the tile changes
+                    ghost.target[0] = row
+                    ghost.target[1] = col
+                else:
+                    ghost.aim(row, col)
+            index += 1
+
+        if self.levelTimer == self.lockedInTimer:
+            self.lockedIn = False
+
+        if self.ghostUpdateCount == self.ghostUpdateDelay:
+            if self.ai is not None:
+                self.ai.beginTick(self)
+            for ghost in self.ghosts:
+                ghost.update()
+            self.ghostUpdateCount = 0
+
+        if self.tictakChangeCount == self.tictakChangeDelay:
+            #Changes the color of special Tic-Taks
+            self.flipColor()
+            self.tictakChangeCount = 0
+
+        if self.pacmanUpdateCount == self.pacmanUpdateDelay:
+            self.pacmanUpdateCount = 0
+            self.pacman.update()
+            self.pacman.x %= boardWidth
+            if self.pacman.y % subTiles == 0 and self.pacman.x % subTiles == 0:
+                row = self.pacman.y // subTiles
+                col = self.pacman.x // subTiles
+                cell = row * boardCols + col
+                tile = self.cells[cell]
+                if tile == 2:
+                    self.notify("onPlayMusic", "munch_1.wav")
+                    self.eatPellet(cell)
+                    self.score += 10
+                    self.notify("onCellChanged", row, col)
+                elif tile == 5 or tile == 6:
+                    self.notify("onForcePlayMusic", "power_pellet.wav")
+                    self.eatPellet(cell)
+                    self.notify("onCellChanged", row, col)
+                    self.score += 50
+                    self.ghostScore = 200
+                    for ghost in self.ghosts:
+                        ghost.attackedCount = 0
+                        ghost.setAttacked(True)
+                        ghost.setTarget()
+                        self.ghostsAttacked = True
+        self.checkSurroundings()
+        self.highScore = max(self.score, self.highScore)
+
+        if self.collected == self.total and self.state == "playing":
+            self.notify("onForcePlayMusic", "intermission.wav")
+            self.setState("intermission", intermissionTicks)
+        self.agePoints()
+        self.animate()
+        self.notify("onTickEnd")
+
+    # Counts up the age of the score popups, dropping the ones older than pointsTimer
+    def agePoints(self) -> None:
+        for point in list(self.points):
+            if point[3] < self.pointsTimer:
+                point[3] += 1
+            else:
+                self.points.remove(point)
+                self.notify("onPointsExpired", point)
+
+    # Advances the ghost feet and pacman's mouth by one frame of animation
+    def animate(self) -> None:
+        for ghost in self.ghosts:
+            ghost.moveFeet()
+        self.pacman.moveMouth()
+
+    def eatPellet(self, cell) -> None:
+        self.cells[cell] = 1
+        self.pellets.remove(cell)
+        self.collected += 1
+
+    def setState(self, state, ticks) -> None:
+        self.state = state
+        self.stateTimer = ticks
+
+    # Counts down the current timed state and moves on when it runs out
+    def updateState(self) -> None:
+        self.stateTimer -= 1
+        if self.stateTimer > 0:
+            self.notify("onFrozen")
+            return
+        if self.state == "dying" and self.dyingFrame < 12:
+            self.notify("onDeathFrame")
+            self.dyingFrame += 1
+            self.stateTimer = deathFrameTicks
+            return
+
+        state = self.state
+        self.state = "playing"
+        if state == "dying":
+            if self.gameOver:
+                self.running = False
+                return
+            self.started = False
+            self.reset()
+        elif state == "intermission":
+            self.level += 1
+            self.newLevel()
+            if self.level > self.layout.lastLevel:
+                self.running = False
+
+    def checkSurroundings(self) -> None:
+        pacman = self.pacman
+        # Only ghosts that could have reached pacman this tick, in the order of self.ghosts
+        reach = subTiles // 2 + pacman.speed + maxStep
+        nearby = self.actors.near(pacman.y, pacman.x, reach)
+        if len(nearby) > 1:
+            nearby.sort(key=ghostNumber)
+        # Check if pacman got killed
+        for ghost in nearby:
+            colDistance = abs(ghost.x - pacman.x)
+            touching = (abs(ghost.y - pacman.y) <= reach and min(colDistance, boardWidth - colDistance) <= reach # The short way, maybe through the tunnel
+                        and self.touchingPacman(ghost.lastY, ghost.lastX, ghost.y, ghost.x))
+            if touching and not ghost.attacked:
+                # The board is reset, or the game ended, once the death animation is over
+                self.gameOver = self.lives == 1
+                self.notify("onForcePlayMusic", "death_1.wav" if self.gameOver else "pacman_death.wav")
+                self.setState("dying", deathTicks)
+                self.dyingFrame = 0
+                pacman.moveMouth()
+                self.notify("onDeath")
+                return
+            elif touching and ghost.isAttacked() and not ghost.isDead():
+                ghost.setDead(True)
+                ghost.setTarget()
+                ghost.ghostSpeed = 1
+                self.moveGhost(ghost, ghost.y - ghost.y % subTiles, ghost.x - ghost.x % subTiles)
+                self.score += self.ghostScore
+                self.points.append([ghost.row, ghost.col, self.ghostScore, 0])
+                self.ghostScore *= 2
+                self.notify("onForcePlayMusic", "eat_ghost.wav")
+                self.notify("onGhostEaten", ghost)
+                self.setState("ghostEaten", ghostEatenTicks)
+        if not self.berryState[2] and self.levelTimer in range(self.berryState[0], self.berryState[1]):
+            berryY = toFixed(self.berryLocation[0])
+            berryX = toFixed(self.berryLocation[1])
+            if self.touchingPacman(berryY, berryX, berryY, berryX):
+                self.berryState[2] = True
+                self.score += self.berryScore
+                self.points.append([self.berryLocation[0], self.berryLocation[1], self.berryScore, 0])
+                self.berriesCollected.append(self.berries[(self.level - 1) % 8])
+                self.notify("onForcePlayMusic", "eat_fruit.wav")
+
+    # Whether something that moved from (lastY, lastX) to (y, x) this tick, in eighths of a tile,
+    # was in line with pacman and at most half a tile away from him at any moment of the tick
+    def touchingPacman(self, lastY, lastX, y, x) -> bool:
+        pacman = self.pacman
+        if lastY < 0: # Not moved since a reset
+            lastY = y
+            lastX = x
+        return sweptContact(pacman.lastY, pacman.lastX, pacman.y, pacman.x, lastY, lastX, y, x, subTiles // 2, boardWidth)
+
+    def createGhosts(self):
+        # None of the start positions is on a whole tile, so the occupancy grid starts empty
+        self.occupancy[:] = bytes(len(self.occupancy))
+        self.actors.clear()
+        self.targetQuadrants[:] = [0, 0, 0, 0]
+        ghosts = [Ghost(self, row, col, color, changeFeetCount) for row, col, color, changeFeetCount in self.layout.ghostStarts]
+        for number, ghost in enumerate(ghosts):
+            ghost.number = number
+            self.actors.move(ghost, ghost.y, ghost.x)
+        return ghosts
+
+    # Moves a ghost, in eighths of a tile, and keeps the occupancy and collision grids in step with it
+    def moveGhost(self, ghost, y, x) -> None:
+        actors = self.actors
+        if ghost.gridCell != y // actors.size * actors.cols + x // actors.size: # Most moves stay in the same cell
+            actors.move(ghost, y, x)
+        maze = self.maze
+        if ghost.y % subTiles == 0 and ghost.x % subTiles == 0:
+            self.occupancy[ghost.y // subTiles * maze.cols + ghost.x // subTiles] &= ~ghost.bit
+        if y % subTiles == 0 and x % subTiles == 0:
+            self.occupancy[y // subTiles * maze.cols + x // subTiles] |= ghost.bit
+        ghost.y = y
+        ghost.x = x
+
+    # Reset after death, the actors are put back in place rather than recreated
+    def reset(self) -> None:
+        self.occupancy[:] = bytes(len(self.occupancy))
+        for ghost, start in zip(self.ghosts, self.layout.ghostStarts):
+            ghost.reset(start[0], start[1])
+            self.actors.move(ghost, ghost.y, ghost.x)
+        for ghost in self.ghosts:
+            ghost.setTarget()
+        self.pacman.reset(self.layout.pacmanStart[0], self.layout.pacmanStart[1])
+        self.lives -= 1
+        self.paused = True
+        self.notify("onRender")
+
+    def newLevel(self) -> None:
+        self.reset()
+        self.lives += 1
+        self.collected = 0
+        self.started = False
+        self.berryState = [200, 400, False]
+        self.levelTimer = 0
+        self.lockedIn = True
+        for level in self.levels:
+            level[0] = min((level[0] + level[1]) - 100, level[0] + 50)
+            level[1] = max(100, level[1] - 50)
+        self.rng.shuffle(self.levels)
+        index = 0
+        for state in self.ghostStates:
+            state[0] = self.rng.randrange(2)
+            state[1] = self.rng.randrange(self.levels[index][state[0]] + 1)
+            index += 1
+        self.cells[:] = self.layout.cells
+        self.pellets = self.layout.pellets.copy()
+        self.boardGeneration += 1
+        self.notify("onRender")
+
+    # Flips Color of Special Tic-Taks
+    def flipColor(self) -> None:
+        cells = self.cells
+        for cell in self.pellets.powerPellets:
+            cells[cell] = 6 if cells[cell] == 5 else 5
+            self.notify("onCellChanged", cell // boardCols, cell % boardCols)
+
+    def getCount(self):
+        return len(self.pellets)
+
+# Positions are kept in whole eighths of a tile, every speed is a multiple of that, so
+# "on a tile" is an exact integer test; row and col give tiles for drawing and tools
+subTiles = 8
+dirSteps = ((-1, 0), (0, 1), (1, 0), (0, -1)) # Row and col step of north, east, south, west
+maxStep = subTiles # No actor moves more than a tile in one tick, contact tests look that far
+boardWidth = boardCols * subTiles # Where x wraps through the tunnel
+ghostNumber = attrgetter("number")
+
+def toFixed(value):
+    return round(value * subTiles)
+
+class Pacman:
+    __slots__ = ("game", "y", "x", "lastY", "lastX", "speed", "mouthOpen", "mouthChangeDelay", "mouthChangeCount", "dir", "newDir")
+
+    def __init__(self, game, row, col) -> None:
+        self.game = game
+        self.speed = 2
+        self.mouthChangeDelay = 5
+        self.reset(row, col)
+
+    # Puts pacman back at a start position, also used instead of a new Pacman after a death
+    def reset(self, row, col) -> None:
+        self.y = toFixed(row)
+        self.x = toFixed(col)
+        self.lastY = self.y # Where the last update started
+        self.lastX = self.x
+        self.mouthOpen = False
+        self.mouthChangeCount = 0
+        self.dir = 0 # 0: North, 1: East, 2: South, 3: West
+        self.newDir = 0
+
+    @property
+    def row(self):
+        return self.y / subTiles
+
+    @row.setter
+    def row(self, value) -> None:
+        self.y = toFixed(value)
+
+    @property
+    def col(self):
+        return self.x / subTiles
+
+    @col.setter
+    def col(self, value) -> None:
+        self.x = toFixed(value)
+
+    @property
+    def pacSpeed(self):
+        return self.speed / subTiles
+
+    def update(self) -> None:
+        self.lastY = self.y
+        self.lastX = self.x
+        if self.canGo(self.newDir):
+            self.dir = self.newDir
+        elif not self.canGo(self.dir):
+            return
+        step = dirSteps[self.dir]
+        self.y += step[0] * self.speed
+        self.x += step[1] * self.speed
+
+    def moveMouth(self) -> None:
+        if self.mouthChangeCount == self.mouthChangeDelay:
+            self.mouthChangeCount = 0
+            self.mouthOpen = not self.mouthOpen
+        self.mouthChangeCount += 1
+
+    def canGo(self, direction) -> bool:
+        # Turning north or south needs pacman lined up with a column, east or west with a row
+        if direction % 2 == 0:
+            if self.x % subTiles:
+                return False
+            if self.y % subTiles: # Between two tiles the way on is always open
+                return True
+        else:
+            if self.y % subTiles:
+                return False
+            if self.x % subTiles:
+                return True
+        maze = self.game.maze
+        return bool(maze.flags[self.y // subTiles * maze.cols + self.x // subTiles] >> direction & 1)
+
+class Ghost:
+    __slots__ = ("game", "number", "gridCell", "y", "x", "speed", "attacked", "color", "bit", "dir", "dead", "startFeetCount", "changeFeetCount",
+                 "changeFeetDelay", "feet", "target", "quadrant", "lastY", "lastX", "attackedTimer", "attackedCount", "deathTimer", "deathCount", "order")
+
+    def __init__(self, game, row, col, color, changeFeetCount) -> None:
+        self.game = game
+        self.color = color
+        self.bit = 1 << ghostColors.index(color) # Marks this ghost in the game's occupancy grid
+        self.startFeetCount = changeFeetCount
+        self.changeFeetDelay = 5
+        self.target = [-1, -1] # Tile, set through aim()
+        self.quadrant = targetQuadrant(-1, -1) # Of the target
+        game.targetQuadrants[self.quadrant] += 1
+        self.attackedTimer = 240
+        self.deathTimer = 120
+        self.order = [0, 1, 2, 3] # Directions in the order setDir tries them
+        self.number = 0 # Place in game.ghosts
+        self.gridCell = -1 # Cell of game.actors the ghost is filed in
+        self.reset(row, col)
+
+    # Puts the ghost back in its start state, also used instead of a new Ghost after a death
+    def reset(self, row, col) -> None:
+        self.y = toFixed(row)
+        self.x = toFixed(col)
+        self.attacked = False
+        self.dir = self.game.rng.randrange(4)
+        self.dead = False
+        self.changeFeetCount = self.startFeetCount
+        self.feet = False # Whether the other feet frame is shown
+        self.aim(-1, -1)
+        self.speed = 2
+        self.lastY = -subTiles
+        self.lastX = -subTiles
+        self.attackedCount = 0
+        self.deathCount = 0
+
+    def moveFeet(self) -> None:
+        self.feet = self.changeFeetCount == self.changeFeetDelay
+        if self.feet:
+            self.changeFeetCount = 0
+        self.changeFeetCount += 1
+
+    @property
+    def row(self):
+        return self.y / subTiles
+
+    @property
+    def col(self):
+        return self.x / subTiles
+
+    @property
+    def ghostSpeed(self):
+        return self.speed / subTiles
+
+    @ghostSpeed.setter
+    def ghostSpeed(self, value) -> None:
+        self.speed = toFixed(value)
+
+    # Board value of the tile the ghost is on, or entering from its top left
+    def tile(self):
+        return self.game.cells[self.y // subTiles * boardCols + self.x // subTiles]
+
+    def update(self) -> None:
+        ai = self.game.ai
+        if ai is not None:
+            ai.steer(self)
+        else:
+            target = self.target
+            if (target[0] == -1 and target[1] == -1) or (self.y == target[0] * subTiles and self.x == target[1] * subTiles) or self.tile() == 4 or self.dead:
+                self.setTarget()
+            self.setDir()
+        self.move()
+
+        if self.attacked:
+            self.attackedCount += 1
+
+        if self.attacked and not self.dead:
+            self.speed = 1
+
+        if self.attackedCount == self.attackedTimer and self.attacked:
+            if not self.dead:
+                self.speed = 2
+                self.game.moveGhost(self, self.y - self.y % subTiles, self.x - self.x % subTiles)
+
+            self.attackedCount = 0
+            self.attacked = False
+            self.setTarget()
+
+        if self.dead and self.tile() == 4:
+            self.deathCount += 1
+            self.attacked = False
+            if self.deathCount == self.deathTimer:
+                self.deathCount = 0
+                self.dead = False
+                self.speed = 2
+
+    def isValid(self, cRow, cCol) -> bool:
+        maze = self.game.maze
+        if cCol < 0 or cCol > maze.cols - 1:
+            return True
+        cell = cRow * maze.cols + cCol
+        if self.game.occupancy[cell] & ~self.bit and not self.dead: # Another ghost is on that tile
+            return False
+        if maze.flags[cell] & navigation.GATE:
+            cY = cRow * subTiles
+            return bool((self.dead and self.y < cY) or (self.y > cY and not self.dead and not self.attacked and not self.game.lockedIn))
+        return bool(maze.flags[cell] & navigation.OPEN)
+
+    def setDir(self) -> None:
+        order = self.order
+        order[:] = (0, 1, 2, 3) # Shuffled from the same start every time, like a fresh list
+        self.game.rng.shuffle(order)
+        # Walkable targets are reached by shortest path, walls (random scatter targets) by straight-line distance
+        navigation = self.game.navigation
+        target = self.target
+        followPath = navigation.tileAt(int(target[0]), int(target[1])) != -1
+        best = 10000
+        bestDir = -1
+        for newDir in order:
+            # North and south need the ghost lined up with a column, east and west with a row
+            if (self.x if newDir % 2 == 0 else self.y) % subTiles:
+                continue
+            step = dirSteps[newDir]
+            nextY = self.y + step[0] * self.speed
+            nextX = self.x + step[1] * self.speed
+            if self.lastY == nextY and self.lastX == nextX:
+                continue
+            # Cell the ghost would enter
+            cellRow = -(-nextY // subTiles) if step[0] > 0 else nextY // subTiles
+            cellCol = -(-nextX // subTiles) if step[1] > 0 else nextX // subTiles
+            if followPath:
+                distance = navigation.distance(cellRow, cellCol, target[0], target[1])
+                if distance == -1:
+                    continue
+            else:
+                dR = target[0] - nextY / subTiles
+                dC = target[1] - nextX / subTiles
+                distance = math.sqrt((dR * dR) + (dC * dC))
+            if distance < best and self.isValid(cellRow, cellCol):
+                bestDir = newDir
+                best = distance
+        self.dir = bestDir
+
+    def setTarget(self) -> None:
+        gate = self.game.layout.gates[0]
+        if self.tile() == 4 and not self.dead:
+            self.aim(gate[0] - 1, gate[1] + 1)
+            return
+        if self.tile() == 4 and self.dead:
+            self.aim(self.y / subTiles, self.x / subTiles)
+        elif self.dead:
+            self.aim(gate[0] - 1, gate[1]) # In front of the gate
+            return
+
+        if self.game.ai is not None:
+            return # The AI picks its own targets, and the game's random numbers stay for the game
+        # Finds a target that will keep the ghosts dispersed
+        row, col = self.game.layout.targets.pick(self.game.rng, self.game.targetQuadrants)
+        self.aim(row, col)
+
+    # Sets the target tile and keeps the game's count of targets per quadrant in step
+    def aim(self, row, col) -> None:
+        self.target[0] = row
+        self.target[1] = col
+        quadrant = targetQuadrant(row, col)
+        if quadrant != self.quadrant:
+            counts = self.game.targetQuadrants
+            counts[self.quadrant] -= 1
+            counts[quadrant] += 1
+            self.quadrant = quadrant
+
+    def move(self) -> None:
+        self.lastY = self.y
+        self.lastX = self.x
+        y = self.y
+        x = self.x
+        if self.dir != -1:
+            step = dirSteps[self.dir]
+            y += step[0] * self.speed
+            x += step[1] * self.speed
+
+        # Incase they go through the middle tunnel
+        x %= self.game.maze.cols * subTiles
+        self.game.moveGhost(self, y, x)
+
+    def setAttacked(self, isAttacked) -> None:
+        self.attacked = isAttacked
+
+    def isAttacked(self):
+        return self.attacked
+
+    def setDead(self, isDead) -> None:
+        self.dead = isDead
+
+    def isDead(self):
+        return self.dead
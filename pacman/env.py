@@ -0,0 +1,164 @@
+import random
+
+import numpy as np
+
+from .engine import Game, boardCols, ghostColors, originalGameBoard, subTiles
+from .mazes import loadMaze
+
+# Agent-facing wrappers around Game with the reset()/step() shape of gymnasium,
+# without depending on it. Observations are planes over the board, written in
+# place into arrays allocated once:
+#   env = PacmanEnv(seed=1)
+#   observation, info = env.reset()
+#   observation, reward, terminated, truncated, info = env.step(EAST)
+# Both take the maze to play as a layout from mazes.loadMaze, the arcade maze
+# by default. Run from the folder holding the assets when frames are rendered,
+# and without a display set SDL_VIDEODRIVER=dummy before the first one.
+
+# Observation planes, each rows x cols
+WALLS, DOTS, POWER_PELLETS, PACMAN, RED, BLUE, PINK, ORANGE, FRIGHTENED = range(9)
+PLANES = 9
+ROWS = len(originalGameBoard)
+NORTH, EAST, SOUTH, WEST, NOOP = range(5) # Actions, NOOP keeps the last direction
+ACTIONS = 5
+
+
+# Adds an actor at a position in eighths of a tile, split over the two tiles it is between
+def markActor(plane, y, x, weight) -> None:
+    row, rowPart = divmod(y, subTiles)
+    col, colPart = divmod(x, subTiles)
+    if rowPart:
+        plane[row, col] += weight * (subTiles - rowPart) / subTiles
+        plane[row + 1, col] += weight * rowPart / subTiles
+    elif colPart:
+        plane[row, col] += weight * (subTiles - colPart) / subTiles
+        plane[row, (col + 1) % boardCols] += weight * colPart / subTiles
+    else:
+        plane[row, col] += weight
+
+
+# Draws a game into an RGB array off-screen, for recording or pixel-based agents
+# atlas comes from renderer.loadOffscreenAtlas and may be shared by many recorders
+class FrameRecorder:
+    def __init__(self, frame, layout=None, atlas=None) -> None:
+        import pygame
+
+        from .renderer import OffscreenRenderer
+
+        self.pygame = pygame
+        self.frame = frame # rows * square x cols * square x 3, filled by capture()
+        self.renderer = OffscreenRenderer(layout, atlas)
+        self.surface = self.renderer.screen
+
+    def attach(self, game) -> None:
+        game.observers.append(self.renderer)
+        self.renderer.render(game)
+
+    def capture(self, game) -> None:
+        self.renderer.drawFrame(game, 1.0)
+        pixels = self.pygame.surfarray.pixels3d(self.surface) # Locks the surface until it is released
+        np.copyto(self.frame, pixels.transpose(1, 0, 2))
+        del pixels
+
+
+class PacmanEnv:
+    # observation and frame may be views into bigger arrays and atlas shared, see VecPacmanEnv
+    def __init__(self, seed=None, maxTicks=100000, renderFrames=False, observation=None, frame=None,
+                 layout=None, atlas=None) -> None:
+        self.maxTicks = maxTicks
+        self.seeds = random.Random(seed) # Seeds of the following games when reset() is given none
+        self.layout = loadMaze() if layout is None else layout
+        self.observation = np.zeros((PLANES, ROWS, boardCols), dtype=np.float32) if observation is None else observation
+        self.observation[WALLS] = (np.frombuffer(self.layout.cells, dtype=np.uint8) == 3).reshape(ROWS, boardCols)
+        self.recorder = None
+        if renderFrames:
+            from .constants import square
+            self.frame = np.zeros((ROWS * square, boardCols * square, 3), dtype=np.uint8) if frame is None else frame
+            self.recorder = FrameRecorder(self.frame, self.layout, atlas)
+        self.game = None
+        self.cells = None
+        self.ticks = 0
+
+    def reset(self, seed=None):
+        if seed is None:
+            seed = self.seeds.getrandbits(32)
+        self.game = Game(1, 0, rng=random.Random(seed), layout=self.layout)
+        # Views of the board the game keeps updating, so reading it needs no copy
+        self.cells = np.frombuffer(self.game.cells, dtype=np.uint8).reshape(ROWS, boardCols)
+        self.ticks = 0
+        if self.recorder is not None:
+            self.recorder.attach(self.game)
+        self.observe()
+        return self.observation, self.info()
+
+    def step(self, action):
+        game = self.game
+        if not game.started:
+            game.start() # Any action starts the round again after a death, like a key press
+        if action != NOOP:
+            game.pacman.newDir = int(action)
+        score = game.score
+        game.update()
+        self.ticks += 1
+        self.observe()
+        if self.recorder is not None:
+            self.recorder.capture(game)
+        terminated = not game.running
+        truncated = not terminated and self.ticks >= self.maxTicks
+        return self.observation, game.score - score, terminated, truncated, self.info()
+
+    def observe(self) -> None:
+        game = self.game
+        observation = self.observation
+        np.equal(self.cells, 2, out=observation[DOTS])
+        np.greater_equal(self.cells, 5, out=observation[POWER_PELLETS]) # 5 and 6 are the two colors of a power pellet
+        observation[PACMAN:].fill(0)
+        markActor(observation[PACMAN], game.pacman.y, game.pacman.x, 1)
+        for ghost in game.ghosts:
+            markActor(observation[RED + ghostColors.index(ghost.color)], ghost.y, ghost.x, 1) # A maze may leave some colours out
+            if ghost.attacked and not ghost.dead:
+                # Share of the frightened time that is left
+                markActor(observation[FRIGHTENED], ghost.y, ghost.x, 1 - ghost.attackedCount / ghost.attackedTimer)
+
+    def info(self):
+        game = self.game
+        return {"score": game.score, "lives": game.lives, "level": game.level, "ticks": self.ticks}
+
+
+# Steps many games in lockstep; observations, rewards and frames share one array each.
+# A game that ends is reset right away, its last info is kept under "final"
+class VecPacmanEnv:
+    def __init__(self, count, seed=None, maxTicks=100000, renderFrames=False, layout=None) -> None:
+        self.observations = np.zeros((count, PLANES, ROWS, boardCols), dtype=np.float32)
+        self.rewards = np.zeros(count, dtype=np.float32)
+        self.terminated = np.zeros(count, dtype=bool)
+        self.truncated = np.zeros(count, dtype=bool)
+        self.frames = None
+        atlas = None
+        if renderFrames:
+            from .constants import square
+            from .renderer import loadOffscreenAtlas
+            self.frames = np.zeros((count, ROWS * square, boardCols * square, 3), dtype=np.uint8)
+            atlas = loadOffscreenAtlas() # One set of sprites for every game's renderer
+        seeds = random.Random(seed)
+        self.envs = [PacmanEnv(seeds.getrandbits(32), maxTicks, renderFrames, self.observations[index],
+                               None if self.frames is None else self.frames[index], layout, atlas) for index in range(count)]
+
+    def reset(self, seed=None):
+        infos = []
+        for index, env in enumerate(self.envs):
+            infos.append(env.reset(None if seed is None else seed + index)[1])
+        return self.observations, infos
+
+    def step(self, actions):
+        infos = []
+        for index, (env, action) in enumerate(zip(self.envs, actions)):
+            _, reward, terminated, truncated, info = env.step(action) # The observation is already in self.observations
+            self.rewards[index] = reward
+            self.terminated[index] = terminated
+            self.truncated[index] = truncated
+            if terminated or truncated:
+                info = {"final": info}
+                env.reset()
+            infos.append(info)
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
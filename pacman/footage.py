@@ -0,0 +1,189 @@
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+from . import replay
+from .constants import tickRate
+from .ghostai import GhostAI
+from .mazes import findMaze
+from .selfplay import CONTROLLERS
+from .simulate import playGame
+
+# Records games without a window, e.g. a game of a selfplay run by its seed:
+#   python -m pacman.footage --seed 42 --controller pellets --output game42.mp4
+#   python -m pacman.footage --replay Assets/Data/LastGame.replay --skip 2 --scale 0.5 --output frames
+#   python -m pacman.footage --seed 42 --output - | ffmpeg -f rawvideo -pix_fmt rgb24 -s 560x720 -r 30 -i - game.mp4
+# --output - streams raw RGB frames to stdout, a .rgb file holds the same
+# stream, a folder gets one PPM image per frame, and any other file name is
+# encoded by ffmpeg (.mp4, .gif, .webm...) when it is installed.
+# Run it from the folder holding the assets, like the game. pygame is only
+# imported by main(), once SDL has been told to run without a display.
+
+RGB_MASKS = (0xFF, 0xFF00, 0xFF0000, 0) # 24-bit pixels with red in the first byte, so the pixels are an RGB frame
+
+
+# Size of the frames of a surface scaled by scale. Encoders want even sizes, and rows of
+# whole 4-byte words leave no padding between the rows of a frame
+def frameSize(size, scale):
+    return max(4, int(size[0] * scale) // 4 * 4), max(2, int(size[1] * scale) // 2 * 2)
+
+
+# Turns the drawn surface into RGB frames for a sink, keeping one tick in every skip and scaling by scale
+class FrameExporter:
+    def __init__(self, renderer, sink, skip=1, scale=1.0) -> None:
+        import pygame
+
+        self.pygame = pygame
+        self.renderer = renderer
+        self.sink = sink
+        self.skip = skip
+        self.size = frameSize(renderer.screen.get_size(), scale)
+        self.scaled = None if self.size == renderer.screen.get_size() else self.pygame.Surface(self.size, 0, renderer.screen)
+        self.frame = self.pygame.Surface(self.size, 0, 24, RGB_MASKS)
+        self.game = None
+        self.ticks = 0
+        self.frames = 0
+        self.bytes = 0
+        self.drawTime = 0.0
+        self.writeTime = 0.0
+
+    # Call after every tick, the renderer has to be one of the game's observers
+    def capture(self, game) -> None:
+        self.ticks += 1
+        if (self.ticks - 1) % self.skip:
+            return
+        start = time.perf_counter()
+        if game is not self.game: # First frame of a game, the board has never been drawn
+            self.game = game
+            self.renderer.render(game)
+        self.renderer.drawFrame(game, 1.0)
+        if self.scaled is None:
+            self.frame.blit(self.renderer.screen, (0, 0))
+        else:
+            self.pygame.transform.smoothscale(self.renderer.screen, self.size, self.scaled)
+            self.frame.blit(self.scaled, (0, 0))
+        drawn = time.perf_counter()
+        view = self.frame.get_view("0") # The surface's own pixels, handed to the sink without a copy
+        self.sink.write(view)
+        self.bytes += view.length
+        del view # Unlocks the surface for the next frame
+        self.frames += 1
+        self.drawTime += drawn - start
+        self.writeTime += time.perf_counter() - drawn
+
+    def report(self, elapsed):
+        return "{} frames of {}x{} from {} ticks in {:.2f} s: {:.0f} frames/s, {:.1f} MB/s (drawing {:.2f} s, writing {:.2f} s)".format(
+            self.frames, self.size[0], self.size[1], self.ticks, elapsed, self.frames / elapsed,
+            self.bytes / elapsed / 1e6, self.drawTime, self.writeTime)
+
+
+# Writes frames one after the other, as rawvideo rgb24
+class RawSink:
+    def __init__(self, file) -> None:
+        self.file = file
+
+    def write(self, frame) -> None:
+        self.file.write(frame)
+
+    def close(self) -> None:
+        self.file.flush()
+
+# One binary PPM per frame, which encoders read as frame-%06d.ppm
+class SequenceSink:
+    def __init__(self, folder, size) -> None:
+        os.makedirs(folder, exist_ok=True)
+        self.pattern = os.path.join(folder, "frame-{:06d}.ppm")
+        self.header = "P6\n{} {}\n255\n".format(size[0], size[1]).encode()
+        self.frames = 0
+
+    def write(self, frame) -> None:
+        with open(self.pattern.format(self.frames), "wb") as file:
+            file.write(self.header)
+            file.write(frame)
+        self.frames += 1
+
+    def close(self) -> None:
+        pass
+
+# Pipes the frames into ffmpeg, which picks the format from the file extension
+class EncoderSink(RawSink):
+    def __init__(self, fileName, size, frameRate) -> None:
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise SystemExit("ffmpeg is needed to write " + fileName + ", give a folder or a .rgb file as --output instead")
+        command = [ffmpeg, "-loglevel", "error", "-y", "-f", "rawvideo", "-pix_fmt", "rgb24",
+                   "-s", "{}x{}".format(size[0], size[1]), "-r", str(frameRate), "-i", "-"]
+        if fileName.endswith(".gif"):
+            command += ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+        else:
+            command += ["-pix_fmt", "yuv420p"]
+        self.process = subprocess.Popen(command + [fileName], stdin=subprocess.PIPE)
+        super().__init__(self.process.stdin)
+
+    def close(self) -> None:
+        self.file.close()
+        if self.process.wait() != 0:
+            raise SystemExit("ffmpeg could not encode the video")
+
+def openSink(output, size, frameRate):
+    if output == "-":
+        return RawSink(sys.stdout.buffer)
+    if output.endswith(".rgb"):
+        return RawSink(open(output, "wb"))
+    if os.path.isdir(output) or not os.path.splitext(output)[1]:
+        return SequenceSink(output, size)
+    return EncoderSink(output, size, frameRate)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record a headless Pacman game as video or raw RGB frames")
+    parser.add_argument("--output", required=True, help="- for raw RGB on stdout, a .rgb file, a folder of PPM frames or a video file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--controller", choices=sorted(CONTROLLERS), default="random")
+    parser.add_argument("--replay", help="record a replay file instead of a seeded game")
+    parser.add_argument("--maze", help="name of a maze in pacman/mazes or path of a maze file")
+    parser.add_argument("--ghosts", choices=["original", "classic"], default="original")
+    parser.add_argument("--max-ticks", type=int, default=100000)
+    parser.add_argument("--skip", type=int, default=1, help="keep one tick in every SKIP")
+    parser.add_argument("--scale", type=float, default=1.0)
+    args = parser.parse_args()
+    log = sys.stderr if args.output == "-" else sys.stdout # stdout may be carrying the frames
+    skip = max(1, args.skip)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # Its banner would land in the frames on stdout
+    from .renderer import OffscreenRenderer
+
+    if args.replay:
+        seed, ticks, _, layout, ai, events = replay.load(args.replay) # Played on the maze and with the ghosts it was recorded with
+    else:
+        layout = findMaze(args.maze)
+    renderer = OffscreenRenderer(layout)
+    size = frameSize(renderer.screen.get_size(), args.scale)
+    frameRate = tickRate / skip
+    exporter = FrameExporter(renderer, openSink(args.output, size, frameRate), skip, args.scale)
+    if args.output == "-":
+        print("ffmpeg -f rawvideo -pix_fmt rgb24 -s {}x{} -r {:g} -i - game.mp4".format(size[0], size[1], frameRate), file=log)
+
+    start = time.perf_counter()
+    try:
+        if args.replay:
+            replay.play(seed, min(ticks, args.max_ticks), events, observers=[renderer], onTick=exporter.capture, layout=layout, ai=ai)
+        else:
+            # The same controller and seeds as selfplay, so a game of a run can be looked at by its seed
+            control = CONTROLLERS[args.controller](random.Random("input-" + str(args.seed)))
+            ai = GhostAI() if args.ghosts == "classic" else None
+            playGame(args.seed, control, args.max_ticks, observers=[renderer], layout=layout, ai=ai, onTick=exporter.capture)
+        exporter.sink.close()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno()) # Nothing is left to flush into at exit
+        print("The output was closed, recording stopped", file=log)
+    elapsed = time.perf_counter() - start
+    if exporter.game is not None:
+        print("score {}, level {}".format(exporter.game.score, exporter.game.level), file=log)
+    print(exporter.report(elapsed), file=log)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import time
+import weakref
+
+from . import navigation
+from .engine import dirSteps, subTiles
+
+# Ghost brains a Game can be given instead of the original random targets.
+# Each colour has its own strategy, like the arcade: the red ghost chases
+# pacman, pink cuts him off, blue flanks him with red and orange keeps its
+# distance; in scatter they head for their own corners and when frightened
+# they turn at random. Turns are only decided on junction tiles and the
+# direction is kept along the corridor up to the next one:
+#   game = Game(1, 0, ai=GhostAI())
+# or python -m pacman.simulate --ghosts classic to compare with the original.
+
+# The arcade breaks ties between directions in this order: north, west, south, east
+TIE_ORDER = (0, 3, 2, 1)
+FAR = 10000
+
+turnCells = {} # MazeGraph -> cells on which a ghost may have to change direction, shared by every game
+
+
+# Cells where a ghost decides: junctions of the maze graph and the tiles on either side of a gate,
+# which the graph counts as plain corridor since the gate is a wall to pacman
+def decisionCells(maze):
+    cells = turnCells.get(maze)
+    if cells is None:
+        cells = bytearray(len(maze.flags))
+        for cell, flags in enumerate(maze.flags):
+            if flags & navigation.OPEN and flags & navigation.JUNCTION:
+                cells[cell] = 1
+            elif flags & navigation.GATE:
+                for neighbour in (cell - maze.cols, cell + maze.cols):
+                    if 0 <= neighbour < len(cells):
+                        cells[neighbour] = 1
+        turnCells[maze] = cells
+    return cells
+
+def pacmanTile(game):
+    return game.pacman.y // subTiles, game.pacman.x // subTiles
+
+# Tile count tiles in front of pacman
+def aheadOfPacman(game, count):
+    row, col = pacmanTile(game)
+    step = dirSteps[game.pacman.dir]
+    return row + step[0] * count, col + step[1] * count
+
+
+# What a GhostAI keeps about each game it steers
+class Steering:
+    def __init__(self, game) -> None:
+        self.cells = decisionCells(game.maze)
+        self.cols = game.maze.cols
+        self.modes = [None] * len(game.ghosts) # Mode each ghost last decided in, a new mode lets it reverse
+        self.decidedThisTick = 0
+
+
+# Targeting of one ghost colour. Targets are tiles and may lie off the maze, such as the
+# scatter corners, ghosts then steer by straight-line distance instead of by path
+class Strategy:
+    # Scatter corner in board rows and columns, negative ones count from the bottom right
+    def __init__(self, cornerRow, cornerCol) -> None:
+        self.cornerRow = cornerRow
+        self.cornerCol = cornerCol
+
+    def scatterTarget(self, ghost, game):
+        return self.cornerRow % game.layout.rows, self.cornerCol % game.layout.cols
+
+    def chaseTarget(self, ghost, game):
+        return pacmanTile(game)
+
+    # choices are (direction, row, col) the ghost can take
+    def frightenedTurn(self, ghost, game, choices):
+        return choices[game.rng.randrange(len(choices))][0]
+
+# Red: straight for pacman's tile
+class Chaser(Strategy):
+    pass
+
+# Pink: four tiles in front of pacman
+class Ambusher(Strategy):
+    def chaseTarget(self, ghost, game):
+        return aheadOfPacman(game, 4)
+
+# Blue: the tile two in front of pacman, mirrored through it from the red ghost
+class Flanker(Strategy):
+    def chaseTarget(self, ghost, game):
+        row, col = aheadOfPacman(game, 2)
+        for other in game.ghosts:
+            if other.color == "red":
+                return 2 * row - other.y // subTiles, 2 * col - other.x // subTiles
+        return pacmanTile(game)
+
+# Orange: chases pacman from afar, backs off to its corner within eight tiles of him
+class Shy(Strategy):
+    def chaseTarget(self, ghost, game):
+        row, col = pacmanTile(game)
+        rows = row - ghost.y // subTiles
+        cols = col - ghost.x // subTiles
+        if rows * rows + cols * cols > 64:
+            return row, col
+        return self.scatterTarget(ghost, game)
+
+# Colour -> strategy of the arcade ghosts
+CLASSIC = {"red": Chaser(0, -3), "pink": Ambusher(0, 2), "blue": Flanker(-1, -1), "orange": Shy(-1, 0)}
+
+
+class GhostAI:
+    # strategies: ghost colour -> Strategy. budget: most turns decided in one tick, None for no limit;
+    # a ghost over budget keeps its direction through the junction. The budget is counted in decisions
+    # rather than time so that a seeded game plays the same on any machine.
+    # One GhostAI can steer many games, one after another or side by side; the budget holds for
+    # each game's tick and the stats add up over all of them
+    def __init__(self, strategies=None, budget=None) -> None:
+        self.strategies = CLASSIC if strategies is None else strategies
+        self.budget = budget
+        self.games = weakref.WeakKeyDictionary() # Game -> Steering, dropped with the game
+        self.ticks = 0
+        self.decisions = 0
+        self.deferred = 0
+        self.nanoseconds = 0 # Spent deciding
+
+    def attach(self, game) -> None:
+        self.games[game] = Steering(game)
+
+    def beginTick(self, game) -> None:
+        self.ticks += 1
+        self.games[game].decidedThisTick = 0
+
+    def mode(self, ghost):
+        if ghost.dead:
+            return "dead"
+        if ghost.attacked:
+            return "frightened"
+        if ghost.tile() == 4:
+            return "leaving"
+        return "chase" if ghost.game.ghostStates[ghost.number][0] == 0 else "scatter"
+
+    # Sets ghost.dir for this tick's move
+    def steer(self, ghost) -> None:
+        steering = self.games[ghost.game]
+        y = ghost.y
+        x = ghost.x
+        direction = ghost.dir
+        if y % subTiles or x % subTiles:
+            # Between two tiles the ghost keeps going, unless it was put there facing across the corridor
+            if direction != -1 and (x if direction % 2 == 0 else y) % subTiles == 0:
+                return
+            self.decide(ghost, self.mode(ghost), True)
+            return
+        mode = self.mode(ghost)
+        changed = mode != steering.modes[ghost.number]
+        if not changed and direction != -1:
+            step = dirSteps[direction]
+            row = y // subTiles
+            col = x // subTiles
+            if ghost.isValid(row + step[0], col + step[1]):
+                if not steering.cells[row * steering.cols + col]:
+                    return # Along a corridor
+                if self.budget is not None and steering.decidedThisTick >= self.budget:
+                    self.deferred += 1
+                    return
+        # A ghost only turns back when its mode changed, or when there is no other way,
+        # but not just out of the house or on its way back in
+        self.decide(ghost, mode, changed and steering.modes[ghost.number] not in ("leaving", "dead"))
+
+    def decide(self, ghost, mode, mayReverse) -> None:
+        start = time.perf_counter_ns()
+        game = ghost.game
+        back = -1 if mayReverse or ghost.dir == -1 else (ghost.dir + 2) % 4
+        choices = self.choices(ghost, back)
+        if not choices and back != -1:
+            choices = self.choices(ghost, -1) # Dead end
+        target = self.target(ghost, mode)
+        ghost.aim(target[0], target[1])
+        if not choices or (mode == "dead" and ghost.y == target[0] * subTiles and ghost.x == target[1] * subTiles):
+            ghost.dir = -1 # Boxed in, or home and waiting to come back to life
+        elif mode == "frightened":
+            ghost.dir = self.strategies[ghost.color].frightenedTurn(ghost, game, choices)
+        else:
+            ghost.dir = self.closest(game, choices, target)
+        steering = self.games[game]
+        steering.modes[ghost.number] = mode
+        steering.decidedThisTick += 1
+        self.decisions += 1
+        self.nanoseconds += time.perf_counter_ns() - start
+
+    def target(self, ghost, mode):
+        game = ghost.game
+        gate = game.layout.gates[0]
+        if mode == "dead":
+            return gate[0] + 2, gate[1] # Inside the house
+        if mode == "leaving":
+            return gate[0] - 1, gate[1] # In front of the gate
+        strategy = self.strategies[ghost.color]
+        if mode == "chase":
+            return strategy.chaseTarget(ghost, game)
+        return strategy.scatterTarget(ghost, game)
+
+    # Directions the ghost can move in from where it is, as (direction, row, col) of the tile it would enter
+    def choices(self, ghost, back):
+        y = ghost.y
+        x = ghost.x
+        found = []
+        for direction in TIE_ORDER:
+            # North and south need the ghost lined up with a column, east and west with a row
+            if direction == back or (x if direction % 2 == 0 else y) % subTiles:
+                continue
+            step = dirSteps[direction]
+            row = -(-(y + step[0]) // subTiles) if step[0] > 0 else (y + step[0]) // subTiles
+            col = -(-(x + step[1]) // subTiles) if step[1] > 0 else (x + step[1]) // subTiles
+            if ghost.isValid(row, col):
+                found.append((direction, row, col))
+        return found
+
+    # Direction whose tile is nearest the target, by path when the target is walkable
+    def closest(self, game, choices, target):
+        table = game.navigation
+        targetRow, targetCol = target
+        followPath = 0 <= targetCol < table.cols and table.tileAt(targetRow, targetCol) != -1
+        best = None
+        bestDirection = -1
+        for direction, row, col in choices:
+            if followPath:
+                distance = table.distance(row, col, targetRow, targetCol)
+                if distance == -1:
+                    distance = FAR
+            else:
+                distance = (row - targetRow) ** 2 + (col - targetCol) ** 2
+            if best is None or distance < best:
+                best = distance
+                bestDirection = direction
+        return bestDirection
+
+    def report(self):
+        seconds = self.nanoseconds / 1e9
+        return "ghost AI: {} decisions in {} ticks ({:.2f} per tick, {} deferred), {:.0f} decisions/s, {:.1f} us each".format(
+            self.decisions, self.ticks, self.decisions / max(self.ticks, 1), self.deferred,
+            self.decisions / seconds if seconds else 0, self.nanoseconds / 1000 / max(self.decisions, 1))
@@ -0,0 +1,29 @@
+import pygame
+
+from .constants import TextPath
+
+
+# Rows of TextImages tiles composed into one surface per string, so a label
+# or a number is a single blit instead of one per letter
+class GlyphCache:
+    def __init__(self, atlas) -> None:
+        self.atlas = atlas
+        self.surfaces = {} # (tile ids, size) -> composed surface
+
+    def compose(self, tiles, size):
+        key = (tuple(tiles), size)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((size * len(tiles), size)).convert()
+            surface.fill((0, 0, 0))
+            for i in range(len(tiles)):
+                glyph = self.atlas.get(TextPath, tiles[i], size)
+                surface.blit(glyph, (i * size, 0))
+                if glyph.get_colorkey() is not None:
+                    surface.set_colorkey((0, 0, 0))
+            self.surfaces[key] = surface
+        return surface
+
+    # Digit glyphs are consecutive tiles starting at firstTile
+    def digits(self, text, firstTile, size):
+        return self.compose([firstTile + int(digit) for digit in text], size)
@@ -0,0 +1,115 @@
+import contextlib
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+# Opt-in timing of the main loop. Set PACMAN_TRACE to a file name to record
+# every phase and write it as a Chrome trace (chrome://tracing, Perfetto)
+# on exit; F3 toggles a graph of recent frame times in either case.
+
+MAX_EVENTS = 1000000 # About 100 MB of trace, older events are dropped past this
+GRAPH_FRAMES = 80
+
+
+class Instrumentation:
+    def __init__(self, traceFile=None) -> None:
+        self.traceFile = traceFile
+        self.tracing = traceFile is not None
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.origin = time.perf_counter()
+        self.frameStart = None
+        self.frameTimes = deque(maxlen=GRAPH_FRAMES) # Busy milliseconds of recent frames
+        self.showGraph = False
+        self.graphRect = pygame.Rect(476, 2, GRAPH_FRAMES, 36) # Top right, clear of the high score and the title
+
+    def record(self, name, start, end) -> None:
+        self.events.append({"name": name, "cat": "pacman", "ph": "X", "pid": os.getpid(), "tid": 0,
+                            "ts": (start - self.origin) * 1000000, "dur": (end - start) * 1000000})
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not self.tracing:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    # Traces every call of obj.name under label, obj can be an instance or a class
+    def wrap(self, obj, name, label) -> None:
+        if not self.tracing:
+            return
+        original = getattr(obj, name)
+        def traced(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.record(label, start, time.perf_counter())
+        setattr(obj, name, traced)
+
+    # Called right after the frame limiter, so sleeping is not counted as work
+    def beginFrame(self) -> None:
+        self.frameStart = time.perf_counter()
+
+    def endFrame(self, screen) -> None:
+        end = time.perf_counter()
+        self.frameTimes.append((end - self.frameStart) * 1000)
+        if self.tracing:
+            self.record("frame", self.frameStart, end)
+        if self.showGraph:
+            self.drawGraph(screen)
+
+    def toggleGraph(self, screen) -> None:
+        self.showGraph = not self.showGraph
+        if not self.showGraph:
+            screen.fill((0, 0, 0), self.graphRect)
+            pygame.display.update(self.graphRect)
+
+    # One bar per frame, 2 px per millisecond; the line marks 16.7 ms, bars past it are red
+    def drawGraph(self, screen) -> None:
+        rect = self.graphRect
+        screen.fill((0, 0, 0), rect)
+        budget = rect.bottom - 1 - int(1000 / 60 * 2)
+        pygame.draw.line(screen, (80, 80, 80), (rect.left, budget), (rect.right - 1, budget))
+        x = rect.right - len(self.frameTimes)
+        for frameTime in self.frameTimes:
+            height = min(rect.height, max(1, int(frameTime * 2)))
+            color = (220, 60, 60) if frameTime > 1000 / 60 else (60, 200, 60)
+            pygame.draw.line(screen, color, (x, rect.bottom - 1), (x, rect.bottom - height))
+            x += 1
+        pygame.display.update(rect)
+
+    def save(self) -> None:
+        if not self.tracing:
+            return
+        with open(self.traceFile, "w") as file:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, file)
+
+
+# Times the phases of startup, which also show up in the trace when one is recorded
+class StartupTimer:
+    def __init__(self, instrument) -> None:
+        self.instrument = instrument
+        self.start = time.perf_counter()
+        self.phases = [] # [name, seconds]
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append([name, end - start])
+            if self.instrument.tracing:
+                self.instrument.record("startup: " + name, start, end)
+
+    def report(self) -> str:
+        phases = ", ".join("{} {:.1f} ms".format(name, seconds * 1000) for name, seconds in self.phases)
+        return "Startup: {}; ready after {:.1f} ms".format(phases, (time.perf_counter() - self.start) * 1000)
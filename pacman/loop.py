@@ -0,0 +1,72 @@
+import time
+
+
+# Runs the game logic at a fixed tick rate however fast frames are drawn.
+# A slow frame is caught up with extra ticks, and alpha() tells the renderer
+# how far the clock already is into the next tick.
+class FixedStepLoop:
+    def __init__(self, tickRate, maxCatchUp=5, clock=time.perf_counter) -> None:
+        self.step = 1 / tickRate
+        self.maxCatchUp = maxCatchUp # Most ticks run in one frame before time is given up
+        self.clock = clock
+        self.accumulator = 0.0
+        self.lastTime = None
+        # Counters since the last report
+        self.frames = 0
+        self.ticks = 0
+        self.frameTime = 0.0
+        self.tickTime = 0.0
+        self.droppedFrames = 0 # Ticks that were never drawn because logic ran behind
+        self.lastReport = clock()
+
+    # Forgets elapsed time, e.g. after sitting on the launch screen
+    def reset(self) -> None:
+        self.accumulator = 0.0
+        self.lastTime = None
+
+    # Runs as many ticks as the time since the last frame calls for
+    def advance(self, update):
+        now = self.clock()
+        if self.lastTime is None:
+            self.lastTime = now - self.step # The first frame runs one tick
+        elapsed = now - self.lastTime
+        self.lastTime = now
+        self.frames += 1
+        self.frameTime += elapsed
+        self.accumulator += elapsed
+
+        ticks = 0
+        while self.accumulator >= self.step:
+            if ticks == self.maxCatchUp:
+                # Too far behind, the simulation slows down instead of spiralling
+                self.droppedFrames += int(self.accumulator / self.step)
+                self.accumulator %= self.step
+                break
+            start = self.clock()
+            update()
+            self.tickTime += self.clock() - start
+            self.accumulator -= self.step
+            ticks += 1
+        if ticks > 1:
+            self.droppedFrames += ticks - 1
+        self.ticks += ticks
+        return ticks
+
+    def alpha(self):
+        return self.accumulator / self.step
+
+    # Averages since the last report, at most once per interval seconds
+    def report(self, interval=1.0):
+        now = self.clock()
+        if now - self.lastReport < interval or self.frames == 0:
+            return None
+        text = "{:.0f} fps | frame {:.2f} ms | tick {:.2f} ms | dropped {}".format(
+            self.frames / (now - self.lastReport), self.frameTime / self.frames * 1000,
+            self.tickTime / max(self.ticks, 1) * 1000, self.droppedFrames)
+        self.frames = 0
+        self.ticks = 0
+        self.frameTime = 0.0
+        self.tickTime = 0.0
+        self.droppedFrames = 0
+        self.lastReport = now
+        return text
@@ -0,0 +1,324 @@
+import hashlib
+import json
+import os
+import struct
+from array import array
+
+from . import navigation
+from .constants import DataPath
+
+# Mazes are text files like mazes/classic.maze. The first time a maze is
+# loaded it is compiled into Assets/Data/maze-<hash>.bin holding everything
+# derived from it: board bytes, wall sprites, pellets and navigation tables.
+# Later loads read that back instead of parsing and deriving again, and any
+# edit to the maze file changes the hash and so recompiles it.
+
+MazeFolder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mazes")
+CLASSIC = os.path.join(MazeFolder, "classic.maze")
+
+# 1: Empty Space 2: Tic-Tak 3: Wall 4: Ghost safe-space 6: Special Tic-Tak; a gate is a wall ghosts may cross
+TILES = {" ": 1, ".": 2, "#": 3, "-": 3, "_": 4, "o": 6}
+# The window is laid out for the arcade maze: score rows above it, lives rows below
+MAZE_ROWS = 31
+MAZE_COLS = 28
+TOP_ROWS = 3
+BOTTOM_ROWS = 2
+GHOST_COLORS = ["red", "blue", "pink", "orange"]
+# Random ghost targets are drawn from the first board rows, in quadrants split at a row and a column
+TARGET_ROWS = 31
+QUADRANT_ROW = 15
+QUADRANT_COL = 13
+
+# Compiled maze: magic, version, settings length, dots, power pellets, navigation length
+CACHE_HEADER = struct.Struct("<4sBIHHI")
+CACHE_MAGIC = b"PACM"
+CACHE_VERSION = 1
+
+layouts = {} # Maze file -> MazeLayout, shared by every game in the process
+
+
+# Remaining pellets of a board, kept up to date as they are eaten instead of counted from the board
+class PelletIndex:
+    def __init__(self, cells) -> None:
+        self.dots = {cell for cell in range(len(cells)) if cells[cell] == 2}
+        self.powerPellets = [cell for cell in range(len(cells)) if cells[cell] == 5 or cells[cell] == 6]
+
+    def copy(self):
+        pellets = PelletIndex(b"")
+        pellets.dots = set(self.dots)
+        pellets.powerPellets = list(self.powerPellets)
+        return pellets
+
+    def remove(self, cell) -> None:
+        if cell in self.dots:
+            self.dots.remove(cell)
+        else:
+            self.powerPellets.remove(cell)
+
+    def __len__(self):
+        return len(self.dots) + len(self.powerPellets)
+
+
+# Quadrant of a target tile: 0 top right, 1 top left, 2 bottom left, 3 bottom right; any position has one
+def targetQuadrant(row, col):
+    if row <= QUADRANT_ROW:
+        return 0 if col >= QUADRANT_COL else 1
+    return 2 if col < QUADRANT_COL else 3
+
+
+# Tiles a ghost can pick as a random target, by quadrant, so a pick is one random number
+class TargetIndex:
+    def __init__(self, cells, cols) -> None:
+        self.cols = cols
+        self.quadrants = [array("H") for _ in range(4)] # Cells of each quadrant, walkable ones first
+        self.walkable = [0, 0, 0, 0] # Number of walkable cells at the start of each quadrant
+        walls = [array("H") for _ in range(4)]
+        for cell in range(min(TARGET_ROWS * cols, len(cells))):
+            quadrant = targetQuadrant(cell // cols, cell % cols)
+            if cells[cell] == 3 or cells[cell] == 4: # Walls and the ghost house
+                walls[quadrant].append(cell)
+            else:
+                self.quadrants[quadrant].append(cell)
+                self.walkable[quadrant] += 1
+        for quadrant in range(4):
+            self.quadrants[quadrant] += walls[quadrant]
+
+    # Uniform over the walkable tiles, and over every tile of the quadrants no ghost is heading for,
+    # given how many ghost targets are in each quadrant; returns (row, col)
+    def pick(self, rng, counts):
+        sizes = [len(self.quadrants[quadrant]) if counts[quadrant] == 0 else self.walkable[quadrant] for quadrant in range(4)]
+        index = rng.randrange(sizes[0] + sizes[1] + sizes[2] + sizes[3])
+        for quadrant in range(4):
+            if index < sizes[quadrant]:
+                return divmod(self.quadrants[quadrant][index], self.cols)
+            index -= sizes[quadrant]
+
+
+class MazeLayout:
+    def __init__(self, settings, board) -> None:
+        self.settings = settings # As read from the maze file, saved with the compiled maze
+        self.name = settings["name"]
+        self.lastLevel = settings["levels"] # The game ends after clearing this level
+        self.board = board # Rows of tiles, score and lives rows included
+        self.rows = len(board)
+        self.cols = len(board[0])
+        self.cells = bytes(tile for row in board for tile in row)
+        self.targets = TargetIndex(self.cells, self.cols)
+        # Positions in board rows, the maze file counts from the first maze row
+        self.gates = [[row + TOP_ROWS, col] for row, col in settings["gates"]]
+        self.pacmanStart = (settings["pacman"][0] + TOP_ROWS, settings["pacman"][1])
+        self.ghostStarts = [(row + TOP_ROWS, col, color, index) for index, (color, row, col) in enumerate(settings["ghosts"])]
+        self.berryLocation = (settings["berry"][0] + TOP_ROWS, settings["berry"][1])
+        self.ready = (settings["ready"][0] + TOP_ROWS, settings["ready"][1])
+        self.fileName = None # Set by loadMaze
+        # Derived by compile() or read from the compiled maze
+        self.wallSprites = None # BoardImages tile drawn on each cell, -1 for none
+        self.pellets = None
+        self.navigation = None
+
+    def compile(self) -> None:
+        if self.settings["sprites"] == "position":
+            self.wallSprites = positionSprites(self.board)
+        else:
+            self.wallSprites = matchedSprites(self.board, self.gates)
+        self.pellets = PelletIndex(self.cells)
+        self.navigation = navigation.NavigationTable(self.board, self.gates)
+        self.navigation.build()
+
+    def pack(self):
+        settings = json.dumps(self.settings).encode()
+        table = self.navigation.tobytes()
+        dots = sorted(self.pellets.dots)
+        return b"".join([
+            CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(settings), len(dots), len(self.pellets.powerPellets), len(table)),
+            settings, self.cells, self.wallSprites.tobytes(),
+            array("H", dots).tobytes(), array("H", self.pellets.powerPellets).tobytes(), table,
+        ])
+
+
+def mazeError(fileName, message):
+    return ValueError(fileName + ": " + message)
+
+def readMaze(fileName):
+    with open(fileName, encoding="utf-8") as file:
+        return parseMaze(file.read(), fileName)
+
+def parseMaze(text, fileName="<maze>"):
+    settings = {"name": os.path.splitext(os.path.basename(fileName))[0], "levels": 8, "ghosts": [], "gates": [], "sprites": "matched"}
+    lines = text.splitlines()
+    start = None
+    for number, line in enumerate(lines):
+        if not line.strip() or line.startswith("#"):
+            continue
+        key, _, value = line.partition(":")
+        key = key.strip()
+        values = value.split()
+        if key == "board":
+            start = number + 1
+            break
+        if key in ("pacman", "berry", "ready") and len(values) == 2:
+            settings[key] = [float(values[0]), float(values[1])]
+        elif key == "ghost" and len(values) == 3 and values[0] in GHOST_COLORS:
+            settings["ghosts"].append([values[0], float(values[1]), float(values[2])])
+        elif key == "levels" and len(values) == 1:
+            settings["levels"] = int(values[0])
+        elif key == "name":
+            settings["name"] = value.strip()
+        elif key == "sprites" and values in (["position"], ["matched"]):
+            settings["sprites"] = values[0]
+        else:
+            raise mazeError(fileName, "line " + str(number + 1) + ": cannot read " + repr(line))
+    for key in ("pacman", "berry", "ready"):
+        if key not in settings:
+            raise mazeError(fileName, "no " + key + " position")
+    colors = [color for color, row, col in settings["ghosts"]]
+    if not colors or len(set(colors)) != len(colors):
+        raise mazeError(fileName, "needs one to four ghosts of different colors")
+    if start is None:
+        raise mazeError(fileName, "no board")
+
+    rows = lines[start:]
+    while rows and not rows[-1].strip():
+        rows.pop()
+    if len(rows) != MAZE_ROWS or any(len(row) > MAZE_COLS for row in rows):
+        raise mazeError(fileName, "the board must be " + str(MAZE_ROWS) + " rows of " + str(MAZE_COLS) + " tiles")
+    board = [[3] * MAZE_COLS for _ in range(TOP_ROWS)]
+    for row, line in enumerate(rows):
+        line = line.ljust(MAZE_COLS) # Editors drop trailing spaces
+        for col, char in enumerate(line):
+            if char not in TILES:
+                raise mazeError(fileName, "unknown tile " + repr(char) + " in board row " + str(row + 1))
+            if char == "-":
+                settings["gates"].append([row, col])
+        board.append([TILES[char] for char in line])
+    board += [[3] * MAZE_COLS for _ in range(BOTTOM_ROWS)]
+    if not settings["gates"]:
+        raise mazeError(fileName, "no ghost gate")
+    return MazeLayout(settings, board)
+
+# Reads a compiled maze, None when it is missing or from another version
+def unpackLayout(data):
+    if len(data) < CACHE_HEADER.size:
+        return None
+    magic, version, settingsSize, dotCount, powerCount, tableSize = CACHE_HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+    offset = CACHE_HEADER.size
+    settings = json.loads(data[offset:offset + settingsSize])
+    offset += settingsSize
+    cellCount = (MAZE_ROWS + TOP_ROWS + BOTTOM_ROWS) * MAZE_COLS
+    if len(data) != offset + cellCount * 3 + (dotCount + powerCount) * 2 + tableSize:
+        return None
+    cells = data[offset:offset + cellCount]
+    offset += cellCount
+    board = [list(cells[row:row + MAZE_COLS]) for row in range(0, cellCount, MAZE_COLS)]
+    layout = MazeLayout(settings, board)
+    layout.wallSprites = array("h")
+    layout.wallSprites.frombytes(data[offset:offset + cellCount * 2])
+    offset += cellCount * 2
+    dots = array("H")
+    dots.frombytes(data[offset:offset + dotCount * 2])
+    offset += dotCount * 2
+    powerPellets = array("H")
+    powerPellets.frombytes(data[offset:offset + powerCount * 2])
+    offset += powerCount * 2
+    layout.pellets = PelletIndex(b"")
+    layout.pellets.dots = set(dots)
+    layout.pellets.powerPellets = list(powerPellets)
+    layout.navigation = navigation.NavigationTable(board, layout.gates)
+    if not layout.navigation.frombytes(data[offset:]):
+        return None
+    return layout
+
+# Returns the compiled maze, from memory, the disk cache or by compiling it
+def loadMaze(fileName=CLASSIC, cacheDir=DataPath):
+    layout = layouts.get(fileName)
+    if layout is not None:
+        return layout
+    with open(fileName, "rb") as file:
+        data = file.read()
+    cacheFile = os.path.join(cacheDir, "maze-" + hashlib.sha1(data).hexdigest()[:16] + ".bin")
+    try:
+        with open(cacheFile, "rb") as file:
+            layout = unpackLayout(file.read())
+    except OSError:
+        pass
+    if layout is None:
+        layout = parseMaze(data.decode("utf-8"), fileName)
+        layout.compile()
+        try:
+            with open(cacheFile, "wb") as file:
+                file.write(layout.pack())
+        except OSError:
+            pass # Without a writable cache the maze is simply compiled again next run
+    # Mazes with the same board share one table
+    layout.navigation = navigation.tables.setdefault(navigation.boardHash(layout.board, layout.gates), layout.navigation)
+    layout.fileName = fileName
+    layouts[fileName] = layout
+    return layout
+
+# Loads a maze given by path, or by the name of one shipped in mazes/
+def findMaze(name):
+    if name is None:
+        return loadMaze()
+    if os.path.exists(name):
+        return loadMaze(name)
+    return loadMaze(os.path.join(MazeFolder, name + ".maze"))
+
+# What findMaze loads this maze again by: the name of a shipped maze, the path of any other
+def mazeName(layout):
+    folder, fileName = os.path.split(layout.fileName)
+    if folder == MazeFolder and fileName.endswith(".maze"):
+        return fileName[:-len(".maze")]
+    return layout.fileName
+
+
+# The arcade artwork is cut into one tile per board position
+def positionSprites(board):
+    cols = len(board[0])
+    sprites = array("h", [-1]) * (len(board) * cols)
+    for row in range(TOP_ROWS, len(board) - BOTTOM_ROWS):
+        for col in range(cols):
+            if board[row][col] == 3:
+                sprites[row * cols + col] = (row - TOP_ROWS) * cols + col
+    return sprites
+
+# Which of the eight neighbours of a cell are walls, the edges of the maze count as walls
+def wallMask(board, row, col):
+    mask = 0
+    bit = 1
+    for rowStep in (-1, 0, 1):
+        for colStep in (-1, 0, 1):
+            if rowStep == 0 and colStep == 0:
+                continue
+            neighbourRow = row + rowStep
+            neighbourCol = col + colStep
+            if (neighbourRow < TOP_ROWS or neighbourRow >= len(board) - BOTTOM_ROWS or neighbourCol < 0
+                    or neighbourCol >= len(board[0]) or board[neighbourRow][neighbourCol] == 3):
+                mask |= bit
+            bit <<= 1
+    return mask
+
+# Other mazes reuse the arcade tile whose surrounding walls look most alike
+def matchedSprites(board, gates):
+    classic = readMaze(CLASSIC)
+    classicSprites = positionSprites(classic.board)
+    gateRow, gateCol = classic.gates[0]
+    gateSprite = classicSprites[gateRow * classic.cols + gateCol]
+    byMask = {}
+    for row in range(TOP_ROWS, classic.rows - BOTTOM_ROWS):
+        for col in range(classic.cols):
+            if classic.board[row][col] == 3 and [row, col] not in classic.gates:
+                byMask.setdefault(wallMask(classic.board, row, col), classicSprites[row * classic.cols + col])
+    cols = len(board[0])
+    sprites = array("h", [-1]) * (len(board) * cols)
+    for row in range(TOP_ROWS, len(board) - BOTTOM_ROWS):
+        for col in range(cols):
+            if [row, col] in gates:
+                sprites[row * cols + col] = gateSprite
+            elif board[row][col] == 3:
+                mask = wallMask(board, row, col)
+                if mask not in byMask:
+                    byMask[mask] = byMask[min(byMask, key=lambda known: ((known ^ mask).bit_count(), known))]
+                sprites[row * cols + col] = byMask[mask]
+    return sprites
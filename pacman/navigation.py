@@ -0,0 +1,150 @@
+import hashlib
+from array import array
+from collections import deque
+
+# Shortest paths between every pair of tiles a ghost can stand on, so that
+# steering is a table lookup instead of a straight-line guess
+
+UNREACHABLE = 0xFFFF
+NO_DIR = 255
+DIRS = [[-1, 0], [0, 1], [1, 0], [0, -1]] # 0: North, 1: East, 2: South, 3: West
+
+tables = {} # Board hash -> NavigationTable, shared by every game in the process
+
+
+def boardHash(board, gates) -> str:
+    digest = hashlib.sha1()
+    digest.update(bytes(tile for line in board for tile in line))
+    digest.update(bytes(value for gate in gates for value in gate))
+    return digest.hexdigest()
+
+class NavigationTable:
+    def __init__(self, board, gates) -> None:
+        self.rows = len(board)
+        self.cols = len(board[0])
+        # Ghosts walk on everything but walls, the gate tiles are walls that ghosts may cross
+        self.index = array("h", [-1] * (self.rows * self.cols))
+        self.tiles = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if board[row][col] != 3 or [row, col] in gates:
+                    self.index[row * self.cols + col] = len(self.tiles)
+                    self.tiles.append((row, col))
+        count = len(self.tiles)
+        self.distances = array("H", [UNREACHABLE]) * (count * count) # [from * count + to]
+        self.nextDirs = bytearray([NO_DIR]) * (count * count)
+
+    def tileAt(self, row, col) -> int:
+        if row < 0 or row >= self.rows:
+            return -1
+        return self.index[row * self.cols + col % self.cols] # Columns wrap through the tunnel
+
+    def neighbours(self, tile):
+        row, col = self.tiles[tile]
+        for direction in range(4):
+            neighbour = self.tileAt(row + DIRS[direction][0], col + DIRS[direction][1])
+            if neighbour != -1:
+                yield direction, neighbour
+
+    # One breadth first search per tile; the maze is undirected so the search from
+    # a target also gives every tile's first step towards it
+    def build(self) -> None:
+        count = len(self.tiles)
+        for target in range(count):
+            distance = [UNREACHABLE] * count
+            distance[target] = 0
+            queue = deque([target])
+            while queue:
+                tile = queue.popleft()
+                for _, neighbour in self.neighbours(tile):
+                    if distance[neighbour] == UNREACHABLE:
+                        distance[neighbour] = distance[tile] + 1
+                        queue.append(neighbour)
+            for tile in range(count):
+                self.distances[tile * count + target] = distance[tile]
+                if tile == target or distance[tile] == UNREACHABLE:
+                    continue
+                for direction, neighbour in self.neighbours(tile):
+                    if distance[neighbour] == distance[tile] - 1:
+                        self.nextDirs[tile * count + target] = direction
+                        break
+
+    def frombytes(self, data) -> bool:
+        count = len(self.tiles)
+        size = count * count * self.distances.itemsize
+        if len(data) != size + count * count:
+            return False
+        self.distances = array("H")
+        self.distances.frombytes(data[:size])
+        self.nextDirs = bytearray(data[size:])
+        return True
+
+    def tobytes(self):
+        return self.distances.tobytes() + bytes(self.nextDirs)
+
+    # Steps from (row, col) to the tile holding (targetRow, targetCol), -1 if either is not walkable
+    def distance(self, row, col, targetRow, targetCol) -> int:
+        tile = self.tileAt(row, col)
+        target = self.tileAt(int(targetRow), int(targetCol))
+        if tile == -1 or target == -1:
+            return -1
+        return self.distances[tile * len(self.tiles) + target]
+
+    # First direction of a shortest path from (row, col) to the target, -1 if there is none
+    def nextDir(self, row, col, targetRow, targetCol) -> int:
+        tile = self.tileAt(row, col)
+        target = self.tileAt(int(targetRow), int(targetCol))
+        if tile == -1 or target == -1:
+            return -1
+        direction = self.nextDirs[tile * len(self.tiles) + target]
+        return -1 if direction == NO_DIR else direction
+
+
+graphs = {} # Board hash -> MazeGraph
+
+# Cell flags of MazeGraph: the low four bits are the open exits, one per direction
+OPEN = 16 # Not a wall
+GATE = 32 # Ghost gate, a wall only ghosts may cross
+JUNCTION = 64 # Anything but a straight corridor tile: crossings, corners and dead ends
+
+
+def graphFor(board, gates):
+    key = boardHash(board, gates)
+    graph = graphs.get(key)
+    if graph is None:
+        graph = MazeGraph(board, gates)
+        graphs[key] = graph
+    return graph
+
+
+# Walls never change during a game, so every movement question is answered
+# from one flag byte per cell instead of reading the board each step
+class MazeGraph:
+    def __init__(self, board, gates) -> None:
+        self.rows = len(board)
+        self.cols = len(board[0])
+        self.flags = bytearray(self.rows * self.cols)
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if board[row][col] != 3:
+                    self.flags[row * self.cols + col] |= OPEN
+                if [row, col] in gates:
+                    self.flags[row * self.cols + col] |= GATE
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cell = row * self.cols + col
+                if not self.flags[cell] & OPEN:
+                    continue
+                for direction in range(4):
+                    neighbour = self.cellAt(row + DIRS[direction][0], (col + DIRS[direction][1]) % self.cols)
+                    if neighbour != -1 and self.flags[neighbour] & OPEN:
+                        self.flags[cell] |= 1 << direction
+                exits = self.flags[cell] & 15
+                if exits not in (5, 10): # North and south, or east and west
+                    self.flags[cell] |= JUNCTION
+
+    # Cell index of a tile, -1 when it is off the board
+    def cellAt(self, row, col) -> int:
+        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
+            return -1
+        return row * self.cols + col
@@ -0,0 +1,275 @@
+import math
+
+import pygame
+
+from .atlas import loadGameAssets
+from .background import MazeBackground
+from .constants import BoardPath, ElementPath, pelletColor, spriteOffset, spriteSize, square
+from .engine import Observer, boardCols, originalGameBoard
+from .glyphs import GlyphCache
+from .mazes import loadMaze
+
+
+# Draws a Game onto a pygame surface by listening to its events, without changing it
+class Renderer(Observer):
+    def __init__(self, screen, atlas, layout=None) -> None:
+        self.screen = screen
+        self.atlas = atlas
+        self.glyphs = GlyphCache(atlas)
+        self.shownScore = None # (score, high score) currently on screen
+        # The maze is drawn once off-screen, sprites are erased by copying from it
+        self.background = MazeBackground(atlas, BoardPath, loadMaze() if layout is None else layout, square, pelletColor)
+        self.board = None # Board the pellet layer was built from
+        self.boardGeneration = None
+        self.dirtyRects = [] # Screen areas changed since the last display update
+        self.previous = [] # Pacman and ghost positions at the start of the last tick
+        self.drawnAt = [] # Where the sprites were drawn in the last frame
+        self.active = False # Frames only draw after a tick ran to the end, not while waiting or dying
+
+    def onRender(self, game) -> None:
+        self.render(game)
+
+    def onWaiting(self, game) -> None:
+        self.active = False
+        row, col = game.layout.ready
+        for i in range(-1, 4):
+            self.drawTilesAround(row + 1, col + i)
+        self.drawReady(game)
+        self.updateDisplay()
+
+    def onTickStart(self, game) -> None:
+        self.previous = self.positions(game)
+        self.clearBoard(game)
+
+    def onTickEnd(self, game) -> None:
+        self.active = game.state != "dying"
+
+    def onCellChanged(self, game, row, col) -> None:
+        self.drawCell(game, row, col)
+
+    def onFrozen(self, game) -> None:
+        # Nothing moves, so frames keep drawing the actors where they stand
+        self.previous = self.positions(game)
+
+    def onDeath(self, game) -> None:
+        #Removes the ghosts from the screen
+        for row, col in self.drawnAt + self.positions(game):
+            self.drawTilesAround(row, col)
+        self.drawPacman(game, game.pacman.row, game.pacman.col)
+        self.updateDisplay()
+
+    def onPointsExpired(self, game, point) -> None:
+        self.drawTilesAround(point[0], point[1])
+
+    def onDeathFrame(self, game) -> None:
+        # Resets the screen around pacman
+        self.drawTilesAround(game.pacman.row, game.pacman.col)
+
+        # Draws new image
+        pacmanImage = self.atlas.get(ElementPath, 116 + game.dyingFrame, spriteSize)
+        self.dirtyRects.append(self.screen.blit(pacmanImage, (game.pacman.col * square + spriteOffset, game.pacman.row * square + spriteOffset, square, square)))
+        self.updateDisplay()
+
+    # Render method
+    def render(self, game) -> None:
+        if self.background.layout is not game.layout:
+            self.background = MazeBackground(self.atlas, BoardPath, game.layout, square, pelletColor)
+            self.board = None
+        if self.board is not game.gameBoard or self.boardGeneration != game.boardGeneration:
+            self.background.rebuild(game.gameBoard)
+            self.board = game.gameBoard
+            self.boardGeneration = game.boardGeneration
+        self.screen.fill((0, 0, 0)) # Flushes the screen
+        self.shownScore = None
+        # Draws game elements
+        self.displayLives(game)
+        self.displayScore(game)
+        self.background.draw(self.screen)
+        # Draw Sprites
+        self.previous = self.positions(game)
+        self.drawnAt = self.previous
+        for ghost in game.ghosts:
+            self.drawGhost(ghost, ghost.row, ghost.col)
+        self.drawPacman(game, game.pacman.row, game.pacman.col)
+        # Updates the screen
+        self.dirtyRects.clear()
+        pygame.display.update()
+
+    # Draws the actors between their last two ticks, alpha being how far the clock is into the next one
+    def drawFrame(self, game, alpha) -> None:
+        if not self.active:
+            return
+        for row, col in self.drawnAt:
+            self.drawTilesAround(row, col)
+        self.drawnAt = [self.interpolate(previous, current, alpha) for previous, current in zip(self.previous, self.positions(game))]
+
+        for point in game.points:
+            self.drawPoints(point[2], point[0], point[1])
+        # Draw Sprites
+        for ghost, (row, col) in zip(game.ghosts, self.drawnAt[1:]):
+            self.drawGhost(ghost, row, col)
+        self.drawPacman(game, self.drawnAt[0][0], self.drawnAt[0][1])
+        self.displayScore(game)
+        self.displayBerries(game)
+        self.displayLives(game)
+        self.drawBerry(game)
+        # Updates the screen
+        self.updateDisplay()
+
+    def positions(self, game):
+        return [(game.pacman.row, game.pacman.col)] + [(ghost.row, ghost.col) for ghost in game.ghosts]
+
+    def interpolate(self, previous, current, alpha):
+        # Jumps of more than a tile are tunnel wraps or resets and are not smoothed
+        if abs(current[0] - previous[0]) > 1 or abs(current[1] - previous[1]) > 1:
+            return current
+        return (previous[0] + (current[0] - previous[0]) * alpha, previous[1] + (current[1] - previous[1]) * alpha)
+
+    # Presents only the areas that were drawn to since the last update
+    def updateDisplay(self) -> None:
+        pygame.display.update(self.dirtyRects)
+        self.dirtyRects.clear()
+
+    def clearBoard(self, game) -> None:
+        # Sprites are erased by drawFrame, where they were last drawn
+        self.drawTilesAround(game.berryLocation[0], game.berryLocation[1])
+        # Clears Ready! Label
+        row, col = game.layout.ready
+        for i in range(-1, 4):
+            self.drawTilesAround(row, col + i)
+
+    # Displays the current score, only redrawn when a number changed
+    def displayScore(self, game) -> None:
+        if self.shownScore == (game.score, game.highScore):
+            return
+        self.shownScore = (game.score, game.highScore)
+        scoreStart = 5
+        highScoreStart = 11
+        self.dirtyRects.append(self.screen.blit(self.glyphs.compose([33, 21, 16], square), (scoreStart * square, 4)))
+        score = str(game.score)
+        if score == "0":
+            score = "00"
+        self.dirtyRects.append(self.screen.blit(self.glyphs.digits(score, 32, square), ((scoreStart + 2) * square, square + 4)))
+
+        self.dirtyRects.append(self.screen.blit(self.glyphs.compose([7, 8, 6, 7, 15, 19, 2, 14, 18, 4], square), (highScoreStart * square, 4)))
+        highScore = str(game.highScore)
+        if highScore == "0":
+            highScore = "00"
+        self.dirtyRects.append(self.screen.blit(self.glyphs.digits(highScore, 32, square), ((highScoreStart + 6) * square, square + 4)))
+
+    def drawBerry(self, game) -> None:
+        if game.levelTimer in range(game.berryState[0], game.berryState[1]) and not game.berryState[2]:
+            berryImage = self.atlas.get(ElementPath, game.berries[(game.level - 1) % 8], spriteSize)
+            self.dirtyRects.append(self.screen.blit(berryImage, (game.berryLocation[1] * square, game.berryLocation[0] * square, square, square)))
+
+    def drawPoints(self, points, row, col) -> None:
+        self.dirtyRects.append(self.screen.blit(self.glyphs.digits(str(points), 224, square//2), (col * square, row * square - 20)))
+
+    def drawReady(self, game) -> None:
+        row, col = game.layout.ready
+        self.dirtyRects.append(self.screen.blit(self.glyphs.compose([274, 260, 256, 259, 281, 283], square), (col * square, row * square)))
+
+    def displayLives(self, game) -> None:
+        # 33 rows || 28 cols
+        # Lives[[31, 5], [31, 3], [31, 1]]
+        livesLoc = [[34, 5], [34, 3], [34, 1]]
+        for i in range(game.lives - 1):
+            lifeImage = self.atlas.get(ElementPath, 54, spriteSize)
+            self.dirtyRects.append(self.screen.blit(lifeImage, (livesLoc[i][1] * square, livesLoc[i][0] * square - spriteOffset, square, square)))
+
+    def displayBerries(self, game) -> None:
+        firstBerrie = [34, 26]
+        for i in range(len(game.berriesCollected)):
+            berrieImage = self.atlas.get(ElementPath, game.berriesCollected[i], spriteSize)
+            self.dirtyRects.append(self.screen.blit(berrieImage, ((firstBerrie[1] - (2*i)) * square, firstBerrie[0] * square + 5, square, square)))
+
+    # Restores the 5x5 block of tiles around a location from the cached background
+    def drawTilesAround(self, row, col) -> None:
+        rect = self.background.restoreTiles(self.screen, math.floor(row), math.floor(col), 2)
+        if rect is not None:
+            self.dirtyRects.append(rect)
+
+    # Updates a pellet in the cached background and copies that cell to the screen
+    def drawCell(self, game, row, col) -> None:
+        rect = self.background.setCell(row, col, game.gameBoard[row][col])
+        self.dirtyRects.append(self.screen.blit(self.background.surface, rect, rect))
+
+    # Draws pacman based on his current state
+    def drawPacman(self, game, row, col) -> None:
+        pacman = game.pacman
+        if not game.started:
+            pacmanImage = self.atlas.get(ElementPath, 112, spriteSize)
+            self.dirtyRects.append(self.screen.blit(pacmanImage, (col * square + spriteOffset, row * square + spriteOffset, square, square)))
+            return
+
+        if pacman.dir == 0:
+            if pacman.mouthOpen:
+                pacmanImage = self.atlas.get(ElementPath, 49, spriteSize)
+            else:
+                pacmanImage = self.atlas.get(ElementPath, 51, spriteSize)
+        elif pacman.dir == 1:
+            if pacman.mouthOpen:
+                pacmanImage = self.atlas.get(ElementPath, 52, spriteSize)
+            else:
+                pacmanImage = self.atlas.get(ElementPath, 54, spriteSize)
+        elif pacman.dir == 2:
+            if pacman.mouthOpen:
+                pacmanImage = self.atlas.get(ElementPath, 53, spriteSize)
+            else:
+                pacmanImage = self.atlas.get(ElementPath, 55, spriteSize)
+        elif pacman.dir == 3:
+            if pacman.mouthOpen:
+                pacmanImage = self.atlas.get(ElementPath, 48, spriteSize)
+            else:
+                pacmanImage = self.atlas.get(ElementPath, 50, spriteSize)
+
+        self.dirtyRects.append(self.screen.blit(pacmanImage, (col * square + spriteOffset, row * square + spriteOffset, square, square)))
+
+    def drawGhost(self, ghost, row, col) -> None: # Ghosts states: Alive, Attacked, Dead Attributes: Color, Direction, Location
+        tileNum = 152
+        currentDir = ((ghost.dir + 3) % 4) * 2
+        if ghost.feet:
+            currentDir += 1
+        if ghost.dead:
+            tileNum = 152 + currentDir
+        elif ghost.attacked:
+            if ghost.attackedTimer - ghost.attackedCount < ghost.attackedTimer//3:
+                if (ghost.attackedTimer - ghost.attackedCount) % 31 < 26:
+                    tileNum = 70 + (currentDir - (((ghost.dir + 3) % 4) * 2))
+                else:
+                    tileNum = 72 + (currentDir - (((ghost.dir + 3) % 4) * 2))
+            else:
+                tileNum = 72 + (currentDir - (((ghost.dir + 3) % 4) * 2))
+        elif ghost.color == "blue":
+            tileNum = 136 + currentDir
+        elif ghost.color == "pink":
+            tileNum = 128 + currentDir
+        elif ghost.color == "orange":
+            tileNum = 144 + currentDir
+        elif ghost.color == "red":
+            tileNum = 96 + currentDir
+
+        ghostImage = self.atlas.get(ElementPath, tileNum, spriteSize)
+        self.dirtyRects.append(self.screen.blit(ghostImage, (col * square + spriteOffset, row * square + spriteOffset, square, square)))
+
+
+# The game's sprites for drawing without a window; load it once and pass it to every
+# OffscreenRenderer. Without a display set SDL_VIDEODRIVER=dummy before pygame starts,
+# or a tiny window opens
+def loadOffscreenAtlas():
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1)) # Sprites are converted to the display format, a hidden one will do
+    return loadGameAssets()
+
+
+# Renderer drawing onto a surface of its own, for recording or pixel-based agents
+class OffscreenRenderer(Renderer):
+    def __init__(self, layout=None, atlas=None) -> None:
+        if atlas is None:
+            atlas = loadOffscreenAtlas()
+        super().__init__(pygame.Surface((boardCols * square, len(originalGameBoard) * square)), atlas, layout)
+
+    def updateDisplay(self) -> None:
+        self.dirtyRects.clear() # Nothing to present, the surface is the output
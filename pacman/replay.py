@@ -0,0 +1,119 @@
+import argparse
+import random
+import struct
+import time
+
+from . import ghostai, navigation
+from .engine import Game
+from .mazes import findMaze, mazeName
+
+# A replay is the game's seed, maze and ghosts plus every key press with the
+# tick it came before, enough to play the game again exactly:
+#   python -m pacman.replay Assets/Data/LastGame.replay
+
+# Magic, version, seed, ticks, final score, ghosts, ghost AI budget (-1: none), maze hash, maze name length; then the name
+HEADER = struct.Struct("<4sBQIIBi20sH")
+EVENT = struct.Struct("<IB") # Tick, key
+MAGIC = b"PACR"
+VERSION = 5 # 2: ghosts draw a random target with one random number, 3: the maze is recorded, 4: the ghosts are
+# recorded, 5: ghosts steered by GhostAI no longer draw random targets
+GHOSTS = ["original", "classic"] # The original random targets, or GhostAI with the arcade strategies
+START = 4 # A key without a direction, it only starts the game
+
+
+# Same as a key press in the window: any key starts the game, direction keys also turn pacman
+def pressKey(game, key) -> None:
+    game.start()
+    if key != START:
+        game.pacman.newDir = key
+
+
+# Stands between the window and a Game, remembering the inputs of every tick
+class Recorder:
+    def __init__(self, game, seed) -> None:
+        self.game = game
+        self.seed = seed
+        self.ticks = 0
+        self.events = [] # [tick, key]
+
+    def press(self, direction=None) -> None:
+        key = START if direction is None else direction
+        self.events.append([self.ticks, key])
+        pressKey(self.game, key)
+
+    def update(self) -> None:
+        self.game.update()
+        self.ticks += 1
+
+    def save(self, fileName) -> None:
+        layout = self.game.layout
+        name = mazeName(layout).encode()
+        ghosts, budget = ghostSettings(self.game.ai)
+        with open(fileName, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.ticks, self.game.score, ghosts, budget, mazeHash(layout), len(name)))
+            file.write(name)
+            for tick, key in self.events:
+                file.write(EVENT.pack(tick, key))
+
+
+def mazeHash(layout):
+    return bytes.fromhex(navigation.boardHash(layout.board, layout.gates))
+
+# Index in GHOSTS and budget of the ghost AI a game is played with
+def ghostSettings(ai):
+    if ai is None:
+        return 0, -1
+    if ai.strategies is not ghostai.CLASSIC:
+        raise ValueError("only games against the classic ghost strategies can be recorded")
+    return 1, -1 if ai.budget is None else ai.budget
+
+def ghostAI(ghosts, budget):
+    if GHOSTS[ghosts] == "original":
+        return None
+    return ghostai.GhostAI(budget=None if budget == -1 else budget)
+
+# Returns seed, ticks, score, maze layout, ghost AI and events, to give to play();
+# the maze has to be the one the game was played on
+def load(fileName):
+    with open(fileName, "rb") as file:
+        data = file.read()
+    magic, version, seed, ticks, score, ghosts, budget, digest, nameLength = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(fileName + " is not a version " + str(VERSION) + " replay")
+    name = data[HEADER.size:HEADER.size + nameLength].decode()
+    layout = findMaze(name)
+    if mazeHash(layout) != digest:
+        raise ValueError(fileName + " was played on another version of the maze " + name)
+    events = [list(event) for event in EVENT.iter_unpack(data[HEADER.size + nameLength:])]
+    return seed, ticks, score, layout, ghostAI(ghosts, budget), events
+
+# Re-simulates a replay headless, as fast as possible; onTick(game) is called after every tick
+def play(seed, ticks, events, observers=None, onTick=None, layout=None, ai=None):
+    game = Game(1, 0, rng=random.Random(seed), observers=observers, layout=layout, ai=ai)
+    index = 0
+    for tick in range(ticks):
+        while index < len(events) and events[index][0] == tick:
+            pressKey(game, events[index][1])
+            index += 1
+        game.update()
+        if onTick is not None:
+            onTick(game)
+    return game
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play back a recorded game headless and check its score")
+    parser.add_argument("replay")
+    args = parser.parse_args()
+
+    seed, ticks, score, layout, ai, events = load(args.replay)
+    start = time.perf_counter()
+    game = play(seed, ticks, events, layout=layout, ai=ai)
+    elapsed = time.perf_counter() - start
+    print("seed {}, {} ticks, {} key presses in {:.3f} s ({:.0f} ticks/s)".format(seed, ticks, len(events), elapsed, ticks / elapsed))
+    if game.score != score:
+        print("MISMATCH: recorded score {}, replayed score {}".format(score, game.score))
+        raise SystemExit(1)
+    print("score {} matches".format(score))
+
+if __name__ == "__main__":
+    main()
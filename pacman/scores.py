@@ -0,0 +1,187 @@
+import argparse
+import os
+import queue
+import struct
+import threading
+import time
+
+from .constants import DataPath
+
+# High score and score history, written by a background thread so the game
+# loop never waits on the disk. Every file is replaced atomically through a
+# temporary file, except the history which is only ever appended to.
+# The leaderboard of a level can be shown with:
+#   python -m pacman.scores --level 2 --top 10
+
+# History record: unix time, game seed, score, level reached, berries eaten
+RECORD = struct.Struct("<qQIHH")
+# Index: magic, version, records covered, levels; per level: level, entries; per entry: score, record number
+INDEX_HEADER = struct.Struct("<4sBIH")
+INDEX_LEVEL = struct.Struct("<HH")
+INDEX_ENTRY = struct.Struct("<II")
+INDEX_MAGIC = b"PACI"
+INDEX_VERSION = 1
+INDEX_DEPTH = 100 # Best games kept in the index for every level
+
+
+def readHighScore(fileName):
+    try:
+        with open(fileName) as file:
+            return int(file.read())
+    except (OSError, ValueError):
+        return 0
+
+# Writes next to the target then renames over it, so a crash leaves the old or the new file, never half of one
+def writeAtomic(fileName, data) -> None:
+    temporary = fileName + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, fileName)
+    syncFolder(os.path.dirname(os.path.abspath(fileName))) # The rename is only on disk once the folder is
+
+def syncFolder(folder) -> None:
+    try:
+        descriptor = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return # Windows cannot open a folder, and does not need to
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass # Some file systems do not sync folders
+    finally:
+        os.close(descriptor)
+
+
+class ScoreStore:
+    def __init__(self, folder=DataPath) -> None:
+        self.highScoreFile = os.path.join(folder, "HighScore.txt")
+        self.historyFile = os.path.join(folder, "ScoreHistory.bin")
+        self.indexFile = os.path.join(folder, "ScoreHistory.idx")
+        self.highScore = readHighScore(self.highScoreFile)
+        self.index = None # Level -> [(score, record)] best first, loaded by the worker
+        self.records = 0
+        self.tasks = queue.Queue()
+        self.worker = threading.Thread(target=self.work, name="scores", daemon=True)
+        self.worker.start()
+
+    # Both only queue the write and return at once
+    def recordHighScore(self, highScore) -> None:
+        if highScore > self.highScore:
+            self.highScore = highScore
+            self.tasks.put((self.writeHighScore, highScore))
+
+    def recordGame(self, game, seed) -> None:
+        self.recordHighScore(game.highScore)
+        self.tasks.put((self.appendGame, (int(time.time()), seed, game.score, game.level, len(game.berriesCollected))))
+
+    # Waits for the queued writes, call before exiting
+    def close(self) -> None:
+        self.tasks.put(None)
+        self.worker.join()
+
+    def work(self) -> None:
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            write, value = task
+            try:
+                write(value)
+            except OSError as error:
+                print("Could not save scores:", error)
+
+    def writeHighScore(self, highScore) -> None:
+        writeAtomic(self.highScoreFile, str(highScore).encode())
+
+    def appendGame(self, record) -> None:
+        if self.index is None:
+            self.index, self.records = loadIndex(self.historyFile, self.indexFile)
+        with open(self.historyFile, "ab") as file:
+            file.truncate(self.records * RECORD.size) # Drops a record cut short by a crash
+            file.write(RECORD.pack(*record))
+            file.flush()
+            os.fsync(file.fileno())
+        addToIndex(self.index, record[3], record[2], self.records)
+        self.records += 1
+        # The record is on disk before the index points at it
+        writeAtomic(self.indexFile, packIndex(self.index, self.records))
+
+
+def addToIndex(index, level, score, record) -> None:
+    entries = index.setdefault(level, [])
+    if len(entries) == INDEX_DEPTH and score <= entries[-1][0]:
+        return
+    position = len(entries)
+    while position and entries[position - 1][0] < score: # Earlier games stay ahead on a tie
+        position -= 1
+    entries.insert(position, (score, record))
+    del entries[INDEX_DEPTH:]
+
+def packIndex(index, records):
+    parts = [INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, records, len(index))]
+    for level, entries in sorted(index.items()):
+        parts.append(INDEX_LEVEL.pack(level, len(entries)))
+        parts.extend(INDEX_ENTRY.pack(score, record) for score, record in entries)
+    return b"".join(parts)
+
+def unpackIndex(data):
+    magic, version, records, levels = INDEX_HEADER.unpack_from(data)
+    if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        raise ValueError("not a score index")
+    index = {}
+    offset = INDEX_HEADER.size
+    for _ in range(levels):
+        level, count = INDEX_LEVEL.unpack_from(data, offset)
+        offset += INDEX_LEVEL.size
+        index[level] = [INDEX_ENTRY.unpack_from(data, offset + i * INDEX_ENTRY.size) for i in range(count)]
+        offset += count * INDEX_ENTRY.size
+    return index, records
+
+# The index, rebuilt from the whole history only when it is missing or behind it
+def loadIndex(historyFile, indexFile):
+    try:
+        records = os.path.getsize(historyFile) // RECORD.size
+    except OSError:
+        records = 0
+    try:
+        with open(indexFile, "rb") as file:
+            index, indexed = unpackIndex(file.read())
+        if indexed == records:
+            return index, records
+    except (OSError, ValueError, struct.error):
+        pass
+    index = {}
+    if records:
+        with open(historyFile, "rb") as file:
+            data = file.read(records * RECORD.size)
+        for record, fields in enumerate(RECORD.iter_unpack(data)):
+            addToIndex(index, fields[3], fields[2], record)
+    return index, records
+
+# Best games that ended on a level as (time, seed, score, level, berries), reading only their records
+def topScores(level, count=10, folder=DataPath):
+    historyFile = os.path.join(folder, "ScoreHistory.bin")
+    index = loadIndex(historyFile, os.path.join(folder, "ScoreHistory.idx"))[0]
+    entries = index.get(level, [])[:count]
+    if not entries:
+        return []
+    scores = []
+    with open(historyFile, "rb") as file:
+        for _, record in entries:
+            file.seek(record * RECORD.size)
+            scores.append(RECORD.unpack(file.read(RECORD.size)))
+    return scores
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show the best Pacman games of a level")
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    for rank, (played, seed, score, _, berries) in enumerate(topScores(args.level, args.top), 1):
+        print("{:>3}. {:>7} {}  berries {}  seed {}".format(
+            rank, score, time.strftime("%Y-%m-%d %H:%M", time.localtime(played)), berries, seed))
+
+if __name__ == "__main__":
+    main()
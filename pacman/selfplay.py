@@ -0,0 +1,210 @@
+import argparse
+import json
+import os
+import random
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .engine import Observer, boardCols, subTiles
+from .simulate import playGame, randomController
+
+# Plays many headless games on all cores and streams one row per game into a
+# folder of column files, e.g. to compare controllers over a million games:
+#   python -m pacman.selfplay --games 100000 --output runs/random
+# An interrupted run continues where it stopped when started again with the
+# same arguments. --scaling plays the same games on 1, 2, 4... workers and
+# prints how throughput grows, without keeping the results.
+
+# Column name -> array typecode, one file <name>.col per column
+COLUMNS = [("game", "I"), ("seed", "Q"), ("score", "I"), ("level", "H"), ("ticks", "I"), ("ghostsEaten", "H"), ("berriesCollected", "H")]
+CHUNK = 16 # Games per task, enough to hide the cost of sending results between processes
+
+
+# Steps from (row, col) to the nearest pellet and that pellet's cell
+def nearestPellet(game, row, col):
+    navigation = game.navigation
+    best = None
+    bestDistance = None
+    for cell in game.pellets.dots.union(game.pellets.powerPellets):
+        distance = navigation.distance(row, col, cell // boardCols, cell % boardCols)
+        if distance != -1 and (bestDistance is None or distance < bestDistance):
+            best = cell
+            bestDistance = distance
+    return bestDistance, best
+
+# Heads for the nearest pellet, ignoring the ghosts
+def pelletController(rng):
+    def control(game):
+        pacman = game.pacman
+        row, col = pacman.y // subTiles, pacman.x // subTiles
+        if pacman.y % subTiles or pacman.x % subTiles:
+            # Between two tiles only a reversal is possible; it matters when standing still, e.g. at the start
+            horizontal = bool(pacman.x % subTiles)
+            if pacman.dir % 2 == horizontal:
+                return None
+            ends = [(3, row, col), (1, row, col + 1)] if horizontal else [(0, row, col), (2, row + 1, col)]
+            distances = [(nearestPellet(game, endRow, endCol)[0], direction) for direction, endRow, endCol in ends]
+            distances = [(distance, direction) for distance, direction in distances if distance is not None]
+            return min(distances)[1] if distances else None
+        cell = nearestPellet(game, row, col)[1]
+        if cell is None:
+            return None
+        direction = game.navigation.nextDir(row, col, cell // boardCols, cell % boardCols)
+        return None if direction == -1 else direction
+    return control
+
+CONTROLLERS = {"random": randomController, "pellets": pelletController}
+
+
+class GameStats(Observer):
+    def __init__(self) -> None:
+        self.ghostsEaten = 0
+
+    def onGhostEaten(self, game, ghost) -> None:
+        self.ghostsEaten += 1
+
+
+# Runs in a worker process; each game gets the seed of its index so results
+# do not depend on how games are spread over the workers
+def playChunk(games, seed, controller, maxTicks):
+    rows = []
+    for index in games:
+        gameSeed = seed + index
+        stats = GameStats()
+        control = CONTROLLERS[controller](random.Random("input-" + str(gameSeed)))
+        game, ticks = playGame(gameSeed, control, maxTicks, observers=[stats])
+        rows.append((index, gameSeed, game.score, game.level, ticks, stats.ghostsEaten, len(game.berriesCollected)))
+    return rows
+
+
+class ResultWriter:
+    def __init__(self, folder, settings) -> None:
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        settingsFile = os.path.join(folder, "run.json")
+        if os.path.exists(settingsFile):
+            with open(settingsFile) as file:
+                if json.load(file) != settings:
+                    raise SystemExit(folder + " holds a run with other settings, pick another --output")
+        else:
+            with open(settingsFile, "w") as file:
+                json.dump(settings, file)
+        self.done = set(loadColumns(folder, truncate=True)["game"])
+        self.files = [open(self.columnFile(name), "ab") for name, typecode in COLUMNS]
+
+    def columnFile(self, name):
+        return os.path.join(self.folder, name + ".col")
+
+    # Appends whole rows only, so a crash leaves at most one partial row that is cut off on resume
+    def write(self, rows) -> None:
+        for column, ((_, typecode), file) in enumerate(zip(COLUMNS, self.files)):
+            file.write(array(typecode, [row[column] for row in rows]).tobytes())
+        for file in self.files:
+            file.flush()
+        self.done.update(row[0] for row in rows)
+
+    def close(self) -> None:
+        for file in self.files:
+            file.close()
+
+
+# Plays games on workers processes and yields the rows of each chunk as it finishes
+def playGames(games, seed, controller, maxTicks, workers):
+    with ProcessPoolExecutor(workers) as executor:
+        chunks = iter([games[i:i + CHUNK] for i in range(0, len(games), CHUNK)])
+        pending = set()
+        while True:
+            # Keep a few chunks per worker queued instead of submitting everything up front
+            for chunk in chunks:
+                pending.add(executor.submit(playChunk, chunk, seed, controller, maxTicks))
+                if len(pending) >= workers * 2:
+                    break
+            if not pending:
+                return
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+
+# Throughput of the same games on 1, 2, 4... up to maxWorkers workers
+def measureScaling(games, seed, controller, maxTicks, maxWorkers) -> None:
+    counts = [1 << power for power in range(maxWorkers.bit_length()) if 1 << power < maxWorkers] + [maxWorkers]
+    baseline = None
+    for workers in counts:
+        start = time.perf_counter()
+        ticks = 0
+        for rows in playGames(list(range(games)), seed, controller, maxTicks, workers):
+            ticks += sum(row[4] for row in rows)
+        elapsed = time.perf_counter() - start
+        rate = games / elapsed * 60
+        baseline = rate if baseline is None else baseline
+        print("{:>3} workers: {:.2f} s, {:.0f} games/min, {:.0f} ticks/s, {:.2f}x one worker".format(
+            workers, elapsed, rate, ticks / elapsed, rate / baseline))
+
+# Reads a result folder into {column: array}; rows are in the order games finished
+def loadColumns(folder, truncate=False):
+    columns = {}
+    for name, typecode in COLUMNS:
+        values = array(typecode)
+        try:
+            with open(os.path.join(folder, name + ".col"), "rb") as file:
+                data = file.read()
+            values.frombytes(data[:len(data) // values.itemsize * values.itemsize])
+        except FileNotFoundError:
+            pass
+        columns[name] = values
+    rows = min(len(values) for values in columns.values())
+    for name in columns:
+        del columns[name][rows:]
+        if truncate and os.path.exists(os.path.join(folder, name + ".col")):
+            os.truncate(os.path.join(folder, name + ".col"), rows * columns[name].itemsize)
+    return columns
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play headless Pacman games on all cores")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=100000)
+    parser.add_argument("--controller", choices=sorted(CONTROLLERS), default="random")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", default="selfplay")
+    parser.add_argument("--scaling", action="store_true", help="time the games on 1, 2, 4... up to --workers workers instead")
+    args = parser.parse_args()
+
+    if args.scaling:
+        print("{} games, {} CPUs".format(args.games, os.cpu_count()))
+        measureScaling(args.games, args.seed, args.controller, args.max_ticks, args.workers)
+        return
+
+    settings = {"seed": args.seed, "maxTicks": args.max_ticks, "controller": args.controller}
+    writer = ResultWriter(args.output, settings)
+    todo = [index for index in range(args.games) if index not in writer.done]
+    if len(todo) < args.games:
+        print("Resuming: {} of {} games already played".format(args.games - len(todo), args.games))
+
+    start = time.perf_counter()
+    played = 0
+    totalTicks = 0
+    try:
+        for rows in playGames(todo, args.seed, args.controller, args.max_ticks, args.workers):
+            writer.write(rows)
+            played += len(rows)
+            totalTicks += sum(row[4] for row in rows)
+    except KeyboardInterrupt:
+        print("Interrupted, run again to continue")
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    if played:
+        print("{} games, {} ticks in {:.2f} s on {} workers ({:.0f} games/min, {:.0f} ticks/s)".format(
+            played, totalTicks, elapsed, args.workers, played / elapsed * 60, totalTicks / elapsed))
+    columns = loadColumns(args.output)
+    if columns["game"]:
+        games = len(columns["game"])
+        print("{} games in {}: mean score {:.1f}, mean level {:.2f}, {} ghosts eaten, {} berries".format(
+            games, args.output, sum(columns["score"]) / games, sum(columns["level"]) / games,
+            sum(columns["ghostsEaten"]), sum(columns["berriesCollected"])))
+
+if __name__ == "__main__":
+    main()
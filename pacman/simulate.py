@@ -0,0 +1,66 @@
+import argparse
+import random
+import time
+
+from .engine import Game
+from .ghostai import GhostAI
+from .mazes import findMaze
+
+# Plays games without a window or mixer, e.g. for balancing runs:
+#   python -m pacman.simulate --games 1000 --seed 1
+# --ghosts classic plays against the arcade ghost strategies of ghostai.
+
+
+# Presses a random direction every few ticks, like a very bad player
+def randomController(rng, period=15):
+    def control(game):
+        if game.levelTimer % period == 0:
+            return rng.randrange(4)
+        return None
+    return control
+
+# Runs one game to the end; controller(game) returns a direction or None, onTick(game) is called after every tick
+def playGame(seed, controller=None, maxTicks=100000, observers=None, layout=None, ai=None, onTick=None):
+    game = Game(1, 0, rng=random.Random(seed), observers=observers, layout=layout, ai=ai)
+    if controller is None:
+        controller = randomController(random.Random("input-" + str(seed)))
+    ticks = 0
+    while game.running and ticks < maxTicks:
+        if not game.started:
+            game.start() # Any key press starts the game again after a death
+        newDir = controller(game)
+        if newDir is not None:
+            game.pacman.newDir = newDir
+        game.update()
+        ticks += 1
+        if onTick is not None:
+            onTick(game)
+    return game, ticks
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run headless Pacman games")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=100000)
+    parser.add_argument("--maze", help="name of a maze in pacman/mazes or path of a maze file")
+    parser.add_argument("--ghosts", choices=["original", "classic"], default="original")
+    parser.add_argument("--ai-budget", type=int, help="most ghost turns decided per tick with --ghosts classic")
+    args = parser.parse_args()
+    layout = findMaze(args.maze)
+    ai = GhostAI(budget=args.ai_budget) if args.ghosts == "classic" else None
+
+    start = time.perf_counter()
+    totalTicks = 0
+    totalScore = 0
+    for i in range(args.games):
+        game, ticks = playGame(args.seed + i, maxTicks=args.max_ticks, layout=layout, ai=ai)
+        totalTicks += ticks
+        totalScore += game.score
+    elapsed = time.perf_counter() - start
+    print("{} games, {} ticks in {:.2f} s ({:.0f} games/min, {:.0f} ticks/s), mean score {:.1f}".format(
+        args.games, totalTicks, elapsed, args.games / elapsed * 60, totalTicks / elapsed, totalScore / args.games))
+    if ai is not None:
+        print(ai.report())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pacman import mazes
+from pacman.batch import checkParity
+
+# BatchGame has to play exactly like engine.Game given the same seeds and inputs
+
+
+@pytest.mark.parametrize("seeds", [range(0, 4), range(100, 104)])
+def testBatchMatchesEngine(seeds):
+    assert checkParity(seeds, ticks=3000) is None
+
+def testBatchFollowsTheMaze():
+    with open(mazes.CLASSIC, encoding="utf-8") as file:
+        text = file.read()
+    # Pacman and the berry elsewhere, three ghosts and two levels
+    text = text.replace("pacman: 23 13.5", "pacman: 5 1").replace("berry: 17 13.5", "berry: 20 6")
+    text = text.replace("ghost: orange 14 15.5\n", "").replace("levels: 8", "levels: 2")
+    layout = mazes.parseMaze(text, "variant.maze")
+    layout.compile()
+    assert checkParity(range(4), ticks=3000, layout=layout) is None
@@ -0,0 +1,29 @@
+import io
+import tarfile
+
+import pytest
+
+from pacman.bundle import AssetBundle, pack
+
+# A bundle is read through its memory map until it is closed, files opened from it stay usable
+
+
+def makeBundle(folder):
+    archive = str(folder / "Assets.tar.gz")
+    with tarfile.open(archive, "w:gz") as tar:
+        for name, data in [("Assets/Music/a.wav", b"first"), ("Assets/Music/b.wav", b"second")]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    fileName = str(folder / "Assets.pack")
+    pack(archive, fileName)
+    return fileName
+
+def testBundleClosesWithItsBlock(tmp_path):
+    with AssetBundle(makeBundle(tmp_path)) as assets:
+        assert assets.listdir("Assets/Music/") == ["a.wav", "b.wav"]
+        file = assets.open("Assets/Music/b.wav")
+    assert assets.file.closed
+    assert file.read() == b"second"
+    with pytest.raises(ValueError):
+        assets.open("Assets/Music/a.wav")
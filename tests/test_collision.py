@@ -0,0 +1,42 @@
+from pacman.collision import CollisionGrid, sweptContact
+from pacman.engine import Game, boardWidth, subTiles
+
+# Contacts through the tunnel: the last and the first column are next to each other
+
+REACH = subTiles // 2
+TUNNEL_ROW = 17 * subTiles
+
+
+class Actor:
+    def __init__(self) -> None:
+        self.gridCell = -1
+
+
+def testSwapMidRow():
+    assert sweptContact(0, 100, 0, 102, 0, 102, 0, 100, REACH, boardWidth)
+
+def testSwapAcrossTunnel():
+    assert sweptContact(0, boardWidth - 2, 0, 0, 0, 0, 0, boardWidth - 2, REACH, boardWidth)
+
+def testStillAcrossTunnel():
+    assert sweptContact(0, boardWidth - 1, 0, boardWidth - 1, 0, 1, 0, 1, REACH, boardWidth)
+    assert not sweptContact(0, boardWidth - 8, 0, boardWidth - 8, 0, 8, 0, 8, REACH, boardWidth)
+
+def testNearAcrossTunnel():
+    grid = CollisionGrid(36, 28, subTiles)
+    left = Actor()
+    right = Actor()
+    grid.move(left, TUNNEL_ROW, 1)
+    grid.move(right, TUNNEL_ROW, boardWidth - 1)
+    assert right in grid.near(TUNNEL_ROW, 1, 20)
+    assert left in grid.near(TUNNEL_ROW, boardWidth - 1, 20)
+
+def testGhostCatchesPacmanThroughTunnel():
+    game = Game(1, 0)
+    game.start()
+    game.pacman.y = game.pacman.lastY = TUNNEL_ROW
+    game.pacman.x = game.pacman.lastX = boardWidth - 1
+    ghost = game.ghosts[0]
+    game.moveGhost(ghost, TUNNEL_ROW, 1)
+    game.checkSurroundings()
+    assert game.state == "dying"
@@ -0,0 +1,35 @@
+import random
+
+from pacman.engine import Game, Observer
+
+# Headless games have to keep their own state moving, without a renderer attached
+
+
+class Expired(Observer):
+    def __init__(self) -> None:
+        self.points = []
+
+    def onPointsExpired(self, game, point) -> None:
+        self.points.append(point)
+
+def testPointsExpireWithoutRenderer():
+    watcher = Expired()
+    game = Game(1, 0, rng=random.Random(0), observers=[watcher])
+    game.start()
+    game.points.append([5, 5, 200, 0])
+    for _ in range(game.pointsTimer + 1):
+        game.update()
+    assert game.points == []
+    assert watcher.points == [[5, 5, 200, game.pointsTimer]]
+
+def testActorsAnimateWithoutRenderer():
+    game = Game(1, 0, rng=random.Random(0))
+    game.start()
+    mouths = set()
+    feet = set()
+    for _ in range(30):
+        game.update()
+        mouths.add(game.pacman.mouthOpen)
+        feet.update(ghost.feet for ghost in game.ghosts)
+    assert mouths == {False, True}
+    assert feet == {False, True}
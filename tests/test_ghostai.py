@@ -0,0 +1,42 @@
+import random
+
+from pacman.engine import Game
+from pacman.ghostai import GhostAI
+from pacman.simulate import randomController
+
+# One GhostAI steering several games at once has to play each of them like a GhostAI of its own
+
+
+# Positions of the ghosts and the score after every tick of the games of seeds, played turn about
+def trace(seeds, ais, ticks):
+    games = [Game(1, 0, rng=random.Random(seed), ai=ai) for seed, ai in zip(seeds, ais)]
+    controllers = [randomController(random.Random(seed)) for seed in seeds]
+    positions = [[] for _ in games]
+    for game in games:
+        game.start()
+    for _ in range(ticks):
+        for game, controller, seen in zip(games, controllers, positions):
+            if not game.running:
+                continue
+            if not game.started:
+                game.start()
+            newDir = controller(game)
+            if newDir is not None:
+                game.pacman.newDir = newDir
+            game.update()
+            seen.append([(ghost.y, ghost.x) for ghost in game.ghosts] + [game.score])
+    return positions
+
+def testSharedAIStepsGamesInLockstep():
+    shared = GhostAI(budget=2)
+    together = trace(range(3), [shared] * 3, 2000)
+    alone = [trace([seed], [GhostAI(budget=2)], 2000)[0] for seed in range(3)]
+    assert together == alone
+    assert shared.decisions > 0
+
+def testAIGhostsDrawNoRandomTargets():
+    game = Game(1, 0, rng=random.Random(3), ai=GhostAI())
+    state = game.rng.getstate()
+    for ghost in game.ghosts:
+        ghost.setTarget()
+    assert game.rng.getstate() == state
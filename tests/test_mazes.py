@@ -0,0 +1,62 @@
+import random
+
+from pacman import mazes
+from pacman.engine import Game
+from pacman.simulate import randomController
+
+# What a maze derives once, to save scanning its board, has to agree with scanning the board
+
+
+def scanPellets(cells):
+    dots = {cell for cell, tile in enumerate(cells) if tile == 2}
+    powerPellets = {cell for cell, tile in enumerate(cells) if tile in (5, 6)} # 5 and 6 are the two colours of a flashing one
+    return dots, powerPellets
+
+def testPelletIndexFollowsTheBoard():
+    layout = mazes.loadMaze()
+    assert (layout.pellets.dots, set(layout.pellets.powerPellets)) == scanPellets(layout.cells)
+    compiled = mazes.unpackLayout(layout.pack()).pellets
+    assert (compiled.dots, set(compiled.powerPellets)) == scanPellets(layout.cells)
+
+    game = Game(1, 0, rng=random.Random(7))
+    controller = randomController(random.Random(7))
+    game.start()
+    for _ in range(3000):
+        if not game.running:
+            break
+        if not game.started:
+            game.start()
+        newDir = controller(game)
+        if newDir is not None:
+            game.pacman.newDir = newDir
+        game.update()
+        dots, powerPellets = scanPellets(game.cells)
+        assert game.pellets.dots == dots
+        assert sorted(game.pellets.powerPellets) == sorted(powerPellets)
+        assert len(game.pellets) == game.total - game.collected
+    assert game.collected > 0
+    assert len(game.pellets.powerPellets) < len(layout.pellets.powerPellets)
+
+def testTargetPicksStayInTheirQuadrants():
+    layout = mazes.loadMaze()
+    targets = layout.targets
+    cols = layout.cols
+    cells = range(mazes.TARGET_ROWS * cols)
+    walkable = {cell for cell in cells if layout.cells[cell] not in (3, 4)} # Walls and the ghost house are left out
+    for quadrant, quadrantCells in enumerate(targets.quadrants):
+        assert {mazes.targetQuadrant(cell // cols, cell % cols) for cell in quadrantCells} == {quadrant}
+        assert set(quadrantCells[:targets.walkable[quadrant]]) <= walkable
+    rng = random.Random(0)
+    for empty in range(4):
+        # Only the quadrant no ghost is heading for offers its walls as well
+        counts = [0 if quadrant == empty else 1 for quadrant in range(4)]
+        picked = set()
+        for _ in range(40000):
+            row, col = targets.pick(rng, counts)
+            cell = row * cols + col
+            assert cell in walkable or mazes.targetQuadrant(row, col) == empty
+            picked.add(cell)
+        assert picked == walkable | {cell for cell in cells if mazes.targetQuadrant(cell // cols, cell % cols) == empty}
+
+    picked = {targets.pick(rng, [1, 1, 1, 1]) for _ in range(40000)}
+    assert {row * cols + col for row, col in picked} == walkable # Every open tile can be drawn
@@ -0,0 +1,69 @@
+from collections import deque
+
+from pacman import mazes
+from pacman.navigation import DIRS, UNREACHABLE, NavigationTable
+
+# Navigation tables have to agree with a plain breadth first search of the board
+
+# Tunnel on row 2, a gate on row 3 and a pocket on row 5 that nothing can reach
+SMALL = [
+    "#######",
+    "#..#..#",
+    " .###. ",
+    "#..-..#",
+    "#######",
+    "#.#####",
+    "#######",
+]
+
+
+def parse(rows):
+    return [[3 if char in "#-" else 2 for char in row] for row in rows]
+
+def walkable(board, gates, row, col):
+    return 0 <= row < len(board) and (board[row][col] != 3 or [row, col] in gates)
+
+def search(board, gates, start):
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        row, col = queue.popleft()
+        for step in DIRS:
+            neighbour = (row + step[0], (col + step[1]) % len(board[0]))
+            if neighbour not in distances and walkable(board, gates, neighbour[0], neighbour[1]):
+                distances[neighbour] = distances[(row, col)] + 1
+                queue.append(neighbour)
+    return distances
+
+# Compares the table with a search from each of sources, every walkable tile by default
+def checkTable(board, gates, sources=None):
+    table = NavigationTable(board, gates)
+    table.build()
+    tiles = [(row, col) for row in range(len(board)) for col in range(len(board[0])) if walkable(board, gates, row, col)]
+    assert sorted(table.tiles) == tiles
+    for source in tiles if sources is None else sources:
+        distances = search(board, gates, source)
+        for target in tiles:
+            expected = distances.get(target, UNREACHABLE)
+            assert table.distance(source[0], source[1], target[0], target[1]) == expected
+            direction = table.nextDir(source[0], source[1], target[0], target[1])
+            if expected in (0, UNREACHABLE):
+                assert direction == -1
+            else: # The first step is on a shortest path
+                step = DIRS[direction]
+                row, col = source[0] + step[0], (source[1] + step[1]) % len(board[0])
+                assert table.distance(row, col, target[0], target[1]) == expected - 1
+    assert table.distance(0, 0, 1, 1) == -1 # Walls have no distance
+    return table
+
+def testSmallMazeMatchesSearch():
+    board = parse(SMALL)
+    gates = [[3, 3]]
+    table = checkTable(board, gates)
+    assert table.distance(2, 0, 2, 6) == 1 # Through the tunnel
+    assert table.distance(3, 2, 3, 4) == 2 # Through the gate
+    assert table.distance(5, 1, 1, 1) == UNREACHABLE
+
+def testClassicMazeMatchesSearch():
+    layout = mazes.loadMaze()
+    checkTable(layout.board, layout.gates, [(26, 13), (4, 1), (17, 0), (15, 13), (32, 26)])
@@ -0,0 +1,54 @@
+import random
+
+from pacman import mazes, replay
+from pacman.engine import Game
+from pacman.ghostai import GhostAI
+
+# A recorded game has to play back to the same score, on the maze and with the ghosts it was played with
+
+
+def recordGame(fileName, layout, ai=None, ticks=3000):
+    seed = 7
+    game = Game(1, 0, rng=random.Random(seed), layout=layout, ai=ai)
+    recorder = replay.Recorder(game, seed)
+    keys = random.Random(seed)
+    recorder.press()
+    while recorder.ticks < ticks and game.running:
+        if not game.started:
+            recorder.press()
+        if recorder.ticks % 15 == 0:
+            recorder.press(keys.randrange(4))
+        recorder.update()
+    recorder.save(fileName)
+    return game
+
+def variantMaze(folder):
+    with open(mazes.CLASSIC, encoding="utf-8") as file:
+        text = file.read()
+    fileName = str(folder / "variant.maze")
+    with open(fileName, "w", encoding="utf-8") as file:
+        file.write(text.replace("pacman: 23 13.5", "pacman: 5 1").replace("ghost: orange 14 15.5\n", ""))
+    return mazes.loadMaze(fileName, cacheDir=str(folder))
+
+def testReplayOnClassicMaze(tmp_path):
+    fileName = str(tmp_path / "classic.replay")
+    game = recordGame(fileName, mazes.loadMaze())
+    seed, ticks, score, layout, ai, events = replay.load(fileName)
+    assert layout is game.layout
+    assert ai is None
+    assert replay.play(seed, ticks, events, layout=layout, ai=ai).score == score == game.score
+
+def testReplayOnOtherMaze(tmp_path):
+    fileName = str(tmp_path / "variant.replay")
+    game = recordGame(fileName, variantMaze(tmp_path))
+    seed, ticks, score, layout, ai, events = replay.load(fileName)
+    assert layout is game.layout
+    assert ai is None
+    assert replay.play(seed, ticks, events, layout=layout, ai=ai).score == score == game.score
+
+def testReplayWithGhostAI(tmp_path):
+    fileName = str(tmp_path / "ghosts.replay")
+    game = recordGame(fileName, mazes.loadMaze(), GhostAI(budget=2))
+    seed, ticks, score, layout, ai, events = replay.load(fileName)
+    assert ai.budget == 2
+    assert replay.play(seed, ticks, events, layout=layout, ai=ai).score == score == game.score
@@ -0,0 +1,61 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from pacman import scores
+from pacman.scores import RECORD, ScoreStore, loadIndex, packIndex, topScores
+
+# Scores have to survive a crash at any point of a write, and the index has to follow the history
+
+
+def played(score, level, berries=0):
+    return SimpleNamespace(highScore=score, score=score, level=level, berriesCollected=[0] * berries)
+
+def recordGames(folder, games):
+    store = ScoreStore(str(folder))
+    for seed, game in enumerate(games):
+        store.recordGame(game, seed)
+    store.close()
+    return store
+
+def testAtomicWriteKeepsOldFileWhenRenameFails(tmp_path, monkeypatch):
+    fileName = str(tmp_path / "HighScore.txt")
+    scores.writeAtomic(fileName, b"100")
+
+    def crash(source, target):
+        raise OSError("crashed")
+    monkeypatch.setattr(scores.os, "replace", crash)
+    with pytest.raises(OSError):
+        scores.writeAtomic(fileName, b"200")
+    monkeypatch.undo()
+    assert scores.readHighScore(fileName) == 100
+    scores.writeAtomic(fileName, b"300") # A temporary file left by the crash is simply written over
+    assert scores.readHighScore(fileName) == 300
+    assert os.listdir(tmp_path) == ["HighScore.txt"]
+
+def testIndexIsRebuiltWhenMissingOrBehind(tmp_path):
+    recordGames(tmp_path, [played(500, 1), played(900, 1), played(700, 2)])
+    historyFile = str(tmp_path / "ScoreHistory.bin")
+    indexFile = str(tmp_path / "ScoreHistory.idx")
+    index, records = loadIndex(historyFile, indexFile)
+    assert records == 3
+    assert index == {1: [(900, 1), (500, 0)], 2: [(700, 2)]}
+
+    os.remove(indexFile)
+    assert loadIndex(historyFile, indexFile) == (index, 3)
+    scores.writeAtomic(indexFile, packIndex({1: [(500, 0)]}, 1)) # Written before the last two games
+    assert loadIndex(historyFile, indexFile) == (index, 3)
+
+def testTornRecordIsDroppedOnNextGame(tmp_path):
+    recordGames(tmp_path, [played(500, 1)])
+    historyFile = str(tmp_path / "ScoreHistory.bin")
+    with open(historyFile, "ab") as file:
+        file.write(RECORD.pack(0, 99, 9999, 1, 0)[:RECORD.size // 2]) # The game crashed half way through a record
+    assert [score for _, _, score, _, _ in topScores(1, folder=str(tmp_path))] == [500]
+
+    recordGames(tmp_path, [played(800, 1, berries=2)])
+    assert os.path.getsize(historyFile) == 2 * RECORD.size
+    best = topScores(1, folder=str(tmp_path))
+    assert [(seed, score, level, berries) for _, seed, score, level, berries in best] == [(0, 800, 1, 2), (0, 500, 1, 0)]
+    assert scores.readHighScore(str(tmp_path / "HighScore.txt")) == 800
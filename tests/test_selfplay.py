@@ -0,0 +1,48 @@
+import sys
+from array import array
+
+import pytest
+
+from pacman import selfplay
+from pacman.selfplay import COLUMNS, ResultWriter, loadColumns, playChunk
+
+# A run killed part way through writing its columns has to resume to the rows of a run that never stopped
+
+SETTINGS = ["--seed", "5", "--max-ticks", "300", "--controller", "random", "--workers", "1"]
+
+
+def run(monkeypatch, folder, games, settings=SETTINGS):
+    monkeypatch.setattr(sys, "argv", ["selfplay", "--games", str(games), "--output", str(folder)] + settings)
+    selfplay.main()
+
+def rows(folder):
+    columns = loadColumns(str(folder))
+    return sorted(zip(*(columns[name] for name, _ in COLUMNS)))
+
+def testResumeAfterTornWrite(tmp_path, monkeypatch):
+    run(monkeypatch, tmp_path / "whole", 20)
+
+    folder = str(tmp_path / "killed")
+    writer = ResultWriter(folder, {"seed": 5, "maxTicks": 300, "controller": "random"})
+    writer.write(playChunk(range(8), 5, "random", 300))
+    # Killed while writing the next row: the first columns made it, the next one only in part
+    row = playChunk([8], 5, "random", 300)[0]
+    for column, ((_, typecode), file) in enumerate(zip(COLUMNS, writer.files)):
+        data = array(typecode, [row[column]]).tobytes()
+        if column == 3:
+            file.write(data[:1])
+            break
+        file.write(data)
+    writer.close()
+    assert len(loadColumns(folder)["game"]) == 8
+
+    run(monkeypatch, folder, 20)
+    assert rows(folder) == rows(tmp_path / "whole")
+    for name, typecode in COLUMNS: # The torn row was cut off rather than left in between
+        assert (tmp_path / "killed" / (name + ".col")).stat().st_size == 20 * array(typecode).itemsize
+
+def testRefusesOtherSettings(tmp_path, monkeypatch):
+    run(monkeypatch, tmp_path, 2)
+    with pytest.raises(SystemExit):
+        run(monkeypatch, tmp_path, 2, ["--seed", "6", "--max-ticks", "300", "--workers", "1"])
+    assert len(loadColumns(str(tmp_path))["game"]) == 2